@@ -0,0 +1,73 @@
+"""OpenBNW benchmarks - times domain hot paths and the wave loop, and compares runs."""
+
+import argparse
+import fnmatch
+import os
+import sys
+
+# Setup Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+
+from benchmarks import CASES, compare_results, load_results, run_case, save_results
+
+DEFAULT_SIZES = [5, 50, 200, 1000]
+
+
+def print_comparison(baseline_path: str, current_path: str, threshold: float) -> int:
+    """Print a comparison table and return the number of regressions."""
+    rows = compare_results(load_results(baseline_path), load_results(current_path), threshold)
+    regressions = 0
+    for key, ratio, regressed in rows:
+        regressions += regressed
+        print(f"{key:<40} {ratio:6.2f}x p50  {'REGRESSION' if regressed else 'ok'}")
+    print(f"{regressions} regression(s) beyond {threshold:.0%} in {len(rows)} shared result(s)")
+    return regressions
+
+
+def run(args) -> int:
+    results = []
+    for name, case in CASES.items():
+        if args.cases and not any(fnmatch.fnmatch(name, pattern) for pattern in args.cases):
+            continue
+        for size in args.sizes:
+            result = run_case(name, case, size, args.calls)
+            print(result)
+            results.append(result)
+
+    save_results(args.output, results)
+    print(f"saved {len(results)} result(s) to {args.output}")
+
+    if args.baseline:
+        return 1 if print_comparison(args.baseline, args.output, args.threshold) else 0
+    return 0
+
+
+def compare(args) -> int:
+    return 1 if print_comparison(args.baseline, args.current, args.threshold) else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run OpenBNW benchmarks or compare saved results.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run benchmarks and save results as JSON")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="wave sizes to run")
+    run_parser.add_argument("--calls", type=int, default=500, help="timed calls per case and size")
+    run_parser.add_argument("--cases", nargs="+", default=None, help="case name patterns (e.g. 'game_service.*')")
+    run_parser.add_argument("--output", default="benchmark_results.json", help="results file")
+    run_parser.add_argument("--baseline", default=None, help="compare against this results file when done")
+    run_parser.add_argument("--threshold", type=float, default=0.10, help="allowed p50 slowdown (default: 0.10)")
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser("compare", help="flag regressions between two results files")
+    compare_parser.add_argument("baseline", help="baseline results file")
+    compare_parser.add_argument("current", help="current results file")
+    compare_parser.add_argument("--threshold", type=float, default=0.10, help="allowed p50 slowdown (default: 0.10)")
+    compare_parser.set_defaults(handler=compare)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
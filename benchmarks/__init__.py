@@ -0,0 +1,6 @@
+"""Headless benchmarks for the wave loop and domain hot paths."""
+
+from .harness import BenchmarkResult, compare_results, load_results, run_case, save_results
+from .cases import CASES
+
+__all__ = ["BenchmarkResult", "CASES", "compare_results", "load_results", "run_case", "save_results"]
@@ -0,0 +1,245 @@
+"""Benchmark cases - each builds fresh state for a wave size."""
+
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+from config.game_config import GameConfig
+from domain.arena import ArenaGeometry
+from domain.clock import GameClock
+from domain.entities import AILevelOfDetail, Enemy, EnemySwarm, Player, Weapon
+from domain.navigation import FlowField
+from domain.spatial import SpatialHashGrid
+from domain.wave_system import WaveManager
+from application.services import GameService
+from application.simulation.headless_runner import HeadlessPlayerBody
+from application.snapshot import PlayerBodyState, load_game, save_game
+
+SEED = 1234
+DELTA_TIME = 1 / 60
+
+
+def _arena_geometry() -> ArenaGeometry:
+    """The configured arena, cover included (placed with SEED when no arena seed is configured)."""
+    return ArenaGeometry.build_square(
+        GameConfig.ARENA_SIZE,
+        GameConfig.ARENA_WALL_HEIGHT,
+        wall_thickness=1,
+        cover_count=GameConfig.ARENA_COVER_COUNT,
+        cover_size=GameConfig.ARENA_COVER_SIZE,
+        cover_height=GameConfig.ARENA_COVER_HEIGHT,
+        cover_gap=GameConfig.ARENA_COVER_GAP,
+        clear_radius=GameConfig.ARENA_COVER_CLEAR_RADIUS,
+        seed=SEED if GameConfig.ARENA_SEED is None else GameConfig.ARENA_SEED,
+    )
+
+
+def _wave_manager(size: int, arena_geometry: Optional[ArenaGeometry] = None) -> WaveManager:
+    """Wave manager whose every wave has exactly size enemies, all alive at once."""
+    return WaveManager(
+        size,
+        0,
+        GameConfig.BASE_ENEMY_SPEED,
+        GameConfig.ENEMY_SPEED_INCREMENT,
+        GameConfig.ENEMY_MAX_HEALTH,
+        GameConfig.ARENA_SIZE,
+        GameConfig.SPAWN_MARGIN,
+        GameConfig.PLAYER_DISTANCE_MIN,
+        GameConfig.SPATIAL_CELL_SIZE,
+        GameConfig.ENEMY_SPAWN_SPACING,
+        SEED,
+        geometry=arena_geometry,
+    )
+
+
+def _flow_field(geometry: Optional[ArenaGeometry] = None) -> FlowField:
+    """Flow field over the given arena (default: walls only)."""
+    if geometry is None:
+        geometry = ArenaGeometry.build_square(GameConfig.ARENA_SIZE, GameConfig.ARENA_WALL_HEIGHT, wall_thickness=1)
+    return FlowField(geometry, GameConfig.NAV_CELL_SIZE, GameConfig.ENEMY_WIDTH / 2, GameConfig.ENEMY_HEIGHT)
+
+
+def _lod() -> AILevelOfDetail:
+    """AI level of detail with the configured distances and intervals."""
+    return AILevelOfDetail(
+        GameConfig.AI_LOD_NEAR_DISTANCE,
+        GameConfig.AI_LOD_FAR_DISTANCE,
+        GameConfig.AI_LOD_MID_INTERVAL,
+        GameConfig.AI_LOD_FAR_INTERVAL,
+        GameConfig.AI_LOD_MIN_ENEMIES,
+    )
+
+
+def _game_service(size: int, weapon_damage: int = GameConfig.WEAPON_DAMAGE) -> GameService:
+    """
+    Game service with a wave of size enemies already spawned around an unkillable player.
+
+    Navigation, separation and AI level of detail follow GameConfig, as in
+    simulate.create_game_service; only the wave size, spawn budget and
+    alive cap differ, so the whole wave is on the field from the first tick.
+    """
+    clock = GameClock()
+    arena_geometry = _arena_geometry()
+    game_service = GameService(
+        Player(10**9),
+        Weapon(GameConfig.WEAPON_FIRE_RATE, weapon_damage, GameConfig.WEAPON_RANGE, clock),
+        _wave_manager(size, arena_geometry),
+        GameConfig.WAVE_CLEAR_DELAY,
+        0.0,
+        GameConfig.ENEMY_DAMAGE,
+        GameConfig.ENEMY_ATTACK_COOLDOWN,
+        GameConfig.ENEMY_CONTACT_DISTANCE,
+        clock,
+        ai_lod=_lod() if GameConfig.AI_LOD_ENABLED else None,
+        flow_field=_flow_field(arena_geometry) if GameConfig.NAV_FLOW_FIELD else None,
+        enemy_separation_radius=GameConfig.ENEMY_SEPARATION_RADIUS,
+        enemy_separation_weight=GameConfig.ENEMY_SEPARATION_WEIGHT,
+    )
+    game_service.player_renderer = HeadlessPlayerBody()
+    game_service.start_game()
+    game_service.update(0.0)  # zero start delay: spawns the first wave
+    return game_service
+
+
+def spawn_wave(size: int):
+    """WaveManager.spawn_wave for one wave; the swarm is emptied untimed after each call."""
+    wave_manager = _wave_manager(size)
+    return (lambda: wave_manager.spawn_wave(1)), wave_manager.swarm.clear
+
+
+def generate_spawn_positions(size: int):
+    """Enemy.generate_spawn_position for a whole wave's worth of enemies."""
+    rng = np.random.default_rng(SEED)
+
+    def call():
+        for _ in range(size):
+            Enemy.generate_spawn_position(
+                GameConfig.ARENA_SIZE, rng, GameConfig.SPAWN_MARGIN, (0, 0, 0), GameConfig.PLAYER_DISTANCE_MIN
+            )
+
+    return call, None
+
+
+def wave_spawn_positions(size: int):
+    """WaveManager.generate_spawn_positions for a whole wave at once."""
+    wave_manager = _wave_manager(size)
+    return (lambda: wave_manager.generate_spawn_positions(size)), None
+
+
+def game_service_update(size: int):
+    """One GameService.update tick with size enemies chasing the player."""
+    game_service = _game_service(size)
+    return (lambda: game_service.update(DELTA_TIME)), None
+
+
+def handle_enemy_hit(size: int):
+    """GameService.handle_enemy_hit killing a random live enemy; the wave respawns untimed once empty."""
+    game_service = _game_service(size, weapon_damage=GameConfig.ENEMY_MAX_HEALTH)
+    rng = np.random.default_rng(SEED)
+
+    def call():
+        game_service.handle_enemy_hit(game_service.enemies.items[rng.integers(len(game_service.enemies))])
+
+    def reset():
+        if not game_service.enemies:
+            game_service._start_next_wave()
+
+    return call, reset
+
+
+def enemy_movement(
+    size: int,
+    lod: Optional[AILevelOfDetail] = None,
+    flow_field: Optional[FlowField] = None,
+    separation_radius: float = 0.0,
+):
+    """EnemySwarm.step (chase, facing, contact, attacks) for size enemies."""
+    rng = np.random.default_rng(SEED)
+    swarm = EnemySwarm(grid=SpatialHashGrid(GameConfig.ARENA_SIZE, GameConfig.SPATIAL_CELL_SIZE))
+    for _ in range(size):
+        position = Enemy.generate_spawn_position(
+            GameConfig.ARENA_SIZE, rng, GameConfig.SPAWN_MARGIN, (0, 0, 0), GameConfig.PLAYER_DISTANCE_MIN
+        )
+        swarm.spawn(position, GameConfig.BASE_ENEMY_SPEED, GameConfig.ENEMY_MAX_HEALTH)
+    clock = GameClock()
+
+    def call():
+        clock.step(DELTA_TIME)
+        swarm.step(
+            (0, 0, 0),
+            DELTA_TIME,
+            clock.now(),
+            GameConfig.ENEMY_ATTACK_COOLDOWN,
+            GameConfig.ENEMY_CONTACT_DISTANCE,
+            lod,
+            flow_field,
+            separation_radius,
+            GameConfig.ENEMY_SEPARATION_WEIGHT,
+        )
+
+    return call, None
+
+
+def enemy_movement_lod(size: int):
+    """EnemySwarm.step with the configured AI level of detail."""
+    return enemy_movement(size, _lod())
+
+
+def enemy_movement_flow(size: int):
+    """EnemySwarm.step steering through a flow field toward a stationary player."""
+    flow_field = _flow_field()
+    flow_field.update(0.0, 0.0)
+    return enemy_movement(size, flow_field=flow_field)
+
+
+def enemy_movement_separation(size: int):
+    """EnemySwarm.step with separation, crowding in on a stationary player."""
+    return enemy_movement(size, separation_radius=GameConfig.ENEMY_SEPARATION_RADIUS)
+
+
+def enemy_movement_separation_lod(size: int):
+    """EnemySwarm.step with separation, searched only for the rows the AI level of detail re-aims."""
+    return enemy_movement(size, _lod(), separation_radius=GameConfig.ENEMY_SEPARATION_RADIUS)
+
+
+def flow_field_rebuild(size: int):
+    """FlowField.update with the target entering a new cell every call; cost does not depend on size."""
+    flow_field = _flow_field()
+    targets = [(0.0, 0.0), (GameConfig.NAV_CELL_SIZE, 0.0)]
+    calls = [0]
+
+    def call():
+        calls[0] += 1
+        flow_field.update(*targets[calls[0] % 2])
+
+    return call, None
+
+
+def snapshot_save(size: int):
+    """save_game with a wave of size enemies alive."""
+    game_service = _game_service(size)
+    return (lambda: save_game(game_service, PlayerBodyState())), None
+
+
+def snapshot_load(size: int):
+    """load_game of a size-enemy snapshot over a game that already has size enemies alive."""
+    game_service = _game_service(size)
+    data = save_game(game_service, PlayerBodyState())
+    return (lambda: load_game(game_service, data)), None
+
+
+CASES: Dict[str, Callable] = {
+    "wave_manager.spawn_wave": spawn_wave,
+    "enemy.generate_spawn_position": generate_spawn_positions,
+    "wave_manager.generate_spawn_positions": wave_spawn_positions,
+    "game_service.update": game_service_update,
+    "game_service.handle_enemy_hit": handle_enemy_hit,
+    "enemy_swarm.step": enemy_movement,
+    "enemy_swarm.step_lod": enemy_movement_lod,
+    "enemy_swarm.step_flow": enemy_movement_flow,
+    "enemy_swarm.step_separation": enemy_movement_separation,
+    "enemy_swarm.step_separation_lod": enemy_movement_separation_lod,
+    "flow_field.update": flow_field_rebuild,
+    "game_snapshot.save": snapshot_save,
+    "game_snapshot.load": snapshot_load,
+}
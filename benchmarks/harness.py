@@ -0,0 +1,183 @@
+"""Benchmark timing, memory measurement and result storage."""
+
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# A case builds fresh state for a wave size and returns (call, reset).
+# call() is the timed operation; reset(), if given, runs untimed after every call.
+Case = Callable[[int], Tuple[Callable[[], None], Optional[Callable[[], None]]]]
+
+
+class BenchmarkResult:
+    """Timing and memory figures of one case at one wave size."""
+
+    def __init__(
+        self,
+        case: str,
+        size: int,
+        calls: int,
+        seconds: float,
+        p50_us: float,
+        p95_us: float,
+        p99_us: float,
+        peak_memory_kb: float,
+    ):
+        self.case = case
+        self.size = size
+        self.calls = calls
+        self.seconds = seconds
+        self.p50_us = p50_us
+        self.p95_us = p95_us
+        self.p99_us = p99_us
+        self.peak_memory_kb = peak_memory_kb
+
+    @property
+    def key(self) -> str:
+        """Identifier used to match results across runs."""
+        return f"{self.case}[{self.size}]"
+
+    @property
+    def calls_per_second(self) -> float:
+        """Timed calls (ticks for update cases) per second."""
+        return self.calls / self.seconds if self.seconds > 0 else float("inf")
+
+    def to_dict(self) -> dict:
+        return {
+            "case": self.case,
+            "size": self.size,
+            "calls": self.calls,
+            "seconds": self.seconds,
+            "calls_per_second": self.calls_per_second,
+            "p50_us": self.p50_us,
+            "p95_us": self.p95_us,
+            "p99_us": self.p99_us,
+            "peak_memory_kb": self.peak_memory_kb,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BenchmarkResult":
+        return cls(
+            data["case"],
+            data["size"],
+            data["calls"],
+            data["seconds"],
+            data["p50_us"],
+            data["p95_us"],
+            data["p99_us"],
+            data["peak_memory_kb"],
+        )
+
+    def __str__(self) -> str:
+        return (
+            f"{self.key:<40} {self.calls_per_second:>11.0f}/s  p50 {self.p50_us:>9.1f} us  "
+            f"p95 {self.p95_us:>9.1f} us  p99 {self.p99_us:>9.1f} us  peak {self.peak_memory_kb:>8.1f} KiB"
+        )
+
+
+def run_case(name: str, case: Case, size: int, calls: int) -> BenchmarkResult:
+    """
+    Time a case call by call, then measure its peak memory in a separate pass.
+
+    Memory is traced in its own pass because tracemalloc slows every allocation.
+
+    Args:
+        name: Case name
+        case: Case factory
+        size: Wave size
+        calls: Number of timed calls
+
+    Returns:
+        BenchmarkResult
+    """
+    call, reset = case(size)
+    latencies = np.empty(calls, dtype=np.int64)
+    for index in range(calls):
+        start = time.perf_counter_ns()
+        call()
+        latencies[index] = time.perf_counter_ns() - start
+        if reset:
+            reset()
+
+    tracemalloc.start()
+    try:
+        call, reset = case(size)
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for _ in range(min(calls, 100)):
+            call()
+            if reset:
+                reset()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) / 1000
+    return BenchmarkResult(name, size, calls, latencies.sum() / 1e9, p50, p95, p99, (peak - baseline) / 1024)
+
+
+def save_results(path: str, results: List[BenchmarkResult]) -> None:
+    """
+    Write results with environment metadata as JSON.
+
+    Args:
+        path: Output file
+        results: Benchmark results
+    """
+    data = {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "results": [result.to_dict() for result in results],
+    }
+    with open(path, "w") as file:
+        json.dump(data, file, indent=2)
+
+
+def load_results(path: str) -> Dict[str, BenchmarkResult]:
+    """
+    Read results written by save_results.
+
+    Args:
+        path: Results file
+
+    Returns:
+        Dict of result key -> BenchmarkResult
+    """
+    with open(path) as file:
+        data = json.load(file)
+    results = [BenchmarkResult.from_dict(entry) for entry in data["results"]]
+    return {result.key: result for result in results}
+
+
+def compare_results(
+    baseline: Dict[str, BenchmarkResult], current: Dict[str, BenchmarkResult], threshold: float
+) -> List[Tuple[str, float, bool]]:
+    """
+    Compare median latencies of results present in both runs.
+
+    Args:
+        baseline: Results to hold current against
+        current: New results
+        threshold: Allowed relative slowdown (0.1 = 10%)
+
+    Returns:
+        (key, current p50 / baseline p50, regressed) for every shared key
+    """
+    rows = []
+    for key, result in current.items():
+        reference = baseline.get(key)
+        if reference is None or reference.p50_us <= 0:
+            continue
+        ratio = result.p50_us / reference.p50_us
+        rows.append((key, ratio, ratio > 1 + threshold))
+    return rows
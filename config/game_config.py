@@ -1,7 +1,5 @@
 """Centralized game configuration constants."""
 
-from ursina import color
-
 
 class GameConfig:
     """All game constants in one place."""
@@ -11,11 +9,24 @@ class GameConfig:
     NAME = "OpenBNW"
     DEVELOPMENT = False  # Toggle development mode features
 
+    # Game clock
+    MAX_FRAME_TIME = 0.25  # longest frame (seconds) counted toward game time; longer hitches are clamped
+    TIME_SCALE_STEP = 2.0  # multiplier applied by the development speed-up/slow-down keys
+    SIM_RATE = 60  # fixed simulation steps per game second, independent of frame rate
+    SIM_MAX_STEPS = 8  # most simulation steps per frame; game time beyond that is dropped
+    SIM_WORKER = False  # run enemies and waves in a separate process (sim_worker.py), drawn from shared memory
+    SIM_WORKER_CAPACITY = 4096  # most enemies the shared state publishes
+    SIM_WORKER_COMMAND_SLOTS = 256  # pending input commands the worker queue holds
+    REPLAY_RECORD_PATH = None  # write every tick's input here for replay.py (None = off; ignored with SIM_WORKER)
+    SNAPSHOT_PATH = "openbnw.save"  # game state saved at each wave start, loaded by `main.py --resume` (None = off)
+
     # Player settings
     PLAYER_MAX_HEALTH = 100
     PLAYER_SPEED = 8
     PLAYER_JUMP_HEIGHT = 8
     PLAYER_MOUSE_SENSITIVITY = (90, 90)
+    PLAYER_COLLISION_MODE = "analytic"  # "analytic" (static arena geometry) or "raycast" (scene raycasts)
+    PLAYER_COLLISION_RADIUS = 0.7
 
     # Weapon settings
     WEAPON_FIRE_RATE = 0.15  # seconds between shots
@@ -26,27 +37,98 @@ class GameConfig:
     BASE_ENEMY_SPEED = 5.0
     ENEMY_SPEED_INCREMENT = 0.5  # per wave
     ENEMY_MAX_HEALTH = 60
+    ENEMY_WIDTH = 1.0  # bounding box width (x and z), used for rendering and hitscan
+    ENEMY_HEIGHT = 2.5  # bounding box height
     ENEMY_DAMAGE = 20  # damage to player on contact
     ENEMY_ATTACK_COOLDOWN = 1.0  # seconds between attacks
+    ENEMY_CONTACT_DISTANCE = 1.0  # XZ distance at which an enemy touches the player
+    ENEMY_SEPARATION_RADIUS = 1.5  # enemies closer than this push each other apart (0 lets them stack)
+    ENEMY_SEPARATION_WEIGHT = 3.0  # push strength relative to the chase when two enemies fully overlap
 
     # Wave system
     BASE_ENEMY_COUNT = 5
     ENEMY_COUNT_INCREMENT = 3  # additional enemies per wave
     WAVE_START_DELAY = 3.0  # seconds before first wave
     WAVE_CLEAR_DELAY = 3.0  # seconds after wave cleared before next
+    WAVE_MAX_ALIVE = 150  # enemies alive at once; the rest of a wave streams in as others die (None = no cap)
+    WAVE_SPAWN_BUDGET = 1  # enemies spawned per simulation step at most, so SIM_MAX_STEPS per frame (None = no limit)
 
     # Spawning
     SPAWN_MARGIN = 2.0
     PLAYER_DISTANCE_MIN = 8.0
+    ENEMY_SPAWN_SPACING = 1.5  # minimum distance between enemies spawned in the same wave
+    SPAWN_SEED = None  # seed for spawn placement (None picks a new layout every game)
+
+    # Enemy AI level of detail
+    AI_LOD_ENABLED = False  # thin out distant enemies' AI; off while WAVE_MAX_ALIVE is below AI_LOD_MIN_ENEMIES
+    AI_LOD_NEAR_DISTANCE = 12.0  # enemies closer than this re-aim and attack every frame
+    AI_LOD_FAR_DISTANCE = 30.0  # enemies this far or farther only coast along their heading between re-aims
+    AI_LOD_MID_INTERVAL = 4  # frames between re-aims of a mid-range enemy
+    AI_LOD_FAR_INTERVAL = 8  # frames between re-aims of a far enemy
+    AI_LOD_MIN_ENEMIES = 1000  # below this many enemies every one re-aims every frame (scheduling costs more)
+
+    # Enemy navigation
+    NAV_FLOW_FIELD = True  # steer enemies around static arena geometry (False walks straight at the player)
+    NAV_CELL_SIZE = 2.0  # flow field cell size; the field is rebuilt whenever the player enters a new cell
+
+    # Enemy rendering
+    ENEMY_RENDER_MODE = "instanced"  # "instanced" (one draw for all bodies, one for all health bars) or "entities"
+
+    # Enemy entity pool ("entities" render mode)
+    ENEMY_POOL_PREALLOCATE = 32  # parked enemy entities created at startup
+    ENEMY_POOL_MAX_IDLE = None  # parked entities kept after a restart (None keeps the high-water mark)
+
+    # Sound effects
+    SFX_VOICES = 4  # voices per effect; the oldest playing voice is stolen when all are busy
+    SFX_PITCH_VARIANTS = 4  # pre-rendered pitch variants per effect, spread over its pitch range
+
+    # Graphics quality (presets from cheapest to best; lighting: "shadowed", "lit" or "unlit" per entity group)
+    QUALITY_PRESETS = {
+        "low": {
+            "shadow_map_size": 0,  # 0 turns shadows off
+            "lighting": {"arena": "lit", "player": "unlit", "enemies": "lit"},
+            "shadow_casters": (),
+        },
+        "medium": {
+            "shadow_map_size": 512,
+            "lighting": {"arena": "shadowed", "player": "lit", "enemies": "lit"},
+            "shadow_casters": ("enemies",),
+        },
+        "high": {
+            "shadow_map_size": 1024,
+            "lighting": {"arena": "shadowed", "player": "shadowed", "enemies": "shadowed"},
+            "shadow_casters": ("arena", "player", "enemies"),
+        },
+    }
+    QUALITY_PRESET = "high"  # starting preset, also the highest the governor steps back up to
+    QUALITY_GOVERNOR = True  # step presets down when frames are slow and back up when they recover
+    QUALITY_DOWNGRADE_MS = 22.0  # average frame time that steps quality down (~45 fps)
+    QUALITY_UPGRADE_MS = 17.5  # average frame time that steps quality up; above 16.7 so vsynced 60 fps qualifies
+    QUALITY_GOVERNOR_WINDOW = 2.0  # seconds of frames averaged per decision
+    QUALITY_GOVERNOR_COOLDOWN = 4.0  # seconds after a change before the next (doubles after a failed upgrade)
+
+    # Profiling
+    PROFILER_ENABLED = DEVELOPMENT  # scoped timers, in-game overlay (F3 toggles, F4 exports a trace)
+    PROFILER_HISTORY = 120  # frames averaged by the overlay
+    PROFILER_TRACE_EVENTS = 200_000  # most recent scope events kept for Chrome trace export
+    PROFILER_TRACE_PATH = "openbnw_trace.json"
+    PROFILER_PSTATS = False  # also mirror scopes to Panda3D PStats and connect to a running pstats server
 
     # Arena
     ARENA_SIZE = 64
     ARENA_WALL_HEIGHT = 3
+    ARENA_COVER_COUNT = 0  # interior cover boxes (0 = open arena)
+    ARENA_COVER_SIZE = 3.0  # largest cover footprint edge; the smallest is half of it
+    ARENA_COVER_HEIGHT = 2.0
+    ARENA_COVER_GAP = 3.0  # minimum free space between cover boxes and walls
+    ARENA_COVER_CLEAR_RADIUS = 8.0  # no cover this close to the player spawn
+    ARENA_SEED = 7  # seed for the cover layout (None picks a new layout every launch)
+    SPATIAL_CELL_SIZE = 2.0  # grid cell size for enemy proximity queries
 
-    # Visual settings
-    ENEMY_COLOR = color.light_gray
-    GUN_COLOR = color.red
-    MUZZLE_FLASH_COLOR = color.yellow
+    # Visual settings (Ursina color names, resolved by the infrastructure layer)
+    ENEMY_COLOR = "light_gray"
+    GUN_COLOR = "red"
+    MUZZLE_FLASH_COLOR = "yellow"
 
     GROUND_TEXTURE = "grass"
     WALL_TEXTURE = "brick"
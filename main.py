@@ -1,73 +1,209 @@
 """OpenBNW"""
 
 from ursina import *
-from ursina.shaders import lit_with_shadows_shader
+from ursina.shaders import unlit_shader
+from functools import partial
+from typing import Optional
+import random
 import sys
 import os
+import atexit
 
 # Setup Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
 
 # Domain layer
 from config.game_config import GameConfig
-from src.domain.entities import Player, Weapon
+from src.domain.entities import Player, Weapon, AILevelOfDetail
+from src.domain.arena import ArenaGeometry
+from src.domain.navigation import FlowField
 from src.domain.wave_system import WaveManager
+from src.domain.clock import GameClock, FixedTimestep
+from src.domain.combat import HitscanResolver
 
 # Application layer
 from src.application.services import GameService
 from src.application.input import InputHandler
+from src.application.profiling import FrameProfiler
+from src.application.quality import QualityGovernor
+from src.application.worker import RemoteGameService, RemoteClock, CommandRing
+from src.application.replay import Button, InputRecorder, InputRecording
+from src.application.snapshot import PlayerBodyState, save_game, load_game, save_game_file, load_game_file
 
 # Infrastructure layer
-from src.infrastructure.rendering import PlayerRenderer, HUDRenderer, ArenaRenderer
+from src.infrastructure.rendering import (
+    PlayerRenderer,
+    HUDRenderer,
+    ArenaRenderer,
+    InstancedEnemyRenderer,
+    GraphicsQuality,
+)
 from src.infrastructure.spawning import EnemySpawner
 from src.infrastructure.input import ShootingHandler, KeyboardMapper
 from src.infrastructure.audio import SoundManager
+from src.infrastructure.profiling import PStatsBridge, ProfilerOverlay
 
 
 class OpenBNWGame:
     """Main game orchestrator - pure component wiring."""
 
-    def __init__(self):
-        # Enable shadows
-        Entity.default_shader = lit_with_shadows_shader
+    def __init__(self, replay: Optional[InputRecording] = None, resume_path: Optional[str] = None):
+        """
+        Wire the game.
+
+        Args:
+            replay: Recorded session whose input drives the game instead of the keyboard and mouse
+            resume_path: Snapshot file to continue from instead of starting a new game
+        """
+        # UI and overlays are unlit; world entities get lighting and shadows from the quality preset
+        Entity.default_shader = unlit_shader
+
+        # Input recording and replay (both need the simulation in this process)
+        self.replay = replay
+        self.recorder = None
+        self.ticks = 0  # simulation ticks run, indexing the replay
+        self.restart_requested = False  # restart input waiting for the next tick
+        self.retry_requested = False  # retry-wave input waiting for the next tick
+        self.step_requested = False  # development single-step waiting for the next frame
+        self.sim_worker = GameConfig.SIM_WORKER and replay is None
+        # Snapshots need the simulation in this process; a resumed game cannot be recorded from its first tick
+        self.wave_snapshot: Optional[bytes] = None  # game state at the start of the current wave
+        resume_path = None if self.sim_worker else resume_path
+        sim_rate = GameConfig.SIM_RATE
+        spawn_seed, arena_seed = GameConfig.SPAWN_SEED, GameConfig.ARENA_SEED
+        if replay is not None:
+            sim_rate, spawn_seed, arena_seed = replay.rate, replay.spawn_seed, replay.arena_seed
+        elif GameConfig.REPLAY_RECORD_PATH and not self.sim_worker and resume_path is None:
+            # A recording needs concrete seeds to reproduce spawns and cover
+            spawn_seed = random.randrange(2**31) if spawn_seed is None else spawn_seed
+            arena_seed = random.randrange(2**31) if arena_seed is None else arena_seed
+            self.recorder = InputRecorder(GameConfig.REPLAY_RECORD_PATH, sim_rate, spawn_seed, arena_seed)
+            atexit.register(self.recorder.close)
+        elif self.sim_worker and arena_seed is None:
+            # The worker builds its own arena from this seed, so its cover matches the one drawn here
+            arena_seed = random.randrange(2**31)
 
         # Domain layer - pure Python game logic
+        if self.sim_worker:
+            # Pause and speed changes are mirrored to the worker's clock
+            commands = CommandRing.create(GameConfig.SIM_WORKER_COMMAND_SLOTS)
+            self.clock = RemoteClock(commands, max_frame_time=GameConfig.MAX_FRAME_TIME)
+        else:
+            self.clock = GameClock(max_frame_time=GameConfig.MAX_FRAME_TIME)
+        self.timestep = FixedTimestep(sim_rate, GameConfig.SIM_MAX_STEPS)
+        self.profiler = FrameProfiler(
+            GameConfig.PROFILER_ENABLED, GameConfig.PROFILER_HISTORY, GameConfig.PROFILER_TRACE_EVENTS
+        )
         player_domain = Player(GameConfig.PLAYER_MAX_HEALTH)
-        weapon_domain = Weapon(GameConfig.WEAPON_FIRE_RATE, GameConfig.WEAPON_DAMAGE, GameConfig.WEAPON_RANGE)
-        wave_manager = WaveManager(
-            GameConfig.BASE_ENEMY_COUNT,
-            GameConfig.ENEMY_COUNT_INCREMENT,
-            GameConfig.BASE_ENEMY_SPEED,
-            GameConfig.ENEMY_SPEED_INCREMENT,
-            GameConfig.ENEMY_MAX_HEALTH,
+        weapon_domain = Weapon(
+            GameConfig.WEAPON_FIRE_RATE, GameConfig.WEAPON_DAMAGE, GameConfig.WEAPON_RANGE, self.clock
+        )
+        arena_geometry = ArenaGeometry.build_square(
             GameConfig.ARENA_SIZE,
-            GameConfig.SPAWN_MARGIN,
-            GameConfig.PLAYER_DISTANCE_MIN,
+            GameConfig.ARENA_WALL_HEIGHT,
+            wall_thickness=1,
+            cover_count=GameConfig.ARENA_COVER_COUNT,
+            cover_size=GameConfig.ARENA_COVER_SIZE,
+            cover_height=GameConfig.ARENA_COVER_HEIGHT,
+            cover_gap=GameConfig.ARENA_COVER_GAP,
+            clear_radius=GameConfig.ARENA_COVER_CLEAR_RADIUS,
+            seed=arena_seed,
         )
 
         # Application layer - service orchestration
-        self.game_service = GameService(
-            player_domain, weapon_domain, wave_manager, GameConfig.WAVE_CLEAR_DELAY, GameConfig.WAVE_START_DELAY
-        )
+        if self.sim_worker:
+            # Enemies and waves run in sim_worker.py; this process draws its published state
+            self.game_service = RemoteGameService(
+                weapon_domain, self.clock, GameConfig.SIM_WORKER_CAPACITY, GameConfig.SIM_RATE, self.profiler
+            )
+            worker_script = os.path.join(os.path.dirname(__file__), "sim_worker.py")
+            self.game_service.start_worker([sys.executable, worker_script, "--arena-seed", str(arena_seed)])
+        else:
+            self.game_service = self._create_game_service(player_domain, weapon_domain, arena_geometry, spawn_seed)
         # Game state
         self.game_over_shown = False
         # Infrastructure - rendering
-        self.arena = ArenaRenderer(GameConfig.ARENA_SIZE)
-        self.player_renderer = PlayerRenderer(player_domain)
+        initial_preset = GameConfig.QUALITY_PRESETS[GameConfig.QUALITY_PRESET]
+        self.arena = ArenaRenderer(GameConfig.ARENA_SIZE, arena_geometry, initial_preset["shadow_map_size"])
+        player_geometry = arena_geometry if GameConfig.PLAYER_COLLISION_MODE == "analytic" else None
+        self.player_renderer = PlayerRenderer(player_domain, player_geometry, self.profiler, fixed_step=True)
+        self.game_service.player_renderer = self.player_renderer
+        if not self.sim_worker:
+            # Enemies have no colliders: the player body is pushed out of the swarm's rows instead
+            self.player_renderer.dynamic_obstacles = partial(
+                self.game_service.wave_manager.swarm.resolve_horizontal,
+                body_radius=GameConfig.ENEMY_WIDTH / 2,
+                body_height=GameConfig.ENEMY_HEIGHT,
+            )
         self.hud = HUDRenderer(self.game_service)
 
-        # Infrastructure - enemy spawning
-        shootables_parent = Entity()
-        mouse.traverse_target = shootables_parent
-        self.enemy_spawner = EnemySpawner(shootables_parent, self.player_renderer, self.game_service)
+        # Infrastructure - enemy rendering (a worker's state has no per-enemy objects, so it is always instanced)
+        instanced = self.sim_worker or GameConfig.ENEMY_RENDER_MODE == "instanced"
+        if self.sim_worker:
+            # The snapshot ages hit feedback on the worker's clock; the service estimates alpha
+            self.enemy_spawner = InstancedEnemyRenderer(
+                self.game_service.wave_manager.swarm,
+                self.game_service.snapshot,
+                profiler=self.profiler,
+                timestep=self.game_service,
+            )
+        elif instanced:
+            self.enemy_spawner = InstancedEnemyRenderer(
+                self.game_service.wave_manager.swarm, self.clock, profiler=self.profiler, timestep=self.timestep
+            )
+        else:
+            self.enemy_spawner = EnemySpawner(
+                Entity(),
+                GameConfig.ENEMY_POOL_PREALLOCATE,
+                GameConfig.ENEMY_POOL_MAX_IDLE,
+                self.profiler,
+                self.timestep,
+            )
+
+        # Infrastructure - graphics quality
+        self.graphics_quality = GraphicsQuality(GameConfig.QUALITY_PRESETS, self.arena.sun)
+        self.graphics_quality.add_group("arena", self.arena.static)
+        self.graphics_quality.add_group("player", self.player_renderer.gun)
+        if instanced:
+            self.graphics_quality.add_group("enemies", self.enemy_spawner.bodies, shaded=False)
+        else:
+            self.graphics_quality.add_group("enemies", self.enemy_spawner.pool.enemies_parent)
+        self.graphics_quality.apply(GameConfig.QUALITY_PRESET)
+        quality_level = self.graphics_quality.level_of(GameConfig.QUALITY_PRESET)
+        self.profiler.counter("quality.level", quality_level)
+        self.quality_governor = None
+        if GameConfig.QUALITY_GOVERNOR:
+            self.quality_governor = QualityGovernor(
+                quality_level,
+                quality_level,
+                GameConfig.QUALITY_DOWNGRADE_MS,
+                GameConfig.QUALITY_UPGRADE_MS,
+                GameConfig.QUALITY_GOVERNOR_WINDOW,
+                GameConfig.QUALITY_GOVERNOR_COOLDOWN,
+            )
+
+        # Infrastructure - profiling (development)
+        if GameConfig.PROFILER_ENABLED:
+            self.profiler_overlay = ProfilerOverlay(self.profiler, GameConfig.PROFILER_TRACE_PATH)
+            if GameConfig.PROFILER_PSTATS:
+                PStatsBridge(self.profiler)
+
+        # Infrastructure - audio (renders and loads every sound effect up front)
+        SoundManager.load()
 
         # Infrastructure - input
         self.input_handler = InputHandler(self.game_service)
         self.input_handler.on_quit_requested = application.quit
 
+        hitscan = None  # the worker resolves forwarded shots
+        if not self.sim_worker:
+            hitscan = HitscanResolver(
+                self.game_service.wave_manager.swarm, arena_geometry, GameConfig.ENEMY_WIDTH, GameConfig.ENEMY_HEIGHT
+            )
         shooting_handler = ShootingHandler(
-            self.player_renderer.gun, shootables_parent, GameConfig.WEAPON_RANGE, GameConfig.WEAPON_DAMAGE
+            self.player_renderer.gun, hitscan, self.game_service, GameConfig.WEAPON_RANGE
         )
+        shooting_handler.on_shot = SoundManager.play_gun_shot
         self.keyboard_mapper = KeyboardMapper(self.input_handler, shooting_handler)
 
         # Wire game service callbacks to infrastructure
@@ -75,11 +211,72 @@ class OpenBNWGame:
         self.game_service.on_enemy_death = self.enemy_spawner.despawn_enemy
         self.game_service.on_enemy_damaged = self.enemy_spawner.handle_enemy_damage
         self.game_service.on_player_death = self._on_player_death
-        self.game_service.on_countdown_beep = lambda: SoundManager.play_countdown_beep()
-        self.game_service.on_restart_requested = self._on_restart
+        self.game_service.on_player_damaged = lambda damage: self.player_renderer.blink(color.red)
+        self.game_service.on_countdown_beep = SoundManager.play_countdown_beep
+        self.game_service.on_restart_requested = self._request_restart
+        self.game_service.on_step_requested = self._request_step
+        if not self.sim_worker:
+            self.game_service.on_wave_start = self._on_wave_start
+            self.game_service.on_retry_wave_requested = self._request_retry_wave
 
         # Start
-        self.game_service.start_game()
+        if resume_path is not None:
+            self._apply_body_state(load_game_file(resume_path, self.game_service))
+        else:
+            self.game_service.start_game()
+
+    def _create_game_service(
+        self, player_domain: Player, weapon_domain: Weapon, arena_geometry: ArenaGeometry, spawn_seed: Optional[int]
+    ):
+        """Wire the in-process simulation: waves, navigation and AI scheduling around the game service."""
+        wave_manager = WaveManager(
+            GameConfig.BASE_ENEMY_COUNT,
+            GameConfig.ENEMY_COUNT_INCREMENT,
+            GameConfig.BASE_ENEMY_SPEED,
+            GameConfig.ENEMY_SPEED_INCREMENT,
+            GameConfig.ENEMY_MAX_HEALTH,
+            GameConfig.ARENA_SIZE,
+            GameConfig.SPAWN_MARGIN,
+            GameConfig.PLAYER_DISTANCE_MIN,
+            GameConfig.SPATIAL_CELL_SIZE,
+            GameConfig.ENEMY_SPAWN_SPACING,
+            spawn_seed,
+            GameConfig.WAVE_MAX_ALIVE,
+            arena_geometry,
+        )
+
+        flow_field = None
+        if GameConfig.NAV_FLOW_FIELD:
+            flow_field = FlowField(
+                arena_geometry, GameConfig.NAV_CELL_SIZE, GameConfig.ENEMY_WIDTH / 2, GameConfig.ENEMY_HEIGHT
+            )
+
+        ai_lod = None
+        if GameConfig.AI_LOD_ENABLED:
+            ai_lod = AILevelOfDetail(
+                GameConfig.AI_LOD_NEAR_DISTANCE,
+                GameConfig.AI_LOD_FAR_DISTANCE,
+                GameConfig.AI_LOD_MID_INTERVAL,
+                GameConfig.AI_LOD_FAR_INTERVAL,
+                GameConfig.AI_LOD_MIN_ENEMIES,
+            )
+        return GameService(
+            player_domain,
+            weapon_domain,
+            wave_manager,
+            GameConfig.WAVE_CLEAR_DELAY,
+            GameConfig.WAVE_START_DELAY,
+            GameConfig.ENEMY_DAMAGE,
+            GameConfig.ENEMY_ATTACK_COOLDOWN,
+            GameConfig.ENEMY_CONTACT_DISTANCE,
+            self.clock,
+            self.profiler,
+            GameConfig.WAVE_SPAWN_BUDGET,
+            ai_lod,
+            flow_field,
+            GameConfig.ENEMY_SEPARATION_RADIUS,
+            GameConfig.ENEMY_SEPARATION_WEIGHT,
+        )
 
     def _on_player_death(self):
         """Handle player death."""
@@ -91,46 +288,174 @@ class OpenBNWGame:
             self.player_renderer.disable()
             self.player_renderer.gun.enabled = False
 
-    def _on_restart(self):
-        """Handle game restart."""
-        # Destroy all enemies
+    def _request_restart(self):
+        """Restart on the next simulation tick, so restarts land on the same tick when replayed."""
+        self.restart_requested = True
+
+    def _request_step(self):
+        """Run one tick while paused on the next frame, through _step like every other tick."""
+        self.step_requested = True
+
+    def _request_retry_wave(self):
+        """Retry the wave on the next simulation tick, like a restart."""
+        self.retry_requested = True
+
+    def _body_state(self) -> PlayerBodyState:
+        """Player transform and vertical motion for a snapshot."""
+        player = self.player_renderer
+        return PlayerBodyState(
+            (player.x, player.y, player.z),
+            player.rotation_y,
+            player.camera_pivot.rotation_x,
+            player.y_velocity,
+            player.grounded,
+        )
+
+    def _apply_body_state(self, body: PlayerBodyState):
+        """Put the player back where a snapshot left them."""
+        player = self.player_renderer
+        player.position = body.position
+        player.rotation_y = body.yaw
+        player.camera_pivot.rotation_x = body.pitch
+        player.y_velocity = body.y_velocity
+        player.grounded = body.grounded
+
+    def _on_wave_start(self, wave: int):
+        """Snapshot the game for retrying this wave, and autosave it for crash recovery."""
+        self.wave_snapshot = save_game(self.game_service, self._body_state())
+        if GameConfig.SNAPSHOT_PATH and self.replay is None:
+            save_game_file(GameConfig.SNAPSHOT_PATH, self.game_service, self._body_state())
+
+    def _leave_game_over(self):
+        """Park all enemies and bring the player and HUD back from the game over screen."""
+        # Park all enemies for reuse
         self.enemy_spawner.despawn_all()
 
-        # Reset player
-        self.player_renderer.position = (0, 0.5, 0)
         self.player_renderer.enable()
-
-        # Reset game state
         self.game_over_shown = False
         self.input_handler.set_game_over(False)  # Reset input handler state too
         self.hud.hide_game_over()
         self.player_renderer.gun.enabled = True
         mouse.locked = True
 
+    def _on_restart(self):
+        """Handle game restart."""
+        self._leave_game_over()
+
+        # Reset player
+        self.player_renderer.position = (0, 0.5, 0)
+
         # Restart game service
+        self.wave_snapshot = None
         self.game_service.start_game()
 
+    def _on_retry_wave(self):
+        """Handle wave retry: restore the snapshot taken when the current wave started."""
+        if self.wave_snapshot is None:
+            # Died before the first wave started
+            self._on_restart()
+            return
+
+        self._leave_game_over()
+        self._apply_body_state(load_game(self.game_service, self.wave_snapshot))
+
     def input(self, key):
         """Route input to keyboard mapper for game controls"""
         self.keyboard_mapper.handle_key(key)
 
+    @property
+    def replay_finished(self) -> bool:
+        """Whether every tick of the replay has run (never true when not replaying)."""
+        return self.replay is not None and self.ticks >= len(self.replay)
+
+    def _tick_input(self) -> int:
+        """This tick's Button flags and look direction: sampled live (and recorded), or read from the replay."""
+        player = self.player_renderer
+        if self.replay is not None:
+            buttons, player.rotation_y, player.camera_pivot.rotation_x = self.replay.tick(self.ticks)
+            return buttons
+
+        buttons = self.keyboard_mapper.held_buttons()
+        if self.clock.paused:
+            # A single step while paused: shots are refused, so the replay (never paused) must not fire either
+            buttons &= ~Button.FIRE
+        if self.restart_requested:
+            buttons |= Button.RESTART
+            self.restart_requested = False
+        if self.retry_requested:
+            buttons |= Button.RETRY_WAVE
+            self.retry_requested = False
+        if self.recorder is not None:
+            self.recorder.record(buttons, player.rotation_y, player.camera_pivot.rotation_x)
+        return buttons
+
+    def _step(self, delta_time: float):
+        """Apply one tick of input, then advance the player body and the game by one fixed simulation step."""
+        buttons = self._tick_input()
+        self.ticks += 1
+        if buttons & Button.RESTART:
+            self._on_restart()
+        elif buttons & Button.RETRY_WAVE:
+            self._on_retry_wave()
+        if self.player_renderer.enabled:
+            self.player_renderer.held_keys = KeyboardMapper.movement_keys(buttons)
+            self.player_renderer.simulate(delta_time)
+        if buttons & Button.FIRE:
+            self.keyboard_mapper.shoot()
+        self.game_service.update(self.clock.step(delta_time))
+
+    def run_replay(self):
+        """Run the rest of the replay as fast as possible, without drawing frames."""
+        while not self.replay_finished:
+            self._step(self.timestep.step_time)
+
     def update(self):
         """Update game state."""
-        if not self.game_over_shown:
-            self.keyboard_mapper.update()  # Handle held keys only during game
-        self.game_service.update(time.dt)
-        self.hud.update()  # Auto-poll game state
+        self.profiler.mark_frame()
+        # Freeze mouse look while paused; a replay sets the look direction itself
+        self.player_renderer.ignore = self.clock.paused or self.replay is not None
+
+        # Fixed-rate simulation: run the steps this frame's game time covers, then draw between the last two
+        steps = self.timestep.advance(self.clock.frame_delta(time.dt))
+        if self.step_requested:
+            self.step_requested = False
+            steps += 1
+        if self.replay is not None:
+            steps = min(steps, len(self.replay) - self.ticks)
+        self.player_renderer.begin_steps()
+        with self.profiler.scope("game"):
+            for _ in range(steps):
+                self._step(self.timestep.step_time)
+        self.player_renderer.interpolate(self.timestep.alpha)
+        self.profiler.counter("sim.steps", steps)
+
+        with self.profiler.scope("hud"):
+            self.hud.update()  # Auto-poll game state
+        if self.quality_governor is not None and self.quality_governor.update(time.dt):
+            self.graphics_quality.apply(self.graphics_quality.levels[self.quality_governor.level])
+            self.profiler.counter("quality.level", self.quality_governor.level)
 
 
 # Entry point
 if __name__ == "__main__":
     window_title = GameConfig.NAME + " " + GameConfig.VERSION
     app = Ursina(title=window_title, development_mode=GameConfig.DEVELOPMENT)
-    game = OpenBNWGame()
+    # --resume continues from the last wave-start autosave
+    resume_path = None
+    if "--resume" in sys.argv[1:] and GameConfig.SNAPSHOT_PATH and os.path.exists(GameConfig.SNAPSHOT_PATH):
+        resume_path = GameConfig.SNAPSHOT_PATH
+    game = OpenBNWGame(resume_path=resume_path)
+
+    # Startup measurement (see startup_report.py): exit once the first frame is on screen
+    exit_after_first_frame = os.environ.get("OPENBNW_EXIT_AFTER_FIRST_FRAME") == "1"
 
     # Register global functions for Ursina
     def update():
         game.update()
+        # update() runs before each frame is drawn, so on frame 2 the first one is on screen
+        if exit_after_first_frame and application.base.clock.getFrameCount() >= 2:
+            print("OPENBNW_FIRST_FRAME", flush=True)
+            application.quit()
 
     def input(key):
         game.input(key)
@@ -0,0 +1,103 @@
+"""OpenBNW replay - re-runs a recorded session (GameConfig.REPLAY_RECORD_PATH), rendered or headless at full speed."""
+
+import argparse
+import sys
+import os
+import time as wall_clock
+from contextlib import contextmanager
+
+# Setup Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+
+from config.game_config import GameConfig
+from application.replay import InputRecording
+
+
+def summary(game, wall_time: float) -> str:
+    """One line describing where the replay ended up and how fast it ran."""
+    game_service = game.game_service
+    ticks_per_second = game.ticks / wall_time if wall_time > 0 else float("inf")
+    return (
+        f"ticks: {game.ticks}, wave: {game_service.wave_manager.current_wave}, "
+        f"kills: {game_service.player.kills}, health: {game_service.player.health}, "
+        f"player: ({game.player_renderer.x:.3f}, {game.player_renderer.y:.3f}, {game.player_renderer.z:.3f}), "
+        f"wall time: {wall_time:.3f}s, {ticks_per_second:.0f} ticks/s"
+    )
+
+
+@contextmanager
+def windowless_mouse():
+    """
+    Let the game lock and unlock Ursina's mouse while there is no window.
+
+    Ursina's mouse.locked setter requests window properties, which fails
+    without a window. Only the mouse instance is switched to a subclass that
+    just remembers the value, and only until the block exits.
+    """
+    from ursina import mouse
+
+    mouse_class = type(mouse)
+
+    class WindowlessMouse(mouse_class):
+        locked = property(mouse_class.locked.fget, lambda self, value: setattr(self, "_locked", value))
+
+    mouse.__class__ = WindowlessMouse
+    try:
+        yield mouse
+    finally:
+        mouse.__class__ = mouse_class
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Replay a recorded OpenBNW session.")
+    parser.add_argument("recording", help="file written by a session with GameConfig.REPLAY_RECORD_PATH set")
+    parser.add_argument("--headless", action="store_true", help="run without a window or frame pacing")
+    args = parser.parse_args(argv)
+
+    recording = InputRecording.load(args.recording)
+
+    if args.headless:
+        from panda3d.core import loadPrcFileData
+
+        loadPrcFileData("", "window-type none\naudio-library-name null")
+
+    from ursina import Ursina, application
+    from main import OpenBNWGame
+
+    window_title = GameConfig.NAME + " " + GameConfig.VERSION + " - replay"
+    app = Ursina(
+        title=window_title,
+        window_type="none" if args.headless else "onscreen",
+        development_mode=GameConfig.DEVELOPMENT,
+    )
+    if args.headless:
+        # Player movement and shots run on the engine's transforms, exactly as when the session was recorded
+        with windowless_mouse():
+            game = OpenBNWGame(replay=recording)
+            start = wall_clock.perf_counter()
+            game.run_replay()
+        print(summary(game, wall_clock.perf_counter() - start))
+        return 0
+
+    game = OpenBNWGame(replay=recording)
+    start = wall_clock.perf_counter()
+
+    # Register global functions for Ursina
+    def update():
+        game.update()
+        if game.replay_finished:
+            print(summary(game, wall_clock.perf_counter() - start))
+            application.quit()
+
+    def input(key):
+        game.input(key)
+
+    module = sys.modules[__name__]
+    module.update = update
+    module.input = input
+    app.run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+"""OpenBNW simulation worker - runs the game logic for main.py in a separate process (GameConfig.SIM_WORKER)."""
+
+import argparse
+import sys
+import os
+
+# Setup Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+
+from config.game_config import GameConfig
+from domain.combat import HitscanResolver
+from application.worker import SharedGameState, CommandRing, SimWorker
+from simulate import create_game_service
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run the OpenBNW simulation for a render process.")
+    parser.add_argument("--state", required=True, help="shared memory name of the published game state")
+    parser.add_argument("--commands", required=True, help="shared memory name of the command ring")
+    parser.add_argument("--capacity", type=int, required=True, help="enemy capacity of the game state")
+    parser.add_argument("--command-slots", type=int, required=True, help="slot count of the command ring")
+    parser.add_argument("--arena-seed", type=int, required=True, help="cover seed of the arena the render process drew")
+    args = parser.parse_args(argv)
+
+    state = SharedGameState.attach(args.state, args.capacity)
+    commands = CommandRing.attach(args.commands, args.command_slots)
+
+    game_service = create_game_service(GameConfig.SPAWN_SEED, args.arena_seed)
+    game_service.clock.max_frame_time = GameConfig.MAX_FRAME_TIME
+    wave_manager = game_service.wave_manager
+    hitscan = HitscanResolver(
+        wave_manager.swarm, wave_manager.geometry, GameConfig.ENEMY_WIDTH, GameConfig.ENEMY_HEIGHT
+    )
+    worker = SimWorker(game_service, hitscan, state, commands, GameConfig.SIM_RATE, GameConfig.SIM_MAX_STEPS)
+    try:
+        worker.run()
+    finally:
+        state.close()
+        commands.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
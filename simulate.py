@@ -0,0 +1,120 @@
+"""OpenBNW headless simulation - runs the game logic without a window."""
+
+import argparse
+import sys
+import os
+
+# Setup Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+
+from config.game_config import GameConfig
+from domain.entities import Player, Weapon, AILevelOfDetail
+from domain.arena import ArenaGeometry
+from domain.navigation import FlowField
+from domain.wave_system import WaveManager
+from domain.clock import GameClock
+from application.services import GameService
+from application.simulation import HeadlessRunner, NearestEnemyPolicy
+from application.simulation.headless_runner import HeadlessPlayerBody
+from application.snapshot import PlayerBodyState, load_game_file, save_game_file
+
+
+def create_game_service(seed=None, arena_seed=None) -> GameService:
+    """Wire domain and application layers around a stepped game clock (arena_seed None uses GameConfig.ARENA_SEED)."""
+    clock = GameClock()
+    player = Player(GameConfig.PLAYER_MAX_HEALTH)
+    weapon = Weapon(GameConfig.WEAPON_FIRE_RATE, GameConfig.WEAPON_DAMAGE, GameConfig.WEAPON_RANGE, clock)
+    arena_geometry = ArenaGeometry.build_square(
+        GameConfig.ARENA_SIZE,
+        GameConfig.ARENA_WALL_HEIGHT,
+        wall_thickness=1,
+        cover_count=GameConfig.ARENA_COVER_COUNT,
+        cover_size=GameConfig.ARENA_COVER_SIZE,
+        cover_height=GameConfig.ARENA_COVER_HEIGHT,
+        cover_gap=GameConfig.ARENA_COVER_GAP,
+        clear_radius=GameConfig.ARENA_COVER_CLEAR_RADIUS,
+        seed=GameConfig.ARENA_SEED if arena_seed is None else arena_seed,
+    )
+    wave_manager = WaveManager(
+        GameConfig.BASE_ENEMY_COUNT,
+        GameConfig.ENEMY_COUNT_INCREMENT,
+        GameConfig.BASE_ENEMY_SPEED,
+        GameConfig.ENEMY_SPEED_INCREMENT,
+        GameConfig.ENEMY_MAX_HEALTH,
+        GameConfig.ARENA_SIZE,
+        GameConfig.SPAWN_MARGIN,
+        GameConfig.PLAYER_DISTANCE_MIN,
+        GameConfig.SPATIAL_CELL_SIZE,
+        GameConfig.ENEMY_SPAWN_SPACING,
+        seed,
+        GameConfig.WAVE_MAX_ALIVE,
+        arena_geometry,
+    )
+    flow_field = None
+    if GameConfig.NAV_FLOW_FIELD:
+        flow_field = FlowField(
+            arena_geometry, GameConfig.NAV_CELL_SIZE, GameConfig.ENEMY_WIDTH / 2, GameConfig.ENEMY_HEIGHT
+        )
+    ai_lod = None
+    if GameConfig.AI_LOD_ENABLED:
+        ai_lod = AILevelOfDetail(
+            GameConfig.AI_LOD_NEAR_DISTANCE,
+            GameConfig.AI_LOD_FAR_DISTANCE,
+            GameConfig.AI_LOD_MID_INTERVAL,
+            GameConfig.AI_LOD_FAR_INTERVAL,
+            GameConfig.AI_LOD_MIN_ENEMIES,
+        )
+    return GameService(
+        player,
+        weapon,
+        wave_manager,
+        GameConfig.WAVE_CLEAR_DELAY,
+        GameConfig.WAVE_START_DELAY,
+        GameConfig.ENEMY_DAMAGE,
+        GameConfig.ENEMY_ATTACK_COOLDOWN,
+        GameConfig.ENEMY_CONTACT_DISTANCE,
+        clock,
+        spawn_budget=GameConfig.WAVE_SPAWN_BUDGET,
+        ai_lod=ai_lod,
+        flow_field=flow_field,
+        enemy_separation_radius=GameConfig.ENEMY_SEPARATION_RADIUS,
+        enemy_separation_weight=GameConfig.ENEMY_SEPARATION_WEIGHT,
+    )
+
+
+def create_runner(args, run_index: int) -> HeadlessRunner:
+    """Build a game and drive it with the scripted policy."""
+    seed = None if args.seed is None else args.seed + run_index
+    game_service = create_game_service(seed)
+    policy = NearestEnemyPolicy(args.accuracy, seed)
+    player_body = HeadlessPlayerBody()
+    if args.load_snapshot:
+        body = load_game_file(args.load_snapshot, game_service)
+        player_body.x, player_body.y, player_body.z = body.position
+    return HeadlessRunner(game_service, game_service.clock, policy, args.dt, player_body)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run OpenBNW headless at a fixed time step.")
+    parser.add_argument("--waves", type=int, default=None, help="stop after clearing this many waves")
+    parser.add_argument("--max-ticks", type=int, default=None, help="stop after this many simulation steps")
+    parser.add_argument("--dt", type=float, default=1 / 60, help="fixed step in seconds (default: 1/60)")
+    parser.add_argument("--accuracy", type=float, default=1.0, help="scripted hit probability (default: 1.0)")
+    parser.add_argument("--seed", type=int, default=None, help="seed for spawn placement and the scripted policy")
+    parser.add_argument("--runs", type=int, default=1, help="number of independent runs")
+    parser.add_argument("--load-snapshot", default=None, help="start every run from this game snapshot")
+    parser.add_argument("--save-snapshot", default=None, help="save the game state here when a run stops")
+    args = parser.parse_args(argv)
+
+    for run_index in range(args.runs):
+        runner = create_runner(args, run_index)
+        result = runner.run(args.waves, args.max_ticks)
+        print(f"run {run_index + 1}: {result}")
+        if args.save_snapshot:
+            body = runner.player_body
+            save_game_file(args.save_snapshot, runner.game_service, PlayerBodyState((body.x, body.y, body.z)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -40,11 +40,41 @@ class InputHandler:
 
         self.game_service.on_restart_requested()
 
+    def handle_retry_wave(self):
+        """Handle retry input: go back to the start of the wave the player died in."""
+        if not self.game_over or not self.game_service.on_retry_wave_requested:
+            return
+
+        self.game_service.on_retry_wave_requested()
+
     def handle_quit(self):
         """Handle quit input."""
         if self.on_quit_requested:
             self.on_quit_requested()
 
+    def handle_toggle_pause(self):
+        """Handle pause/resume input."""
+        if self.game_over:
+            return
+        self.game_service.clock.toggle_pause()
+
+    def handle_time_scale(self, multiplier: float):
+        """
+        Handle simulation speed change input.
+
+        Args:
+            multiplier: Factor applied to the current time scale
+        """
+        clock = self.game_service.clock
+        clock.time_scale = clock.time_scale * multiplier
+
+    def handle_step(self):
+        """Handle single-step input: run one simulation tick while paused."""
+        if not self.game_service.clock.paused or not self.game_service.on_step_requested:
+            return
+
+        self.game_service.on_step_requested()
+
     def set_game_over(self, is_over: bool):
         """Set game over state."""
         self.game_over = is_over
@@ -0,0 +1,5 @@
+"""Frame profiling."""
+
+from .frame_profiler import FrameProfiler, ScopeStats
+
+__all__ = ["FrameProfiler", "ScopeStats"]
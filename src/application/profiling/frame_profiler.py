@@ -0,0 +1,269 @@
+"""Frame profiler - named scoped timers with rolling statistics and trace export."""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+
+class _NullScope:
+    """Shared do-nothing scope handed out while profiling is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+NULL_SCOPE = _NullScope()
+
+
+class _Scope:
+    """Reusable timer for one scope name."""
+
+    __slots__ = ("profiler", "name", "collectors", "start")
+
+    def __init__(self, profiler: "FrameProfiler", name: str, collectors: List[Any]):
+        self.profiler = profiler
+        self.name = name
+        self.collectors = collectors
+        self.start = 0.0
+
+    def __enter__(self):
+        for collector in self.collectors:
+            collector.start()
+        self.profiler.depth += 1
+        self.start = self.profiler.timer()
+        return self
+
+    def __exit__(self, *exc_info):
+        end = self.profiler.timer()
+        self.profiler.depth -= 1
+        for collector in self.collectors:
+            collector.stop()
+        self.profiler.record(self.name, self.start, end)
+        return False
+
+
+class ScopeStats:
+    """Rolling statistics of one scope over the profiler history."""
+
+    def __init__(self, name: str, average_ms: float, max_ms: float, calls_per_frame: float):
+        self.name = name
+        self.average_ms = average_ms
+        self.max_ms = max_ms
+        self.calls_per_frame = calls_per_frame
+
+
+class FrameProfiler:
+    """
+    Collects named scope timings per frame.
+    Application layer - engine agnostic.
+
+    Usage:
+        with profiler.scope("game_service.update"):
+            ...
+
+    While disabled, scope() costs a single branch and returns a shared no-op
+    context manager. While enabled, each scope adds its duration to the
+    current frame, feeds any attached collectors (e.g. PStats) and appends a
+    complete event to a bounded trace buffer for Chrome trace export.
+    Counters (e.g. how many enemies got a full AI update) keep their latest
+    value for display and are traced as counter events.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        history: int = 120,
+        trace_capacity: int = 100_000,
+        timer: Callable[[], float] = time.perf_counter,
+    ):
+        """
+        Initialize profiler.
+
+        Args:
+            enabled: Whether scopes are timed
+            history: Number of frames kept for rolling statistics
+            trace_capacity: Maximum number of trace events kept (oldest are dropped)
+            timer: Monotonic time source in seconds
+        """
+        self.enabled = enabled
+        self.timer = timer
+        self.frames: Deque[Tuple[float, float, Dict[str, List[float]]]] = deque(maxlen=history)
+        self.trace_events: Deque[Tuple[str, float, float]] = deque(maxlen=trace_capacity)
+        self.counter_events: Deque[Tuple[str, float, float]] = deque(maxlen=trace_capacity)
+        self.counters: Dict[str, float] = {}  # name -> latest value
+        self._scopes: Dict[str, _Scope] = {}
+        self._collector_factories: List[Callable[[str], Any]] = []
+        self.depth = 0  # number of scopes currently open
+        self._frame_totals: Dict[str, List[float]] = {}  # name -> [seconds, calls]
+        self._frame_scoped = 0.0  # seconds spent in outermost scopes this frame
+        self._frame_start: Optional[float] = None
+
+    def scope(self, name: str):
+        """
+        Get a context manager timing the named scope.
+
+        Args:
+            name: Scope name, dotted by subsystem (e.g. "enemies.step")
+
+        Returns:
+            Context manager
+        """
+        if not self.enabled:
+            return NULL_SCOPE
+        scope = self._scopes.get(name)
+        if scope is None:
+            scope = _Scope(self, name, [factory(name) for factory in self._collector_factories])
+            self._scopes[name] = scope
+        return scope
+
+    def add_collector_factory(self, factory: Callable[[str], Any]) -> None:
+        """
+        Mirror every scope into an external profiler.
+
+        Args:
+            factory: Called once per scope name; returns an object with start() and stop()
+        """
+        self._collector_factories.append(factory)
+        for name, scope in self._scopes.items():
+            scope.collectors.append(factory(name))
+
+    def record(self, name: str, start: float, end: float) -> None:
+        """
+        Record one timed section.
+
+        Args:
+            name: Scope name
+            start: Start time from the profiler timer
+            end: End time from the profiler timer
+        """
+        totals = self._frame_totals.get(name)
+        if totals is None:
+            self._frame_totals[name] = [end - start, 1]
+        else:
+            totals[0] += end - start
+            totals[1] += 1
+        if self.depth == 0:
+            self._frame_scoped += end - start
+        self.trace_events.append((name, start, end))
+
+    def counter(self, name: str, value: float) -> None:
+        """
+        Set a named counter.
+
+        Args:
+            name: Counter name, dotted by subsystem (e.g. "ai.near")
+            value: Current value
+        """
+        if not self.enabled:
+            return
+        self.counters[name] = value
+        self.counter_events.append((name, self.timer(), value))
+
+    def mark_frame(self) -> None:
+        """End the current frame and start the next one. Call once at the top of every frame."""
+        if not self.enabled:
+            self._frame_start = None
+            return
+
+        now = self.timer()
+        if self._frame_start is not None:
+            self.frames.append((now - self._frame_start, self._frame_scoped, self._frame_totals))
+            self.trace_events.append(("frame", self._frame_start, now))
+        self._frame_totals = {}
+        self._frame_scoped = 0.0
+        self._frame_start = now
+
+    def frame_time_ms(self) -> float:
+        """Average frame time over the history, in milliseconds."""
+        if not self.frames:
+            return 0.0
+        return sum(frame[0] for frame in self.frames) / len(self.frames) * 1000
+
+    def unscoped_time_ms(self) -> float:
+        """Average time per frame spent outside any scope (rendering, engine tasks), in milliseconds."""
+        if not self.frames:
+            return 0.0
+        return sum(frame[0] - frame[1] for frame in self.frames) / len(self.frames) * 1000
+
+    def stats(self) -> List[ScopeStats]:
+        """
+        Rolling per-scope statistics over the history, slowest first.
+
+        Returns:
+            List of ScopeStats
+        """
+        frame_count = len(self.frames)
+        if frame_count == 0:
+            return []
+
+        sums: Dict[str, List[float]] = {}
+        for _, _, totals in self.frames:
+            for name, (seconds, calls) in totals.items():
+                entry = sums.setdefault(name, [0.0, 0.0, 0])
+                entry[0] += seconds
+                entry[1] = max(entry[1], seconds)
+                entry[2] += calls
+
+        stats = [
+            ScopeStats(name, total / frame_count * 1000, peak * 1000, calls / frame_count)
+            for name, (total, peak, calls) in sums.items()
+        ]
+        stats.sort(key=lambda entry: entry.average_ms, reverse=True)
+        return stats
+
+    def export_chrome_trace(self, path: str) -> int:
+        """
+        Write recorded events in Chrome trace-event format (chrome://tracing, Perfetto).
+
+        Args:
+            path: Output JSON file
+
+        Returns:
+            Number of events written
+        """
+        pid = os.getpid()
+        tid = threading.get_ident()
+        events = [
+            {
+                "name": name,
+                "cat": name.split(".")[0],
+                "ph": "X",
+                "ts": start * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": pid,
+                "tid": tid,
+            }
+            for name, start, end in self.trace_events
+        ]
+        events.extend(
+            {
+                "name": name.split(".")[0],
+                "ph": "C",
+                "ts": timestamp * 1e6,
+                "args": {name: value},
+                "pid": pid,
+                "tid": tid,
+            }
+            for name, timestamp, value in self.counter_events
+        )
+        with open(path, "w") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+        return len(events)
+
+    def reset(self) -> None:
+        """Drop all statistics and trace events."""
+        self.frames.clear()
+        self.trace_events.clear()
+        self.counter_events.clear()
+        self.counters.clear()
+        self._frame_totals = {}
+        self._frame_scoped = 0.0
+        self._frame_start = None
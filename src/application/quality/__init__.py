@@ -0,0 +1,5 @@
+"""Graphics quality control."""
+
+from .quality_governor import QualityGovernor
+
+__all__ = ["QualityGovernor"]
@@ -0,0 +1,100 @@
+"""Quality governor - steps graphics quality with frame time."""
+
+
+class QualityGovernor:
+    """
+    Picks a quality level from measured frame times.
+    Application layer - engine agnostic.
+
+    Frame times are averaged over a window. A window slower than
+    downgrade_ms steps the level down; a window faster than upgrade_ms
+    steps it up, never above max_level. The gap between the two thresholds
+    and a cooldown after every change provide hysteresis. If a level is
+    dropped again right after being reached by an upgrade, the cooldown
+    before the next upgrade doubles, so a machine that cannot hold a level
+    stops retrying it every few seconds.
+    """
+
+    HOLD_TIME = 30.0  # seconds an upgraded level must last to count as sustainable
+
+    def __init__(
+        self,
+        level: int,
+        max_level: int,
+        downgrade_ms: float,
+        upgrade_ms: float,
+        window: float = 2.0,
+        cooldown: float = 4.0,
+        max_backoff: float = 64.0,
+    ):
+        """
+        Initialize governor.
+
+        Args:
+            level: Starting level (0 = lowest)
+            max_level: Highest level the governor may step up to
+            downgrade_ms: Average frame time above which the level steps down
+            upgrade_ms: Average frame time below which the level steps up (must be below downgrade_ms)
+            window: Seconds of frames averaged per decision
+            cooldown: Seconds after a change before the next one
+            max_backoff: Upper limit of the doubled upgrade cooldown, in seconds
+        """
+        if upgrade_ms >= downgrade_ms:
+            raise ValueError("upgrade_ms must be below downgrade_ms")
+
+        self.level = min(level, max_level)
+        self.max_level = max_level
+        self.downgrade_ms = downgrade_ms
+        self.upgrade_ms = upgrade_ms
+        self.window = window
+        self.cooldown = cooldown
+        self.max_backoff = max_backoff
+
+        self.upgrade_cooldown = cooldown
+        self.average_ms = 0.0  # average frame time of the last full window
+        self._window_time = 0.0
+        self._window_frames = 0
+        self._since_change = 0.0
+        self._last_change_was_upgrade = False
+
+    def update(self, frame_time: float) -> bool:
+        """
+        Account one frame.
+
+        Args:
+            frame_time: Real (unscaled) seconds the frame took
+
+        Returns:
+            True if the level changed
+        """
+        self._since_change += frame_time
+        self._window_time += frame_time
+        self._window_frames += 1
+        if self._window_time < self.window:
+            return False
+
+        self.average_ms = self._window_time / self._window_frames * 1000
+        self._window_time = 0.0
+        self._window_frames = 0
+
+        if self.average_ms > self.downgrade_ms and self.level > 0 and self._since_change >= self.cooldown:
+            if self._last_change_was_upgrade and self._since_change < self.HOLD_TIME:
+                # The level just reached could not be held: wait longer before trying it again
+                self.upgrade_cooldown = min(self.upgrade_cooldown * 2, self.max_backoff)
+            self._change(-1)
+            return True
+
+        if (
+            self.average_ms < self.upgrade_ms
+            and self.level < self.max_level
+            and self._since_change >= self.upgrade_cooldown
+        ):
+            self._change(+1)
+            return True
+        return False
+
+    def _change(self, step: int) -> None:
+        """Move one level and restart the cooldown."""
+        self.level += step
+        self._last_change_was_upgrade = step > 0
+        self._since_change = 0.0
@@ -0,0 +1,5 @@
+"""Input recording and deterministic replay."""
+
+from .input_recording import Button, InputRecorder, InputRecording
+
+__all__ = ["Button", "InputRecorder", "InputRecording"]
@@ -0,0 +1,141 @@
+"""Per-tick input recording and loading for deterministic replay."""
+
+import struct
+from typing import BinaryIO, Optional, Tuple
+import numpy as np
+
+MAGIC = b"OBNR"
+VERSION = 1
+
+# File header: magic, format version, simulation steps per second, spawn seed, arena seed
+HEADER = struct.Struct("<4sHdqq")
+# One record per simulation tick: Button flags, player yaw and camera pitch in degrees
+TICK = struct.Struct("<Bff")
+TICK_DTYPE = np.dtype([("buttons", "u1"), ("yaw", "<f4"), ("pitch", "<f4")])
+
+
+class Button:
+    """Flags of the inputs recorded for a tick."""
+
+    FORWARD = 1
+    BACK = 2
+    LEFT = 4
+    RIGHT = 8
+    JUMP = 16
+    FIRE = 32
+    RESTART = 64  # restart was requested before this tick
+    RETRY_WAVE = 128  # retrying the current wave was requested before this tick
+
+
+class InputRecorder:
+    """
+    Streams the input of every simulation tick to a file.
+    Application layer - engine agnostic.
+
+    Records are appended as the game runs, so a session that crashes still
+    leaves a replayable file up to the last buffered tick. Look direction
+    is stored as the absolute orientation in effect at the tick rather than
+    mouse deltas, so replay does not depend on how per-frame deltas were
+    summed.
+    """
+
+    def __init__(self, path: str, rate: float, spawn_seed: int, arena_seed: int):
+        """
+        Open a recording file and write its header.
+
+        Args:
+            path: File to write
+            rate: Simulation steps per game second
+            spawn_seed: Seed the session's spawn placement uses
+            arena_seed: Seed the session's cover layout uses
+        """
+        self.path = path
+        self.ticks = 0
+        self.file: Optional[BinaryIO] = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, rate, spawn_seed, arena_seed))
+
+    def record(self, buttons: int, yaw: float, pitch: float) -> None:
+        """
+        Append one tick.
+
+        Args:
+            buttons: Button flags held or requested for the tick
+            yaw: Player yaw in degrees
+            pitch: Camera pitch in degrees
+        """
+        self.file.write(TICK.pack(buttons, yaw, pitch))
+        self.ticks += 1
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+class InputRecording:
+    """
+    A recorded session: seeds, simulation rate and the input of every tick.
+    Application layer - engine agnostic.
+    """
+
+    def __init__(self, rate: float, spawn_seed: int, arena_seed: int, ticks: np.ndarray):
+        """
+        Initialize recording.
+
+        Args:
+            rate: Simulation steps per game second
+            spawn_seed: Seed for spawn placement
+            arena_seed: Seed for the cover layout
+            ticks: Structured array of TICK_DTYPE records
+        """
+        self.rate = rate
+        self.spawn_seed = spawn_seed
+        self.arena_seed = arena_seed
+        self.ticks = ticks
+
+    def __len__(self) -> int:
+        return len(self.ticks)
+
+    @classmethod
+    def load(cls, path: str) -> "InputRecording":
+        """
+        Read a recording written by InputRecorder.
+
+        A trailing partial tick (from a session that was killed mid-write) is ignored.
+
+        Args:
+            path: File to read
+
+        Returns:
+            Loaded recording
+
+        Raises:
+            ValueError: If the file is not a recording of a supported version
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+        if len(data) < HEADER.size:
+            raise ValueError(f"{path}: too short for a recording header")
+        magic, version, rate, spawn_seed, arena_seed = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: not an input recording")
+        if version != VERSION:
+            raise ValueError(f"{path}: recording version {version} is not supported (expected {VERSION})")
+
+        count = (len(data) - HEADER.size) // TICK.size
+        ticks = np.frombuffer(data, dtype=TICK_DTYPE, count=count, offset=HEADER.size)
+        return cls(rate, spawn_seed, arena_seed, ticks)
+
+    def tick(self, index: int) -> Tuple[int, float, float]:
+        """
+        Input of one tick.
+
+        Args:
+            index: Tick number, from 0
+
+        Returns:
+            (buttons, yaw, pitch)
+        """
+        record = self.ticks[index]
+        return int(record["buttons"]), float(record["yaw"]), float(record["pitch"])
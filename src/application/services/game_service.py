@@ -1,9 +1,11 @@
 """Game service - orchestrates game logic."""
 
-import time
-from typing import List, Optional, Callable
-from domain.entities import Player, Enemy, Weapon
+from typing import List, Optional, Callable, Tuple
+from domain.entities import Player, Enemy, Weapon, HandleRegistry, AILevelOfDetail
 from domain.wave_system import WaveManager
+from domain.navigation import FlowField
+from domain.clock import GameClock
+from application.profiling import FrameProfiler
 
 
 class GameService:
@@ -19,6 +21,16 @@ class GameService:
         wave_manager: WaveManager,
         wave_clear_delay: float = 3.0,
         wave_start_delay: float = 2.0,
+        enemy_damage: int = 20,
+        enemy_attack_cooldown: float = 1.0,
+        enemy_contact_distance: float = 1.0,
+        clock: Optional[GameClock] = None,
+        profiler: Optional[FrameProfiler] = None,
+        spawn_budget: Optional[int] = None,
+        ai_lod: Optional[AILevelOfDetail] = None,
+        flow_field: Optional[FlowField] = None,
+        enemy_separation_radius: float = 0.0,
+        enemy_separation_weight: float = 1.0,
     ):
         """
         Initialize game service.
@@ -29,14 +41,34 @@ class GameService:
             wave_manager: Wave management system
             wave_clear_delay: Seconds to wait after wave cleared
             wave_start_delay: Seconds to wait before first wave
+            enemy_damage: Damage an enemy deals to the player on contact
+            enemy_attack_cooldown: Seconds between attacks of a single enemy
+            enemy_contact_distance: XZ distance at which an enemy touches the player
+            clock: Game clock for countdowns and cooldowns (shared with Weapon)
+            profiler: Profiler timing the enemy step
+            spawn_budget: Most enemies spawned per update (one fixed step); the rest stream in later (None = no limit)
+            ai_lod: Distance-based scheduler thinning out AI updates of distant enemies (None = all every update)
+            flow_field: Shared pathfinding toward the player around static geometry (None = straight at the player)
+            enemy_separation_radius: Distance below which enemies push each other apart (0 = they may stack)
+            enemy_separation_weight: Strength of that push relative to the chase
         """
         self.player = player
         self.weapon = weapon
         self.wave_manager = wave_manager
         self.wave_clear_delay = wave_clear_delay
         self.wave_start_delay = wave_start_delay
-
-        self.enemies: List[Enemy] = []
+        self.enemy_damage = enemy_damage
+        self.enemy_attack_cooldown = enemy_attack_cooldown
+        self.enemy_contact_distance = enemy_contact_distance
+        self.clock = clock or GameClock()
+        self.profiler = profiler or FrameProfiler()
+        self.spawn_budget = spawn_budget
+        self.ai_lod = ai_lod
+        self.flow_field = flow_field
+        self.enemy_separation_radius = enemy_separation_radius
+        self.enemy_separation_weight = enemy_separation_weight
+
+        self.enemies: HandleRegistry[Enemy] = HandleRegistry()  # live enemies by handle
         self.game_started = False
         self.wave_in_progress = False
         self.wave_clear_time: Optional[float] = None
@@ -50,36 +82,51 @@ class GameService:
         self.on_enemy_damaged: Optional[Callable[[Enemy], None]] = None
         self.on_wave_start: Optional[Callable[[int], None]] = None
         self.on_player_death: Optional[Callable[[], None]] = None
+        self.on_player_damaged: Optional[Callable[[int], None]] = None
         self.on_countdown_beep: Optional[Callable[[], None]] = None
         self.on_restart_requested: Optional[Callable[[], None]] = None
+        self.on_retry_wave_requested: Optional[Callable[[], None]] = None
+        self.on_step_requested: Optional[Callable[[], None]] = None
 
     def start_game(self) -> None:
         """Initialize and start the game."""
         self.game_started = True
         self.player.reset()
         self.enemies.clear()
-        self.wave_manager.current_wave = 0
-        self.first_wave_start_time = time.time()
+        self.wave_manager.swarm.clear()
+        self.wave_manager.reset()
+        self.first_wave_start_time = self.clock.now()
+
+    def _get_player_position(self) -> Tuple[float, float, float]:
+        """Get player position from player_renderer (infrastructure reference)."""
+        if self.player_renderer is None:
+            return (0, 0, 0)
+        return (self.player_renderer.x, self.player_renderer.y, self.player_renderer.z)
+
+    @property
+    def enemies_remaining(self) -> int:
+        """Enemies left to kill this wave: alive plus queued reinforcements."""
+        return len(self.enemies) + self.wave_manager.reinforcements_remaining
 
     def _start_next_wave(self) -> None:
         """Start the next wave."""
-        # Safety cleanup: remove any dead enemies before starting new wave
-        self.enemies = [e for e in self.enemies if e.is_alive]
-
         wave_number = self.wave_manager.advance_to_next_wave()
-        # Get player position from player_renderer (infrastructure reference)
-        player_pos = (0, 0, 0)
-        if self.player_renderer is not None:
-            player_pos = (self.player_renderer.x, self.player_renderer.y, self.player_renderer.z)
-        new_enemies = self.wave_manager.spawn_wave(wave_number, player_pos)
-        self.enemies.extend(new_enemies)
+        self.wave_manager.start_wave(wave_number)
         self.wave_in_progress = True
         self.wave_clear_time = None
 
-        # Notify infrastructure to create visual enemies
         if self.on_wave_start:
             self.on_wave_start(wave_number)
 
+        self._spawn_reinforcements()
+
+    def _spawn_reinforcements(self) -> None:
+        """Spawn queued enemies within the alive cap and this update's spawn budget."""
+        new_enemies = self.wave_manager.spawn_reinforcements(self._get_player_position(), self.spawn_budget)
+        for enemy in new_enemies:
+            enemy.handle = self.enemies.add(enemy)
+
+        # Notify infrastructure to create visual enemies
         if self.on_enemy_spawn:
             for enemy in new_enemies:
                 self.on_enemy_spawn(enemy)
@@ -89,14 +136,18 @@ class GameService:
         Update game state.
 
         Args:
-            delta_time: Time since last update
+            delta_time: Game seconds since last update, as returned by the clock
         """
         if not self.game_started or not self.player.is_alive:
             return
 
+        self._update_enemies(delta_time)
+        if not self.player.is_alive:
+            return
+
         # Check if first wave should start
         if self.first_wave_start_time is not None:
-            elapsed = time.time() - self.first_wave_start_time
+            elapsed = self.clock.now() - self.first_wave_start_time
             time_remaining = self.wave_start_delay - elapsed
 
             # Play countdown beeps every second in the LAST 2 seconds
@@ -120,17 +171,21 @@ class GameService:
                 self._start_next_wave()
             return  # Don't process wave logic until first wave starts
 
+        # Stream in reinforcements as others die
+        if self.wave_in_progress and self.wave_manager.reinforcements_remaining:
+            self._spawn_reinforcements()
+
         # Check if wave is cleared
-        if self.wave_in_progress and len(self.enemies) == 0:
+        if self.wave_in_progress and self.enemies_remaining == 0:
             # Wave cleared!
             self.wave_in_progress = False
             if self.wave_clear_time is None:
-                self.wave_clear_time = time.time()
+                self.wave_clear_time = self.clock.now()
                 self.last_countdown_beep = None  # Reset for next wave countdown
 
         # Start next wave after delay (with countdown beeps in last 2 seconds)
         if not self.wave_in_progress and self.wave_clear_time is not None:
-            elapsed = time.time() - self.wave_clear_time
+            elapsed = self.clock.now() - self.wave_clear_time
             time_remaining = self.wave_clear_delay - elapsed
 
             # Play countdown beeps every second in the LAST 2 seconds
@@ -153,6 +208,38 @@ class GameService:
                 self.last_countdown_beep = None
                 self._start_next_wave()
 
+    def _update_enemies(self, delta_time: float) -> None:
+        """
+        Advance all enemies in one batched step and apply contact damage.
+
+        Args:
+            delta_time: Time since last update
+        """
+        player_position = self._get_player_position()
+        if self.flow_field is not None:
+            with self.profiler.scope("game.flow_field"):
+                self.flow_field.update(player_position[0], player_position[2])
+
+        with self.profiler.scope("game.enemies"):
+            attackers = self.wave_manager.swarm.step(
+                player_position,
+                delta_time,
+                self.clock.now(),
+                self.enemy_attack_cooldown,
+                self.enemy_contact_distance,
+                self.ai_lod,
+                self.flow_field,
+                self.enemy_separation_radius,
+                self.enemy_separation_weight,
+            )
+        if self.ai_lod is not None:
+            self.profiler.counter("ai.near", self.ai_lod.near_count)
+            self.profiler.counter("ai.mid", self.ai_lod.mid_count)
+            self.profiler.counter("ai.far", self.ai_lod.far_count)
+            self.profiler.counter("ai.updated", self.ai_lod.updated_count)
+        for _ in attackers:
+            self.handle_player_hit(self.enemy_damage)
+
     def handle_shoot_attempt(self) -> bool:
         """
         Try to fire weapon.
@@ -160,7 +247,7 @@ class GameService:
         Returns:
             True if weapon fired
         """
-        if not self.player.is_alive:
+        if not self.player.is_alive or self.clock.paused:
             return False
 
         if self.weapon.can_fire():
@@ -182,6 +269,7 @@ class GameService:
             return False
 
         enemy.take_damage(self.weapon.damage)
+        enemy.last_hit_time = self.clock.now()
 
         # Notify infrastructure for visual feedback (blink, health bar update)
         if self.on_enemy_damaged:
@@ -189,9 +277,9 @@ class GameService:
 
         if not enemy.is_alive:
             self.player.add_kill()
-            # Immediate cleanup: remove dead enemy from domain list
-            if enemy in self.enemies:
-                self.enemies.remove(enemy)
+            # Immediate O(1) cleanup; the handle stays on the enemy but no longer resolves
+            self.enemies.remove(enemy.handle)
+            self.wave_manager.swarm.remove(enemy)
             # Notify infrastructure to destroy visual entity
             if self.on_enemy_death:
                 self.on_enemy_death(enemy)
@@ -211,6 +299,9 @@ class GameService:
 
         self.player.take_damage(damage)
 
+        if self.on_player_damaged:
+            self.on_player_damaged(damage)
+
         if not self.player.is_alive:
             self.game_started = False
             if self.on_player_death:
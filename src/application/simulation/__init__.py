@@ -0,0 +1,6 @@
+"""Headless simulation."""
+
+from .headless_runner import HeadlessRunner, SimulationResult
+from .policies import ShootingPolicy, NearestEnemyPolicy
+
+__all__ = ["HeadlessRunner", "SimulationResult", "ShootingPolicy", "NearestEnemyPolicy"]
@@ -0,0 +1,130 @@
+"""Headless fixed-step runner for GameService."""
+
+import time
+from typing import Optional
+
+from domain.clock import GameClock
+from .policies import ShootingPolicy
+
+
+class HeadlessPlayerBody:
+    """Static stand-in for the player renderer, exposing x/y/z like an Entity."""
+
+    def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0):
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+class SimulationResult:
+    """Outcome of a headless run."""
+
+    def __init__(
+        self, waves_cleared: int, kills: int, player_health: int, ticks: int, sim_time: float, wall_time: float
+    ):
+        self.waves_cleared = waves_cleared
+        self.kills = kills
+        self.player_health = player_health
+        self.ticks = ticks
+        self.sim_time = sim_time
+        self.wall_time = wall_time
+
+    @property
+    def ticks_per_second(self) -> float:
+        """Simulation ticks per wall-clock second."""
+        return self.ticks / self.wall_time if self.wall_time > 0 else float("inf")
+
+    def __str__(self) -> str:
+        return (
+            f"waves cleared: {self.waves_cleared}, kills: {self.kills}, health: {self.player_health}, "
+            f"ticks: {self.ticks}, sim time: {self.sim_time:.1f}s, wall time: {self.wall_time:.3f}s, "
+            f"{self.ticks_per_second:.0f} ticks/s"
+        )
+
+
+class HeadlessRunner:
+    """
+    Steps the full game at a fixed delta time with no rendering engine.
+    Application layer - engine agnostic.
+    """
+
+    def __init__(
+        self,
+        game_service,
+        clock: GameClock,
+        policy: ShootingPolicy,
+        delta_time: float = 1 / 60,
+        player_body: Optional[HeadlessPlayerBody] = None,
+    ):
+        """
+        Initialize headless runner.
+
+        Args:
+            game_service: GameService to drive (built with `clock` as time source)
+            clock: GameClock shared with GameService and Weapon
+            policy: Shooting policy standing in for player input
+            delta_time: Fixed simulation step in seconds
+            player_body: Player position holder (defaults to arena center)
+        """
+        self.game_service = game_service
+        self.clock = clock
+        self.policy = policy
+        self.delta_time = delta_time
+        self.player_body = player_body or HeadlessPlayerBody()
+        self.game_service.player_renderer = self.player_body
+        self.ticks = 0
+
+    @property
+    def waves_cleared(self) -> int:
+        """Number of fully cleared waves."""
+        wave = self.game_service.wave_manager.current_wave
+        if self.game_service.wave_in_progress:
+            return wave - 1
+        return wave
+
+    def step(self) -> None:
+        """Advance the game by one fixed step."""
+        self.clock.step(self.delta_time)
+
+        player_position = (self.player_body.x, self.player_body.y, self.player_body.z)
+        target = self.policy.select_target(self.game_service, player_position)
+        if target is not None and self.game_service.handle_shoot_attempt():
+            if self.policy.shot_hits():
+                self.game_service.handle_enemy_hit(target)
+
+        self.game_service.update(self.delta_time)
+        self.ticks += 1
+
+    def run(self, max_waves: Optional[int] = None, max_ticks: Optional[int] = None) -> SimulationResult:
+        """
+        Run until the player dies or a limit is reached.
+
+        Args:
+            max_waves: Stop once this many waves are cleared
+            max_ticks: Stop after this many steps
+
+        Returns:
+            SimulationResult summary
+        """
+        if not self.game_service.game_started:
+            self.game_service.start_game()
+
+        start_ticks = self.ticks
+        start_sim_time = self.clock.now()
+        start_wall_time = time.perf_counter()
+
+        while self.game_service.player.is_alive:
+            if max_waves is not None and self.waves_cleared >= max_waves:
+                break
+            if max_ticks is not None and self.ticks - start_ticks >= max_ticks:
+                break
+            self.step()
+
+        return SimulationResult(
+            waves_cleared=self.waves_cleared,
+            kills=self.game_service.player.kills,
+            player_health=self.game_service.player.health,
+            ticks=self.ticks - start_ticks,
+            sim_time=self.clock.now() - start_sim_time,
+            wall_time=time.perf_counter() - start_wall_time,
+        )
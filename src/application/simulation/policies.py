@@ -0,0 +1,63 @@
+"""Scripted shooting policies for headless simulation."""
+
+import random
+from typing import Optional, Tuple
+import numpy as np
+
+from domain.entities import Enemy
+
+
+class ShootingPolicy:
+    """
+    Decides which enemy the simulated player shoots at each tick.
+    Application layer - engine agnostic.
+    """
+
+    def select_target(self, game_service, player_position: Tuple[float, float, float]) -> Optional[Enemy]:
+        """
+        Pick the enemy to shoot this tick.
+
+        Args:
+            game_service: GameService being simulated
+            player_position: Current player position (x, y, z)
+
+        Returns:
+            Enemy to shoot, or None to hold fire
+        """
+        return None
+
+    def shot_hits(self) -> bool:
+        """Whether a fired shot lands on the selected target."""
+        return True
+
+
+class NearestEnemyPolicy(ShootingPolicy):
+    """
+    Shoots at the nearest enemy in weapon range with a fixed hit probability.
+    """
+
+    def __init__(self, accuracy: float = 1.0, seed: Optional[int] = None):
+        """
+        Initialize policy.
+
+        Args:
+            accuracy: Probability (0-1) that a fired shot hits
+            seed: Seed for the miss roll, for reproducible runs
+        """
+        self.accuracy = accuracy
+        self.rng = random.Random(seed)
+
+    def select_target(self, game_service, player_position: Tuple[float, float, float]) -> Optional[Enemy]:
+        swarm = game_service.wave_manager.swarm
+        if swarm.count == 0:
+            return None
+
+        positions = swarm.positions[: swarm.count]
+        distance = np.hypot(positions[:, 0] - player_position[0], positions[:, 2] - player_position[2])
+        row = int(np.argmin(distance))
+        if distance[row] > game_service.weapon.weapon_range:
+            return None
+        return swarm.enemies[row]
+
+    def shot_hits(self) -> bool:
+        return self.rng.random() < self.accuracy
@@ -0,0 +1,5 @@
+"""Game state snapshots."""
+
+from .game_snapshot import PlayerBodyState, save_game, load_game, save_game_file, load_game_file
+
+__all__ = ["PlayerBodyState", "save_game", "load_game", "save_game_file", "load_game_file"]
@@ -0,0 +1,247 @@
+"""Versioned binary save and restore of a running game."""
+
+import math
+import os
+import struct
+from typing import Optional, Tuple
+import numpy as np
+
+MAGIC = b"OBNS"
+VERSION = 1
+
+HEADER = struct.Struct("<4sH")  # magic, format version
+# Everything except the enemy rows, in this order
+STATE = struct.Struct(
+    "<d"  # game time
+    "iiid"  # player max health, health, kills; weapon last fire time
+    "iiid"  # wave: current, enemies spawned this wave, reinforcements remaining, enemy speed
+    "16s16sBI"  # spawn generator (PCG64): state, increment, has_uint32, uinteger
+    "BBddd"  # service: game started, wave in progress, wave clear time, first wave start time, last countdown beep
+    "q"  # AI level of detail frame (-1 without AI LOD)
+    "ddddddB"  # player body: x, y, z, yaw, pitch, vertical velocity, grounded
+    "I"  # number of enemy rows that follow
+)
+# Enemy columns, each stored as one contiguous block of rows after the state
+ENEMY_COLUMNS = [
+    ("positions", "<f8", (3,)),
+    ("previous_positions", "<f8", (3,)),
+    ("velocities", "<f8", (2,)),
+    ("speeds", "<f8", ()),
+    ("health", "<i4", ()),
+    ("max_health", "<i4", ()),
+    ("last_attack_time", "<f8", ()),
+    ("last_hit_time", "<f8", ()),
+    ("facing", "<f8", ()),
+]
+ROW_SIZE = sum(np.dtype(dtype).itemsize * int(np.prod(shape)) for _, dtype, shape in ENEMY_COLUMNS)
+
+
+class PlayerBodyState:
+    """Player body transform and vertical motion, saved alongside the game state."""
+
+    def __init__(
+        self,
+        position: Tuple[float, float, float] = (0.0, 0.0, 0.0),
+        yaw: float = 0.0,
+        pitch: float = 0.0,
+        y_velocity: float = 0.0,
+        grounded: bool = True,
+    ):
+        self.position = tuple(position)
+        self.yaw = yaw
+        self.pitch = pitch
+        self.y_velocity = y_velocity
+        self.grounded = grounded
+
+
+def _optional_time(value: Optional[float]) -> float:
+    """Encode an optional time, None as NaN."""
+    return math.nan if value is None else value
+
+
+def _time_or_none(value: float) -> Optional[float]:
+    """Decode an optional time."""
+    return None if math.isnan(value) else value
+
+
+def save_game(game_service, body: PlayerBodyState) -> bytes:
+    """
+    Encode the full game state.
+
+    Args:
+        game_service: GameService to save (with its clock, player, weapon and wave manager)
+        body: Player body state from the infrastructure layer
+
+    Returns:
+        Snapshot bytes
+    """
+    wave_manager = game_service.wave_manager
+    swarm = wave_manager.swarm
+    rng_state = wave_manager.rng.bit_generator.state
+    if rng_state["bit_generator"] != "PCG64":
+        raise ValueError(f"cannot save a {rng_state['bit_generator']} spawn generator")
+
+    state = STATE.pack(
+        game_service.clock.now(),
+        game_service.player.max_health,
+        game_service.player.health,
+        game_service.player.kills,
+        game_service.weapon.last_fire_time,
+        wave_manager.current_wave,
+        wave_manager.enemies_spawned_this_wave,
+        wave_manager.reinforcements_remaining,
+        wave_manager.wave_enemy_speed,
+        rng_state["state"]["state"].to_bytes(16, "little"),
+        rng_state["state"]["inc"].to_bytes(16, "little"),
+        rng_state["has_uint32"],
+        rng_state["uinteger"],
+        game_service.game_started,
+        game_service.wave_in_progress,
+        _optional_time(game_service.wave_clear_time),
+        _optional_time(game_service.first_wave_start_time),
+        _optional_time(game_service.last_countdown_beep),
+        game_service.ai_lod.frame if game_service.ai_lod is not None else -1,
+        *body.position,
+        body.yaw,
+        body.pitch,
+        body.y_velocity,
+        body.grounded,
+        swarm.count,
+    )
+    parts = [HEADER.pack(MAGIC, VERSION), state]
+    for name, dtype, _ in ENEMY_COLUMNS:
+        parts.append(np.ascontiguousarray(getattr(swarm, name)[: swarm.count], dtype=dtype).tobytes())
+    return b"".join(parts)
+
+
+def load_game(game_service, data: bytes) -> PlayerBodyState:
+    """
+    Replace the game state with a snapshot.
+
+    Enemies alive before loading are dropped without on_enemy_death
+    callbacks (renderers should despawn everything first, as for a
+    restart); restored enemies are announced through on_enemy_spawn.
+
+    Args:
+        game_service: GameService built with the same configuration as the saved one
+        data: Bytes from save_game
+
+    Returns:
+        Player body state to apply in the infrastructure layer
+
+    Raises:
+        ValueError: If the data is not a complete snapshot of a supported version
+    """
+    if len(data) < HEADER.size + STATE.size:
+        raise ValueError("too short for a game snapshot")
+    magic, version = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("not a game snapshot")
+    if version != VERSION:
+        raise ValueError(f"snapshot version {version} is not supported (expected {VERSION})")
+    (
+        game_time,
+        max_health,
+        health,
+        kills,
+        last_fire_time,
+        current_wave,
+        enemies_spawned_this_wave,
+        reinforcements_remaining,
+        wave_enemy_speed,
+        rng_state,
+        rng_inc,
+        rng_has_uint32,
+        rng_uinteger,
+        game_started,
+        wave_in_progress,
+        wave_clear_time,
+        first_wave_start_time,
+        last_countdown_beep,
+        ai_lod_frame,
+        x,
+        y,
+        z,
+        yaw,
+        pitch,
+        y_velocity,
+        grounded,
+        count,
+    ) = STATE.unpack_from(data, HEADER.size)
+    if len(data) != HEADER.size + STATE.size + count * ROW_SIZE:
+        raise ValueError(f"snapshot of {count} enemies is truncated or has trailing data")
+
+    columns = {}
+    offset = HEADER.size + STATE.size
+    for name, dtype, shape in ENEMY_COLUMNS:
+        columns[name] = np.frombuffer(data, dtype=dtype, count=count * int(np.prod(shape)), offset=offset).reshape(
+            (count,) + shape
+        )
+        offset += columns[name].nbytes
+
+    wave_manager = game_service.wave_manager
+    game_service.enemies.clear()
+    wave_manager.swarm.clear()
+
+    game_service.clock.current_time = game_time
+    game_service.player.max_health = max_health
+    game_service.player.restore(health, kills)
+    game_service.weapon.last_fire_time = last_fire_time
+
+    wave_manager.current_wave = current_wave
+    wave_manager.enemies_spawned_this_wave = enemies_spawned_this_wave
+    wave_manager.reinforcements_remaining = reinforcements_remaining
+    wave_manager.wave_enemy_speed = wave_enemy_speed
+    wave_manager.rng.bit_generator.state = {
+        "bit_generator": "PCG64",
+        "state": {"state": int.from_bytes(rng_state, "little"), "inc": int.from_bytes(rng_inc, "little")},
+        "has_uint32": rng_has_uint32,
+        "uinteger": rng_uinteger,
+    }
+
+    game_service.game_started = bool(game_started)
+    game_service.wave_in_progress = bool(wave_in_progress)
+    game_service.wave_clear_time = _time_or_none(wave_clear_time)
+    game_service.first_wave_start_time = _time_or_none(first_wave_start_time)
+    game_service.last_countdown_beep = _time_or_none(last_countdown_beep)
+    if game_service.ai_lod is not None and ai_lod_frame >= 0:
+        game_service.ai_lod.frame = ai_lod_frame
+
+    enemies = wave_manager.swarm.add_rows(columns)
+    for enemy in enemies:
+        enemy.handle = game_service.enemies.add(enemy)
+    if game_service.on_enemy_spawn:
+        for enemy in enemies:
+            game_service.on_enemy_spawn(enemy)
+
+    return PlayerBodyState((x, y, z), yaw, pitch, y_velocity, bool(grounded))
+
+
+def save_game_file(path: str, game_service, body: PlayerBodyState) -> None:
+    """
+    Write a snapshot to a file, replacing it only once the new one is complete.
+
+    Args:
+        path: File to write
+        game_service: GameService to save
+        body: Player body state
+    """
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as file:
+        file.write(save_game(game_service, body))
+    os.replace(temporary, path)
+
+
+def load_game_file(path: str, game_service) -> PlayerBodyState:
+    """
+    Replace the game state with a snapshot file.
+
+    Args:
+        path: File written by save_game_file
+        game_service: GameService to restore into
+
+    Returns:
+        Player body state to apply
+    """
+    with open(path, "rb") as file:
+        return load_game(game_service, file.read())
@@ -0,0 +1,16 @@
+"""Simulation in a worker process."""
+
+from .shared_state import SharedGameState, GameStateSnapshot
+from .command_ring import CommandRing
+from .sim_worker import SimWorker, Command
+from .remote_game_service import RemoteGameService, RemoteClock
+
+__all__ = [
+    "SharedGameState",
+    "GameStateSnapshot",
+    "CommandRing",
+    "SimWorker",
+    "Command",
+    "RemoteGameService",
+    "RemoteClock",
+]
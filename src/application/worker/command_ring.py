@@ -0,0 +1,133 @@
+"""Single-producer single-consumer command queue in shared memory."""
+
+from collections import deque
+from multiprocessing import shared_memory
+from typing import Deque, Optional, Tuple
+import numpy as np
+from .shared_state import attach_shared_memory, require_store_order
+
+SLOT_WIDTH = 8  # float64 values per command: code followed by up to 7 arguments
+
+# Counter slots
+HEAD = 0  # commands pushed, written only by the producer
+TAIL = 1  # commands popped, written only by the consumer
+
+
+class CommandRing:
+    """
+    Fixed-size ring of commands passed from one process to another without locks.
+    Application layer - engine agnostic.
+
+    The producer writes a slot and then advances head; the consumer reads
+    the slot at tail and then advances tail. Each counter has a single
+    writer, so neither side ever waits on the other. A full ring rejects
+    new commands instead of overwriting unread ones; commands that must
+    not be lost go through send(), which holds them back in the producer
+    until flush() finds room. Like SharedGameState, it relies on stores
+    becoming visible in program order, so it is only created on x86.
+    """
+
+    def __init__(self, block: shared_memory.SharedMemory, slots: int, owner: bool):
+        """
+        Wrap a shared memory block (use create() or attach()).
+
+        Args:
+            block: Shared memory holding the ring
+            slots: Number of command slots
+            owner: True in the process that created the block and unlinks it
+        """
+        self.block = block
+        self.slot_count = slots
+        self.owner = owner
+        self.counters = np.ndarray((2,), dtype=np.int64, buffer=block.buf)
+        self.slots = np.ndarray((slots, SLOT_WIDTH), dtype=np.float64, buffer=block.buf, offset=16)
+        self.backlog: Deque[Tuple[int, Tuple[float, ...]]] = deque()  # sent commands the ring had no room for yet
+
+    @classmethod
+    def create(cls, slots: int = 256) -> "CommandRing":
+        """Allocate a new empty ring."""
+        require_store_order()
+        block = shared_memory.SharedMemory(create=True, size=16 + slots * SLOT_WIDTH * 8)
+        return cls(block, slots, owner=True)
+
+    @classmethod
+    def attach(cls, name: str, slots: int) -> "CommandRing":
+        """Open a ring created by another process."""
+        require_store_order()
+        return cls(attach_shared_memory(name), slots, owner=False)
+
+    @property
+    def name(self) -> str:
+        """Name other processes attach with."""
+        return self.block.name
+
+    def push(self, code: int, *args: float) -> bool:
+        """
+        Queue a command (producer process only).
+
+        Args:
+            code: Command code
+            args: Up to SLOT_WIDTH - 1 numeric arguments
+
+        Returns:
+            False if the ring is full and the command was dropped
+        """
+        head = int(self.counters[HEAD])
+        if head - int(self.counters[TAIL]) >= self.slot_count:
+            return False
+        slot = self.slots[head % self.slot_count]
+        slot[0] = code
+        slot[1 : 1 + len(args)] = args
+        self.counters[HEAD] = head + 1
+        return True
+
+    @property
+    def free_slots(self) -> int:
+        """Slots the producer can push into right now."""
+        return self.slot_count - (int(self.counters[HEAD]) - int(self.counters[TAIL]))
+
+    def send(self, code: int, *args: float) -> None:
+        """
+        Queue a command that must arrive (producer process only).
+
+        Commands are delivered in the order they were sent; while the ring
+        is full they wait in the backlog for flush().
+
+        Args:
+            code: Command code
+            args: Up to SLOT_WIDTH - 1 numeric arguments
+        """
+        self.backlog.append((code, args))
+        self.flush()
+
+    def flush(self) -> int:
+        """
+        Move held-back commands into the ring while it has room (producer process only).
+
+        Returns:
+            Number of commands still held back
+        """
+        while self.backlog and self.push(self.backlog[0][0], *self.backlog[0][1]):
+            self.backlog.popleft()
+        return len(self.backlog)
+
+    def pop(self) -> Optional[np.ndarray]:
+        """
+        Take the oldest command (consumer process only).
+
+        Returns:
+            Copy of the slot (code, then arguments), or None if the ring is empty
+        """
+        tail = int(self.counters[TAIL])
+        if tail == int(self.counters[HEAD]):
+            return None
+        command = self.slots[tail % self.slot_count].copy()
+        self.counters[TAIL] = tail + 1
+        return command
+
+    def close(self) -> None:
+        """Release this process's mapping, and free the block if this process created it."""
+        self.counters = self.slots = None  # views must go before the mapping can close
+        self.block.close()
+        if self.owner:
+            self.block.unlink()
@@ -0,0 +1,298 @@
+"""Render-process stand-in for GameService when the simulation runs in a worker process."""
+
+import atexit
+import subprocess
+import time
+from typing import Callable, List, Optional, Tuple
+
+from domain.clock import GameClock
+from domain.entities import Enemy, Weapon
+from application.profiling import FrameProfiler
+from .command_ring import CommandRing
+from .shared_state import GameStateSnapshot, SharedGameState
+from .sim_worker import Command
+
+
+class RemoteClock(GameClock):
+    """
+    Render-process game clock that mirrors pause and speed changes to the worker.
+    Application layer - engine agnostic.
+
+    It still times local things (weapon fire rate, player movement); the
+    worker's clock is the one enemies and waves run on.
+    """
+
+    def __init__(self, commands: CommandRing, time_scale: float = 1.0, max_frame_time: float = 0.25):
+        """
+        Initialize clock.
+
+        Args:
+            commands: Ring to the worker
+            time_scale: Simulation seconds per real second
+            max_frame_time: Longest real frame time accepted by tick(), in seconds
+        """
+        self.commands = commands
+        super().__init__(time_scale, max_frame_time)
+
+    @property
+    def time_scale(self) -> float:
+        """Simulation speed multiplier, clamped to [MIN_TIME_SCALE, MAX_TIME_SCALE]."""
+        return self._time_scale
+
+    @time_scale.setter
+    def time_scale(self, value: float) -> None:
+        GameClock.time_scale.fset(self, value)
+        self.commands.send(Command.SET_TIME_SCALE, self._time_scale)
+
+    def pause(self) -> None:
+        """Stop time from advancing here and in the worker."""
+        super().pause()
+        self.commands.send(Command.SET_PAUSED, 1)
+
+    def resume(self) -> None:
+        """Let time advance here and in the worker again."""
+        super().resume()
+        self.commands.send(Command.SET_PAUSED, 0)
+
+    def toggle_pause(self) -> None:
+        """Switch between paused and running, here and in the worker."""
+        super().toggle_pause()
+        self.commands.send(Command.SET_PAUSED, int(self.paused))
+
+
+class RemoteWaveView:
+    """Read-only view of the worker's wave state, exposing what renderers read from WaveManager."""
+
+    def __init__(self, snapshot: GameStateSnapshot):
+        self.swarm = snapshot
+
+    @property
+    def current_wave(self) -> int:
+        return self.swarm.get("wave")
+
+
+class RemotePlayerView:
+    """Read-only view of the worker's player state, exposing what renderers read from Player."""
+
+    def __init__(self, snapshot: GameStateSnapshot):
+        self.snapshot = snapshot
+
+    @property
+    def health(self) -> int:
+        return self.snapshot.get("player_health")
+
+    @property
+    def kills(self) -> int:
+        return self.snapshot.get("player_kills")
+
+    @property
+    def is_alive(self) -> bool:
+        return self.health > 0
+
+
+class RemoteGameService:
+    """
+    Drop-in for GameService in the render process while a SimWorker runs the game.
+    Application layer - engine agnostic.
+
+    Each update forwards the player position and reads the newest published
+    state; HUD, renderers and input read it through the same attributes
+    they use on GameService. Shots are gated by the local weapon and sent
+    to the worker, which resolves hits against its own enemies. Player
+    hits, countdown beeps and death are replayed from the worker's event
+    counters through the usual callbacks.
+    """
+
+    def __init__(
+        self,
+        weapon: Weapon,
+        clock: RemoteClock,
+        capacity: int = 4096,
+        rate: float = 60.0,
+        profiler: Optional[FrameProfiler] = None,
+    ):
+        """
+        Initialize remote service and allocate the shared state.
+
+        Args:
+            weapon: Local weapon gating the fire rate (timed by clock)
+            clock: Clock forwarding pause and speed changes through its command ring
+            capacity: Most enemies the shared state holds
+            rate: Worker simulation steps per game second
+            profiler: Profiler receiving worker counters
+        """
+        self.weapon = weapon
+        self.clock = clock
+        self.commands = clock.commands
+        self.capacity = capacity
+        self.rate = rate
+        self.profiler = profiler or FrameProfiler()
+
+        self.state = SharedGameState.create(capacity)
+        self.snapshot = GameStateSnapshot(capacity)
+        self.wave_manager = RemoteWaveView(self.snapshot)
+        self.player = RemotePlayerView(self.snapshot)
+        self.process: Optional[subprocess.Popen] = None
+        self.player_renderer = None  # Will be set by infrastructure
+
+        self.epoch = 0
+        self._snapshot_time = time.perf_counter()
+        self._seen_hits = 0
+        self._seen_damage = 0
+        self._seen_beeps = 0
+        self._death_reported = False
+
+        # Callbacks for infrastructure layer (enemy callbacks are never called: enemies are drawn from the snapshot)
+        self.on_enemy_spawn: Optional[Callable[[Enemy], None]] = None
+        self.on_enemy_death: Optional[Callable[[Enemy], None]] = None
+        self.on_enemy_damaged: Optional[Callable[[Enemy], None]] = None
+        self.on_wave_start: Optional[Callable[[int], None]] = None
+        self.on_player_death: Optional[Callable[[], None]] = None
+        self.on_player_damaged: Optional[Callable[[int], None]] = None
+        self.on_countdown_beep: Optional[Callable[[], None]] = None
+        self.on_restart_requested: Optional[Callable[[], None]] = None
+        self.on_retry_wave_requested: Optional[Callable[[], None]] = None
+        self.on_step_requested: Optional[Callable[[], None]] = None
+
+    def start_worker(self, command: List[str]) -> None:
+        """
+        Launch the worker process.
+
+        Args:
+            command: Program and arguments running the worker; shared memory names are appended
+        """
+        self.process = subprocess.Popen(
+            command
+            + [
+                "--state",
+                self.state.name,
+                "--commands",
+                self.commands.name,
+                "--capacity",
+                str(self.capacity),
+                "--command-slots",
+                str(self.commands.slot_count),
+            ]
+        )
+        atexit.register(self.stop_worker)
+
+    def stop_worker(self, timeout: float = 2.0) -> None:
+        """
+        Stop the worker and free the shared memory.
+
+        Args:
+            timeout: Seconds to wait for the worker to quit before killing it
+        """
+        if self.process is None:
+            return
+        deadline = time.perf_counter() + timeout
+        self.commands.send(Command.QUIT)
+        while self.commands.flush() and self.process.poll() is None and time.perf_counter() < deadline:
+            time.sleep(0.001)  # QUIT is held back behind a full ring; the worker is draining it
+        try:
+            self.process.wait(max(0.0, deadline - time.perf_counter()))
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        self.process = None
+        self.state.close()
+        self.commands.close()
+
+    def start_game(self) -> None:
+        """Start a new game in the worker; state of the previous game is ignored from now on."""
+        self.epoch += 1
+        self._seen_hits = 0
+        self._seen_damage = 0
+        self._seen_beeps = 0
+        self._death_reported = False
+        self.snapshot.count = 0
+        self.commands.send(Command.RESTART, self.epoch)
+
+    @property
+    def enemies_remaining(self) -> int:
+        """Enemies left to kill this wave, as last published."""
+        return self.snapshot.get("enemies_remaining")
+
+    @property
+    def alpha(self) -> float:
+        """Interpolation factor for the snapshot's positions, estimated from the time since it arrived."""
+        if self.clock.paused:
+            return 1.0
+        elapsed = (time.perf_counter() - self._snapshot_time) * self.rate * self.clock.time_scale
+        return min(1.0, elapsed)
+
+    def update(self, delta_time: float) -> None:
+        """
+        Send the player position and pick up the worker's latest state.
+
+        Args:
+            delta_time: Game seconds since last update; while paused, the worker advances by this much
+        """
+        # Held-back commands go first; the position only uses spare room, as the next frame's supersedes it
+        self.commands.flush()
+        body = self.player_renderer
+        if body is not None and not self.commands.backlog and self.commands.free_slots > self.commands.slot_count // 2:
+            self.commands.push(Command.PLAYER_POSITION, body.x, body.y, body.z)
+        if self.clock.paused and delta_time > 0:
+            self.commands.send(Command.STEP, delta_time)
+        self.poll()
+
+    def poll(self) -> None:
+        """Read the newest published state and fire callbacks for events it contains."""
+        if not self.state.read(self.snapshot):
+            return
+        self._snapshot_time = time.perf_counter()
+        snapshot = self.snapshot
+        if snapshot.get("epoch") != self.epoch:
+            snapshot.count = 0  # worker has not picked up the restart yet
+            return
+
+        self.profiler.counter("worker.step_ms", snapshot.get("step_ms"))
+        self.profiler.counter("worker.enemies", snapshot.count)
+
+        hits = snapshot.get("player_hits")
+        if hits > self._seen_hits:
+            damage = snapshot.get("player_damage")
+            if self.on_player_damaged:
+                self.on_player_damaged(damage - self._seen_damage)
+            self._seen_hits = hits
+            self._seen_damage = damage
+
+        beeps = snapshot.get("countdown_beeps")
+        if self.on_countdown_beep:
+            for _ in range(beeps - self._seen_beeps):
+                self.on_countdown_beep()
+        self._seen_beeps = beeps
+
+        if snapshot.get("game_over") and not self._death_reported:
+            self._death_reported = True
+            if self.on_player_death:
+                self.on_player_death()
+
+    def handle_shoot_attempt(self) -> bool:
+        """
+        Try to fire weapon.
+
+        Returns:
+            True if weapon fired
+        """
+        if not self.player.is_alive or self.clock.paused:
+            return False
+
+        if self.weapon.can_fire():
+            self.weapon.fire()
+            return True
+        return False
+
+    def forward_shot(
+        self, origin: Tuple[float, float, float], direction: Tuple[float, float, float], max_distance: float
+    ) -> None:
+        """
+        Have the worker resolve a fired shot against its enemies.
+
+        Args:
+            origin: Ray origin (x, y, z)
+            direction: Normalized ray direction (x, y, z)
+            max_distance: Maximum hit distance
+        """
+        self.commands.send(Command.SHOOT, *origin, *direction, max_distance)
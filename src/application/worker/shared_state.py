@@ -0,0 +1,278 @@
+"""Game state snapshot shared between processes, guarded by a sequence lock."""
+
+import platform
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+# Integer header slots
+INT_FIELDS = {
+    "sequence": 0,  # odd while the writer is publishing
+    "tick": 1,
+    "epoch": 2,  # restart counter the state belongs to
+    "wave": 3,
+    "enemies_remaining": 4,
+    "player_health": 5,
+    "player_kills": 6,
+    "game_over": 7,
+    "player_hits": 8,  # cumulative since the epoch started
+    "player_damage": 9,  # cumulative since the epoch started
+    "countdown_beeps": 10,  # cumulative since the epoch started
+    "enemy_count": 11,
+}
+INT_SLOTS = 16
+
+# Float header slots
+FLOAT_FIELDS = {
+    "game_time": 0,
+    "step_ms": 1,  # worker time per simulation step, averaged over the last publish
+}
+FLOAT_SLOTS = 8
+
+# Per-enemy columns published from the swarm
+ENEMY_COLUMNS: List[Tuple[str, type, Tuple[int, ...]]] = [
+    ("positions", np.float64, (3,)),
+    ("previous_positions", np.float64, (3,)),
+    ("facing", np.float64, ()),
+    ("health", np.int32, ()),
+    ("max_health", np.int32, ()),
+    ("last_hit_time", np.float64, ()),
+]
+
+MAX_READ_ATTEMPTS = 8  # copies a read makes before giving up when the writer keeps overtaking it
+MAX_READ_WAIT = 0.002  # seconds a read yields to a writer that is mid-publish before giving up
+
+# Machines whose stores become visible to other cores in program order (total store order)
+STORE_ORDERED_MACHINES = {"x86_64", "amd64", "i386", "i686", "x86"}
+
+
+def require_store_order() -> None:
+    """
+    Refuse to set up lock-free shared state on a machine that may reorder stores.
+
+    The sequence lock and the command ring publish data and then a counter
+    with plain stores, and Python has no portable memory fence. Without
+    x86 store ordering a reader could see the new counter before the data.
+
+    Raises:
+        RuntimeError: If this machine is not known to keep store order
+    """
+    machine = platform.machine().lower()
+    if machine not in STORE_ORDERED_MACHINES:
+        raise RuntimeError(
+            f"The simulation worker needs x86 store ordering, which {machine or 'this machine'} does not guarantee; "
+            "set GameConfig.SIM_WORKER = False"
+        )
+
+
+def attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """
+    Open a shared memory block created by another process.
+
+    Before Python 3.13 attaching also registers the block with this
+    process's resource tracker, which would unlink it when this process
+    exits; only the creating process owns the block, so the registration is
+    undone.
+
+    Args:
+        name: Name of the block
+
+    Returns:
+        Attached SharedMemory
+    """
+    block = shared_memory.SharedMemory(name=name)
+    resource_tracker.unregister(block._name, "shared_memory")
+    return block
+
+
+def _layout(capacity: int) -> Tuple[Dict[str, Tuple[int, type, Tuple[int, ...]]], int]:
+    """Byte offset, dtype and shape of every array in the block, and the block size."""
+    arrays = [("ints", np.int64, (INT_SLOTS,)), ("floats", np.float64, (FLOAT_SLOTS,))]
+    arrays += [(name, dtype, (capacity,) + shape) for name, dtype, shape in ENEMY_COLUMNS]
+    layout = {}
+    offset = 0
+    for name, dtype, shape in arrays:
+        layout[name] = (offset, dtype, shape)
+        size = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        offset += (size + 7) // 8 * 8
+    return layout, offset
+
+
+class GameStateSnapshot:
+    """
+    Private copy of the shared game state, readable like an EnemySwarm.
+    Application layer - engine agnostic.
+
+    The first `count` rows of the enemy columns are the live enemies, so
+    renderers that draw straight from swarm arrays can draw a snapshot.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Initialize empty snapshot.
+
+        Args:
+            capacity: Most enemies the snapshot holds
+        """
+        self.sequence = -1
+        self.count = 0
+        self.ints = np.zeros(INT_SLOTS, dtype=np.int64)
+        self.floats = np.zeros(FLOAT_SLOTS, dtype=np.float64)
+        for name, dtype, shape in ENEMY_COLUMNS:
+            setattr(self, name, np.zeros((capacity,) + shape, dtype=dtype))
+
+    def get(self, field: str) -> float:
+        """Header value by name (see INT_FIELDS and FLOAT_FIELDS)."""
+        if field in INT_FIELDS:
+            return int(self.ints[INT_FIELDS[field]])
+        return float(self.floats[FLOAT_FIELDS[field]])
+
+    def now(self) -> float:
+        """Worker game time the snapshot was taken at, so hit times can be aged like with a GameClock."""
+        return float(self.floats[FLOAT_FIELDS["game_time"]])
+
+    def swap(self, other: "GameStateSnapshot") -> None:
+        """Exchange contents with another snapshot of the same capacity without copying."""
+        for name in ["sequence", "count", "ints", "floats"] + [name for name, _, _ in ENEMY_COLUMNS]:
+            value = getattr(self, name)
+            setattr(self, name, getattr(other, name))
+            setattr(other, name, value)
+
+    def interpolated_positions(self, alpha: float) -> np.ndarray:
+        """
+        Live rows' positions blended between the previous and the last step.
+
+        Args:
+            alpha: 0 gives the positions before the last step, 1 the current ones
+
+        Returns:
+            Array of shape (count, 3)
+        """
+        previous = self.previous_positions[: self.count]
+        return previous + (self.positions[: self.count] - previous) * alpha
+
+
+class SharedGameState:
+    """
+    Game state published by one writer process and read by another.
+    Application layer - engine agnostic.
+
+    A sequence lock guards the block: the writer makes the sequence number
+    odd, writes, then makes it even again. A reader copies everything and
+    keeps the copy only if the sequence was even and unchanged across the
+    copy, so the writer never waits and readers never see a torn state.
+    Copies go to a scratch snapshot that is swapped in once validated, so
+    a failed read leaves the caller's snapshot untouched.
+    The protocol relies on the stores of each process becoming visible in
+    program order, which holds on x86; create() and attach() refuse other
+    machines (see require_store_order).
+    """
+
+    def __init__(self, block: shared_memory.SharedMemory, capacity: int, owner: bool):
+        """
+        Wrap a shared memory block (use create() or attach()).
+
+        Args:
+            block: Shared memory holding the state
+            capacity: Most enemies the state holds
+            owner: True in the process that created the block and unlinks it
+        """
+        self.block = block
+        self.capacity = capacity
+        self.owner = owner
+        self._scratch: Optional[GameStateSnapshot] = None  # read target, swapped with the caller's once valid
+        layout, _ = _layout(capacity)
+        for name, (offset, dtype, shape) in layout.items():
+            setattr(self, name, np.ndarray(shape, dtype=dtype, buffer=block.buf, offset=offset))
+
+    @classmethod
+    def create(cls, capacity: int) -> "SharedGameState":
+        """Allocate a new zeroed state block."""
+        require_store_order()
+        _, size = _layout(capacity)
+        return cls(shared_memory.SharedMemory(create=True, size=size), capacity, owner=True)
+
+    @classmethod
+    def attach(cls, name: str, capacity: int) -> "SharedGameState":
+        """Open a state block created by another process."""
+        require_store_order()
+        return cls(attach_shared_memory(name), capacity, owner=False)
+
+    @property
+    def name(self) -> str:
+        """Name other processes attach with."""
+        return self.block.name
+
+    def publish(self, swarm, **fields) -> None:
+        """
+        Write a new state (writer process only).
+
+        Args:
+            swarm: EnemySwarm whose live rows are published (extra rows beyond capacity are dropped)
+            fields: Header values by name (see INT_FIELDS and FLOAT_FIELDS)
+        """
+        sequence = int(self.ints[INT_FIELDS["sequence"]])
+        self.ints[INT_FIELDS["sequence"]] = sequence + 1
+
+        count = min(swarm.count, self.capacity)
+        for name, _, _ in ENEMY_COLUMNS:
+            getattr(self, name)[:count] = getattr(swarm, name)[:count]
+        self.ints[INT_FIELDS["enemy_count"]] = count
+        for field, value in fields.items():
+            if field in INT_FIELDS:
+                self.ints[INT_FIELDS[field]] = value
+            else:
+                self.floats[FLOAT_FIELDS[field]] = value
+
+        self.ints[INT_FIELDS["sequence"]] = sequence + 2
+
+    def read(self, snapshot: GameStateSnapshot) -> bool:
+        """
+        Copy the latest complete state into a snapshot.
+
+        Args:
+            snapshot: Snapshot to fill
+
+        Returns:
+            True if the snapshot now holds a newer state (on False it is unchanged)
+        """
+        if self._scratch is None:
+            self._scratch = GameStateSnapshot(self.capacity)
+        scratch = self._scratch
+        deadline = None
+        attempts = 0
+        while attempts < MAX_READ_ATTEMPTS:
+            sequence = int(self.ints[INT_FIELDS["sequence"]])
+            if sequence == snapshot.sequence:
+                return False
+            if sequence & 1:
+                # Writer is mid-publish: yield to it instead of spending attempts
+                if deadline is None:
+                    deadline = time.perf_counter() + MAX_READ_WAIT
+                elif time.perf_counter() > deadline:
+                    return False
+                time.sleep(0)
+                continue
+
+            attempts += 1
+            scratch.ints[:] = self.ints
+            scratch.floats[:] = self.floats
+            count = min(int(scratch.ints[INT_FIELDS["enemy_count"]]), self.capacity)
+            for name, _, _ in ENEMY_COLUMNS:
+                getattr(scratch, name)[:count] = getattr(self, name)[:count]
+
+            if int(self.ints[INT_FIELDS["sequence"]]) == sequence:
+                scratch.sequence = sequence
+                scratch.count = count
+                snapshot.swap(scratch)
+                return True
+        return False
+
+    def close(self) -> None:
+        """Release this process's mapping, and free the block if this process created it."""
+        for name in _layout(self.capacity)[0]:
+            setattr(self, name, None)  # views must go before the mapping can close
+        self.block.close()
+        if self.owner:
+            self.block.unlink()
@@ -0,0 +1,179 @@
+"""Simulation loop run in a worker process."""
+
+import os
+import time
+
+from domain.clock import FixedTimestep
+from domain.combat import HitscanResolver
+from application.simulation.headless_runner import HeadlessPlayerBody
+from .command_ring import CommandRing
+from .shared_state import SharedGameState
+
+
+class Command:
+    """Codes of the commands the render process sends to the worker, with their arguments."""
+
+    PLAYER_POSITION = 1  # x, y, z
+    SHOOT = 2  # origin x, y, z, direction x, y, z, range
+    RESTART = 3  # epoch
+    SET_PAUSED = 4  # 0 or 1
+    SET_TIME_SCALE = 5  # time scale
+    STEP = 6  # game seconds to advance while paused
+    QUIT = 7
+
+
+class SimWorker:
+    """
+    Runs GameService at a fixed rate and publishes its state to shared memory.
+    Application layer - engine agnostic.
+
+    The render process never touches the simulation directly: it sends
+    commands through a CommandRing and reads SharedGameState. Events the
+    render process reacts to (player hits, countdown beeps, death) are
+    published as counters so none is lost between two reads.
+    """
+
+    def __init__(
+        self,
+        game_service,
+        hitscan: HitscanResolver,
+        state: SharedGameState,
+        commands: CommandRing,
+        rate: float = 60.0,
+        max_steps: int = 5,
+    ):
+        """
+        Initialize worker.
+
+        Args:
+            game_service: GameService to run (its clock is driven by the worker)
+            hitscan: Resolver for shots forwarded by the render process
+            state: Shared state to publish into
+            commands: Ring of commands from the render process
+            rate: Simulation steps per game second
+            max_steps: Most steps run per loop iteration; time beyond that is dropped
+        """
+        self.game_service = game_service
+        self.clock = game_service.clock
+        self.hitscan = hitscan
+        self.state = state
+        self.commands = commands
+        self.timestep = FixedTimestep(rate, max_steps)
+        self.player_body = HeadlessPlayerBody(0.0, 0.5, 0.0)
+        self.game_service.player_renderer = self.player_body
+        self.running = False
+
+        self.tick = 0
+        self.epoch = 0
+        self.player_hits = 0
+        self.player_damage = 0
+        self.countdown_beeps = 0
+        self.game_over = False
+        self.step_ms = 0.0
+
+        self.game_service.on_player_damaged = self._on_player_damaged
+        self.game_service.on_countdown_beep = self._on_countdown_beep
+        self.game_service.on_player_death = self._on_player_death
+
+    def _on_player_damaged(self, damage: int) -> None:
+        self.player_hits += 1
+        self.player_damage += damage
+
+    def _on_countdown_beep(self) -> None:
+        self.countdown_beeps += 1
+
+    def _on_player_death(self) -> None:
+        self.game_over = True
+
+    def restart(self, epoch: int) -> None:
+        """
+        Start a new game whose state is published under a new epoch.
+
+        Args:
+            epoch: Restart counter of the render process
+        """
+        self.epoch = epoch
+        self.player_hits = 0
+        self.player_damage = 0
+        self.countdown_beeps = 0
+        self.game_over = False
+        self.game_service.start_game()
+        self.publish()
+
+    def publish(self) -> None:
+        """Write the current game state to shared memory."""
+        game_service = self.game_service
+        self.state.publish(
+            game_service.wave_manager.swarm,
+            tick=self.tick,
+            epoch=self.epoch,
+            wave=game_service.wave_manager.current_wave,
+            enemies_remaining=game_service.enemies_remaining,
+            player_health=game_service.player.health,
+            player_kills=game_service.player.kills,
+            game_over=int(self.game_over),
+            player_hits=self.player_hits,
+            player_damage=self.player_damage,
+            countdown_beeps=self.countdown_beeps,
+            game_time=self.clock.now(),
+            step_ms=self.step_ms,
+        )
+
+    def step(self, delta_time: float) -> None:
+        """Advance the game by one step."""
+        self.game_service.update(self.clock.step(delta_time))
+        self.tick += 1
+
+    def handle_command(self, command) -> None:
+        """
+        Apply one command from the render process.
+
+        Args:
+            command: Command code followed by its arguments
+        """
+        code = int(command[0])
+        if code == Command.PLAYER_POSITION:
+            self.player_body.x, self.player_body.y, self.player_body.z = command[1:4]
+        elif code == Command.SHOOT:
+            # The render process has already gated the shot on the weapon's fire rate
+            result = self.hitscan.cast(tuple(command[1:4]), tuple(command[4:7]), command[7])
+            if result.enemy is not None:
+                self.game_service.handle_enemy_hit(result.enemy)
+        elif code == Command.RESTART:
+            self.restart(int(command[1]))
+        elif code == Command.SET_PAUSED:
+            self.clock.paused = bool(command[1])
+        elif code == Command.SET_TIME_SCALE:
+            self.clock.time_scale = command[1]
+        elif code == Command.STEP:
+            self.step(command[1])
+            self.publish()
+        elif code == Command.QUIT:
+            self.running = False
+
+    def run(self) -> None:
+        """Step and publish until told to quit or the render process goes away."""
+        parent = os.getppid()
+        step_time = self.timestep.step_time
+        self.running = True
+        last = time.perf_counter()
+        while self.running:
+            command = self.commands.pop()
+            while command is not None and self.running:
+                self.handle_command(command)
+                command = self.commands.pop()
+
+            now = time.perf_counter()
+            steps = self.timestep.advance(self.clock.frame_delta(now - last))
+            last = now
+            if steps:
+                for _ in range(steps):
+                    self.step(step_time)
+                self.step_ms = (time.perf_counter() - now) * 1000.0 / steps
+                self.publish()
+
+            if os.getppid() != parent:
+                break  # orphaned: the render process died without sending QUIT
+            # Sleep until the next step is due (in real time), waking early enough to read commands
+            wait = (step_time - self.timestep.accumulator) / self.clock.time_scale
+            time.sleep(max(0.0, min(wait, step_time)) if not self.clock.paused else step_time)
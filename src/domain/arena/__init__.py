@@ -0,0 +1,5 @@
+"""Arena geometry."""
+
+from .arena_geometry import Box, ArenaGeometry
+
+__all__ = ["Box", "ArenaGeometry"]
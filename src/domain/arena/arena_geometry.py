@@ -0,0 +1,276 @@
+"""Static arena geometry and analytic collision queries - pure Python domain logic."""
+
+import math
+from typing import List, Optional, Tuple
+import numpy as np
+
+
+class Box:
+    """
+    Axis-aligned box given by its min and max corners.
+    Pure Python - no engine dependencies.
+    """
+
+    def __init__(self, min_corner: Tuple[float, float, float], max_corner: Tuple[float, float, float]):
+        self.min_x, self.min_y, self.min_z = min_corner
+        self.max_x, self.max_y, self.max_z = max_corner
+
+    @classmethod
+    def from_center(cls, center: Tuple[float, float, float], size: Tuple[float, float, float]) -> "Box":
+        """Create box from center point and full size."""
+        half = (size[0] / 2, size[1] / 2, size[2] / 2)
+        return cls(
+            (center[0] - half[0], center[1] - half[1], center[2] - half[2]),
+            (center[0] + half[0], center[1] + half[1], center[2] + half[2]),
+        )
+
+    @property
+    def center(self) -> Tuple[float, float, float]:
+        """Center point (x, y, z)."""
+        return ((self.min_x + self.max_x) / 2, (self.min_y + self.max_y) / 2, (self.min_z + self.max_z) / 2)
+
+    @property
+    def size(self) -> Tuple[float, float, float]:
+        """Full size (x, y, z)."""
+        return (self.max_x - self.min_x, self.max_y - self.min_y, self.max_z - self.min_z)
+
+    def contains_xz(self, x: float, z: float) -> bool:
+        """Check if a point lies inside the box footprint."""
+        return self.min_x <= x <= self.max_x and self.min_z <= z <= self.max_z
+
+
+class ArenaGeometry:
+    """
+    Known static arena: a square ground plane plus solid boxes (walls and cover).
+    Pure Python - no engine dependencies.
+
+    Answers the collision queries a first-person controller needs - ground
+    height, ceiling height and circle-vs-box push-out - analytically, so
+    their cost depends only on the number of static boxes.
+    """
+
+    def __init__(self, ground_size: float, boxes: List[Box], ground_y: float = 0.0):
+        """
+        Initialize geometry.
+
+        Args:
+            ground_size: Edge length of the square ground plane centered on the origin
+            boxes: Solid static boxes
+            ground_y: Height of the ground plane
+        """
+        self.ground_half_size = ground_size / 2
+        self.ground_y = ground_y
+        self.boxes = boxes
+
+    @classmethod
+    def build_square(
+        cls,
+        arena_size: float,
+        wall_height: float,
+        wall_thickness: float = 1.0,
+        cover_count: int = 0,
+        cover_size: float = 3.0,
+        cover_height: float = 2.0,
+        cover_gap: float = 3.0,
+        clear_radius: float = 8.0,
+        seed: Optional[int] = None,
+    ) -> "ArenaGeometry":
+        """
+        Square arena with four perimeter walls centered on the ground edges and optional interior cover.
+
+        Cover boxes are placed on a jittered grid: the interior is tiled into
+        cells of cover_size + cover_gap, each chosen cell holds one box of
+        random footprint, so boxes are at least cover_gap apart from each
+        other and from the walls. Cells near the origin (the player spawn)
+        are left empty.
+
+        Args:
+            arena_size: Size of the arena (square)
+            wall_height: Height of the walls
+            wall_thickness: Thickness of the walls
+            cover_count: Number of cover boxes (fewer if the interior cannot hold them)
+            cover_size: Largest footprint edge of a cover box (the smallest is half of it)
+            cover_height: Height of the cover boxes
+            cover_gap: Minimum free space between cover boxes and walls
+            clear_radius: Radius around the origin kept free of cover
+            seed: Seed for cover placement (None for a random layout)
+
+        Returns:
+            ArenaGeometry with walls ordered north, south, east, west, followed by the cover boxes
+        """
+        half_size = arena_size / 2
+        y = wall_height / 2
+        walls = [
+            Box.from_center((0, y, half_size), (arena_size, wall_height, wall_thickness)),
+            Box.from_center((0, y, -half_size), (arena_size, wall_height, wall_thickness)),
+            Box.from_center((half_size, y, 0), (wall_thickness, wall_height, arena_size)),
+            Box.from_center((-half_size, y, 0), (wall_thickness, wall_height, arena_size)),
+        ]
+        if cover_count > 0:
+            inner = half_size - wall_thickness / 2 - cover_gap / 2
+            walls += cls._place_cover(inner, cover_count, cover_size, cover_height, cover_gap, clear_radius, seed)
+        return cls(arena_size, walls)
+
+    @staticmethod
+    def _place_cover(
+        inner: float,
+        count: int,
+        size: float,
+        height: float,
+        gap: float,
+        clear_radius: float,
+        seed: Optional[int],
+    ) -> List[Box]:
+        """Jittered-grid cover boxes inside [-inner, inner] on both axes."""
+        cells_per_side = int(2 * inner // (size + gap))
+        if cells_per_side < 1:
+            return []
+        cell = 2 * inner / cells_per_side
+        centers = -inner + (np.arange(cells_per_side) + 0.5) * cell
+        cx = np.repeat(centers, cells_per_side)
+        cz = np.tile(centers, cells_per_side)
+
+        # Keep whole cells outside the clear radius
+        reach = clear_radius + cell / math.sqrt(2)
+        candidates = np.flatnonzero(cx * cx + cz * cz >= reach * reach)
+        rng = np.random.default_rng(seed)
+        chosen = rng.choice(candidates, min(count, len(candidates)), replace=False)
+
+        widths = rng.uniform(size / 2, size, len(chosen))
+        depths = rng.uniform(size / 2, size, len(chosen))
+        # Jitter inside the cell, keeping gap / 2 to every cell edge
+        xs = cx[chosen] + (rng.random(len(chosen)) - 0.5) * (cell - gap - widths)
+        zs = cz[chosen] + (rng.random(len(chosen)) - 0.5) * (cell - gap - depths)
+        return [
+            Box.from_center((float(x), height / 2, float(z)), (float(w), height, float(d)))
+            for x, z, w, d in zip(xs, zs, widths, depths)
+        ]
+
+    def blocked_xz(self, xs: np.ndarray, zs: np.ndarray, clearance: float = 0.0) -> np.ndarray:
+        """
+        Check which points lie within clearance of a box footprint.
+
+        Args:
+            xs: X coordinates
+            zs: Z coordinates
+            clearance: Distance added around every footprint
+
+        Returns:
+            Boolean array, True where a point is blocked
+        """
+        blocked = np.zeros(len(xs), dtype=bool)
+        for box in self.boxes:
+            blocked |= (
+                (xs >= box.min_x - clearance)
+                & (xs <= box.max_x + clearance)
+                & (zs >= box.min_z - clearance)
+                & (zs <= box.max_z + clearance)
+            )
+        return blocked
+
+    def ground_height(self, x: float, z: float, from_y: float, max_drop: float = 5.0) -> Optional[float]:
+        """
+        Highest walkable surface at (x, z) no higher than from_y.
+
+        Equivalent to a downward ray from (x, from_y, z) of length max_drop.
+
+        Args:
+            x: X coordinate
+            z: Z coordinate
+            from_y: Height to search down from
+            max_drop: Maximum search distance
+
+        Returns:
+            Surface height, or None if nothing is below
+        """
+        best = None
+        lowest = from_y - max_drop
+
+        if abs(x) <= self.ground_half_size and abs(z) <= self.ground_half_size:
+            if lowest <= self.ground_y <= from_y:
+                best = self.ground_y
+
+        for box in self.boxes:
+            if lowest <= box.max_y <= from_y and box.contains_xz(x, z):
+                if best is None or box.max_y > best:
+                    best = box.max_y
+        return best
+
+    def ceiling_height(self, x: float, z: float, from_y: float, max_rise: float) -> Optional[float]:
+        """
+        Lowest box underside at (x, z) between from_y and from_y + max_rise.
+
+        Args:
+            x: X coordinate
+            z: Z coordinate
+            from_y: Height to search up from
+            max_rise: Maximum search distance
+
+        Returns:
+            Ceiling height, or None if nothing is above
+        """
+        best = None
+        highest = from_y + max_rise
+        for box in self.boxes:
+            if from_y <= box.min_y <= highest and box.contains_xz(x, z):
+                if best is None or box.min_y < best:
+                    best = box.min_y
+        return best
+
+    def resolve_horizontal(
+        self, x: float, z: float, feet_y: float, height: float, radius: float, iterations: int = 2
+    ) -> Tuple[float, float]:
+        """
+        Push a vertical capsule out of every box it overlaps.
+
+        Only the penetrating component is removed, so movement into a wall
+        slides along it. Boxes entirely below the feet or above the head are
+        ignored.
+
+        Args:
+            x: Desired capsule center X
+            z: Desired capsule center Z
+            feet_y: Bottom of the capsule
+            height: Capsule height
+            radius: Capsule radius
+            iterations: Passes over the boxes (resolves corners)
+
+        Returns:
+            Corrected (x, z)
+        """
+        head_y = feet_y + height
+        for _ in range(iterations):
+            moved = False
+            for box in self.boxes:
+                if box.max_y <= feet_y or box.min_y >= head_y:
+                    continue
+
+                closest_x = min(max(x, box.min_x), box.max_x)
+                closest_z = min(max(z, box.min_z), box.max_z)
+                dx = x - closest_x
+                dz = z - closest_z
+                distance_sq = dx * dx + dz * dz
+                if distance_sq >= radius * radius:
+                    continue
+
+                if distance_sq > 0:
+                    # Center outside the box: push along the contact normal
+                    distance = math.sqrt(distance_sq)
+                    push = (radius - distance) / distance
+                    x += dx * push
+                    z += dz * push
+                else:
+                    # Center inside the box: exit through the nearest face
+                    exits = (
+                        (x - box.min_x + radius, -1.0, 0.0),
+                        (box.max_x - x + radius, 1.0, 0.0),
+                        (z - box.min_z + radius, 0.0, -1.0),
+                        (box.max_z - z + radius, 0.0, 1.0),
+                    )
+                    depth, nx, nz = min(exits)
+                    x += nx * depth
+                    z += nz * depth
+                moved = True
+            if not moved:
+                break
+        return x, z
@@ -0,0 +1,6 @@
+"""Game time."""
+
+from .game_clock import GameClock
+from .fixed_timestep import FixedTimestep
+
+__all__ = ["GameClock", "FixedTimestep"]
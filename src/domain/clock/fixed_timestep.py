@@ -0,0 +1,58 @@
+"""Fixed-rate simulation stepping - pure Python domain logic."""
+
+
+class FixedTimestep:
+    """
+    Turns variable frame times into a whole number of fixed simulation steps.
+    Pure Python - no engine dependencies.
+
+    Elapsed game time accumulates and is consumed in steps of exactly
+    step_time, so the simulation behaves the same at any frame rate. At
+    most max_steps run per frame; time beyond that is dropped instead of
+    being carried into ever longer catch-up frames. The remainder left in
+    the accumulator gives alpha, how far the present lies between the last
+    two simulation states, for render interpolation.
+    """
+
+    def __init__(self, rate: float = 60.0, max_steps: int = 5):
+        """
+        Initialize stepper.
+
+        Args:
+            rate: Simulation steps per game second
+            max_steps: Most steps run for a single frame
+        """
+        self.step_time = 1.0 / rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.alpha = 1.0  # interpolation factor between the previous and the current simulation state
+        self.steps = 0  # steps due for the last frame
+        self.dropped_time = 0.0  # total game time discarded by the max_steps clamp
+
+    def advance(self, delta_time: float) -> int:
+        """
+        Add a frame's game time and count the steps due.
+
+        Args:
+            delta_time: Game seconds the frame covers (0 while paused)
+
+        Returns:
+            Number of fixed steps to run this frame
+        """
+        self.accumulator += delta_time
+        steps = int(self.accumulator / self.step_time)
+        if steps > self.max_steps:
+            dropped = (steps - self.max_steps) * self.step_time
+            self.dropped_time += dropped
+            self.accumulator -= dropped
+            steps = self.max_steps
+        self.accumulator -= steps * self.step_time
+        self.alpha = min(1.0, self.accumulator / self.step_time)
+        self.steps = steps
+        return steps
+
+    def reset(self) -> None:
+        """Discard accumulated time."""
+        self.accumulator = 0.0
+        self.alpha = 1.0
+        self.steps = 0
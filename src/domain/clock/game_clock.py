@@ -0,0 +1,98 @@
+"""Game clock - simulation time decoupled from wall-clock time."""
+
+
+class GameClock:
+    """
+    Simulation time source that can be paused, scaled and stepped.
+    Pure Python - no engine dependencies.
+
+    Time only advances when the owner calls tick() or step(), so countdowns
+    and cooldowns never see time that passed during a hitch or a pause.
+    """
+
+    MIN_TIME_SCALE = 0.25
+    MAX_TIME_SCALE = 100.0
+
+    def __init__(self, time_scale: float = 1.0, max_frame_time: float = 0.25, start_time: float = 0.0):
+        """
+        Initialize clock.
+
+        Args:
+            time_scale: Simulation seconds per real second
+            max_frame_time: Longest real frame time accepted by tick(), in seconds
+            start_time: Initial game time
+        """
+        self.current_time = start_time
+        self.max_frame_time = max_frame_time
+        self.paused = False
+        self._time_scale = 1.0
+        self.time_scale = time_scale
+
+    def __call__(self) -> float:
+        return self.current_time
+
+    def now(self) -> float:
+        """Current game time in seconds."""
+        return self.current_time
+
+    @property
+    def time_scale(self) -> float:
+        """Simulation speed multiplier, clamped to [MIN_TIME_SCALE, MAX_TIME_SCALE]."""
+        return self._time_scale
+
+    @time_scale.setter
+    def time_scale(self, value: float) -> None:
+        self._time_scale = min(self.MAX_TIME_SCALE, max(self.MIN_TIME_SCALE, value))
+
+    def frame_delta(self, real_delta_time: float) -> float:
+        """
+        Game seconds a real frame time is worth, applying hitch clamp, pause and scale, without advancing.
+
+        Args:
+            real_delta_time: Wall-clock seconds since last frame
+
+        Returns:
+            Game seconds (0 while paused)
+        """
+        if self.paused:
+            return 0.0
+        return min(real_delta_time, self.max_frame_time) * self._time_scale
+
+    def tick(self, real_delta_time: float) -> float:
+        """
+        Advance by a real frame time, applying hitch clamp, pause and scale.
+
+        Args:
+            real_delta_time: Wall-clock seconds since last frame
+
+        Returns:
+            Game seconds that elapsed (0 while paused)
+        """
+        delta_time = self.frame_delta(real_delta_time)
+        self.current_time += delta_time
+        return delta_time
+
+    def step(self, delta_time: float) -> float:
+        """
+        Advance by exactly delta_time game seconds, ignoring pause and scale.
+
+        Args:
+            delta_time: Game seconds to advance
+
+        Returns:
+            delta_time
+        """
+        self.current_time += delta_time
+        return delta_time
+
+    def pause(self) -> None:
+        """Stop time from advancing on tick()."""
+        self.paused = True
+
+    def resume(self) -> None:
+        """Let time advance on tick() again."""
+        self.paused = False
+
+    def toggle_pause(self) -> None:
+        """Switch between paused and running."""
+        self.paused = not self.paused
@@ -0,0 +1,5 @@
+"""Combat resolution."""
+
+from .hitscan import HitscanResolver, HitscanResult
+
+__all__ = ["HitscanResolver", "HitscanResult"]
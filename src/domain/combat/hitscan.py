@@ -0,0 +1,103 @@
+"""Hitscan resolution against enemy and wall bounding boxes - pure Python domain logic."""
+
+from typing import Optional, Tuple
+import numpy as np
+
+from domain.arena import ArenaGeometry
+from domain.entities import Enemy, EnemySwarm
+
+
+class HitscanResult:
+    """Nearest thing hit by a hitscan ray."""
+
+    def __init__(self, enemy: Optional[Enemy] = None, distance: float = float("inf"), hit_wall: bool = False):
+        self.enemy = enemy
+        self.distance = distance
+        self.hit_wall = hit_wall
+
+    @property
+    def hit(self) -> bool:
+        """Whether the ray hit anything."""
+        return self.enemy is not None or self.hit_wall
+
+
+class HitscanResolver:
+    """
+    Casts rays against every enemy box and static wall box in one NumPy pass.
+    Pure Python - no engine dependencies.
+
+    Enemy boxes are axis-aligned, centered on the enemy's XZ position and
+    standing on its Y position, so no engine colliders are needed.
+    """
+
+    def __init__(
+        self,
+        swarm: EnemySwarm,
+        arena_geometry: Optional[ArenaGeometry] = None,
+        enemy_width: float = 1.0,
+        enemy_height: float = 2.5,
+    ):
+        """
+        Initialize resolver.
+
+        Args:
+            swarm: Enemy swarm providing positions
+            arena_geometry: Static geometry whose boxes block shots
+            enemy_width: Enemy box width (X and Z)
+            enemy_height: Enemy box height
+        """
+        self.swarm = swarm
+        self.enemy_extent_min = np.array([-enemy_width / 2, 0.0, -enemy_width / 2])
+        self.enemy_extent_max = np.array([enemy_width / 2, enemy_height, enemy_width / 2])
+
+        boxes = arena_geometry.boxes if arena_geometry is not None else []
+        self.wall_min = np.array([(b.min_x, b.min_y, b.min_z) for b in boxes], dtype=np.float64).reshape(-1, 3)
+        self.wall_max = np.array([(b.max_x, b.max_y, b.max_z) for b in boxes], dtype=np.float64).reshape(-1, 3)
+
+    def cast(
+        self,
+        origin: Tuple[float, float, float],
+        direction: Tuple[float, float, float],
+        max_distance: float,
+    ) -> HitscanResult:
+        """
+        Find the nearest enemy or wall along a ray.
+
+        Args:
+            origin: Ray origin (x, y, z)
+            direction: Normalized ray direction (x, y, z)
+            max_distance: Maximum hit distance
+
+        Returns:
+            HitscanResult for the nearest hit (empty if nothing was hit)
+        """
+        n = self.swarm.count
+        positions = self.swarm.positions[:n]
+        box_min = np.concatenate((positions + self.enemy_extent_min, self.wall_min))
+        box_max = np.concatenate((positions + self.enemy_extent_max, self.wall_max))
+        if len(box_min) == 0:
+            return HitscanResult()
+
+        origin = np.asarray(origin, dtype=np.float64)
+        direction = np.asarray(direction, dtype=np.float64)
+        # Avoid 0 * inf = nan for rays parallel to a slab
+        direction = np.where(np.abs(direction) < 1e-12, 1e-12, direction)
+        inverse = 1.0 / direction
+
+        # Slab test: entry is the latest slab entry, exit the earliest slab exit
+        t1 = (box_min - origin) * inverse
+        t2 = (box_max - origin) * inverse
+        t_enter = np.minimum(t1, t2).max(axis=1)
+        t_exit = np.maximum(t1, t2).min(axis=1)
+        t_enter = np.maximum(t_enter, 0.0)
+
+        hits = (t_exit >= t_enter) & (t_enter <= max_distance)
+        if not hits.any():
+            return HitscanResult()
+
+        t_enter = np.where(hits, t_enter, np.inf)
+        nearest = int(np.argmin(t_enter))
+        distance = float(t_enter[nearest])
+        if nearest < n:
+            return HitscanResult(enemy=self.swarm.enemies[nearest], distance=distance)
+        return HitscanResult(distance=distance, hit_wall=True)
@@ -2,6 +2,9 @@
 
 from .player import Player
 from .enemy import Enemy
+from .enemy_swarm import EnemySwarm
+from .ai_level_of_detail import AILevelOfDetail
 from .weapon import Weapon
+from .handle_registry import HandleRegistry
 
-__all__ = ["Player", "Enemy", "Weapon"]
+__all__ = ["Player", "Enemy", "EnemySwarm", "AILevelOfDetail", "Weapon", "HandleRegistry"]
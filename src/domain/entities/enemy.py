@@ -1,32 +1,133 @@
 """Enemy entity - pure Python domain logic."""
 
-import random
 import math
 from typing import Tuple
+import numpy as np
 
 
 class Enemy:
     """
     Enemy entity with position, health, and movement.
     Pure Python - no engine dependencies.
+
+    A standalone Enemy keeps its own state. Once added to an EnemySwarm it
+    becomes a view onto one row of the swarm's arrays.
     """
 
     def __init__(self, position: Tuple[float, float, float], speed: float, max_health: int = 100):
-        self.position = position
-        self.speed = speed
-        self.max_health = max_health
+        self.handle = -1  # generational handle assigned by the game's HandleRegistry
+        self._swarm = None
+        self._row = -1
+        self._position = tuple(position)
+        self._speed = speed
+        self._max_health = max_health
         self._health = max_health
-        self.last_attack_time = 0.0
+        self._last_attack_time = 0.0
+        self._last_hit_time = float("-inf")
+        self._facing = 0.0
+        self._velocity = (0.0, 0.0)  # XZ chase velocity, refreshed whenever the AI re-aims
+        self._previous_position = tuple(position)  # position before the last simulation step
+
+    @property
+    def position(self) -> Tuple[float, float, float]:
+        """Current position (x, y, z)."""
+        if self._swarm is None:
+            return self._position
+        x, y, z = self._swarm.positions[self._row]
+        return (float(x), float(y), float(z))
+
+    @position.setter
+    def position(self, value: Tuple[float, float, float]) -> None:
+        # Setting the position teleports: nothing is interpolated from the old one
+        if self._swarm is None:
+            self._position = self._previous_position = tuple(value)
+        else:
+            self._swarm.positions[self._row] = value
+            self._swarm.previous_positions[self._row] = value
+
+    @property
+    def speed(self) -> float:
+        """Movement speed."""
+        if self._swarm is None:
+            return self._speed
+        return float(self._swarm.speeds[self._row])
+
+    @speed.setter
+    def speed(self, value: float) -> None:
+        if self._swarm is None:
+            self._speed = value
+        else:
+            self._swarm.speeds[self._row] = value
+
+    @property
+    def max_health(self) -> int:
+        """Maximum health."""
+        if self._swarm is None:
+            return self._max_health
+        return int(self._swarm.max_health[self._row])
 
     @property
     def health(self) -> int:
         """Current health."""
-        return self._health
+        if self._swarm is None:
+            return self._health
+        return int(self._swarm.health[self._row])
+
+    @property
+    def last_attack_time(self) -> float:
+        """Game time of the last attack."""
+        if self._swarm is None:
+            return self._last_attack_time
+        return float(self._swarm.last_attack_time[self._row])
+
+    @last_attack_time.setter
+    def last_attack_time(self, value: float) -> None:
+        if self._swarm is None:
+            self._last_attack_time = value
+        else:
+            self._swarm.last_attack_time[self._row] = value
+
+    @property
+    def last_hit_time(self) -> float:
+        """Game time the enemy last took damage (-inf if never)."""
+        if self._swarm is None:
+            return self._last_hit_time
+        return float(self._swarm.last_hit_time[self._row])
+
+    @last_hit_time.setter
+    def last_hit_time(self, value: float) -> None:
+        if self._swarm is None:
+            self._last_hit_time = value
+        else:
+            self._swarm.last_hit_time[self._row] = value
+
+    def interpolated_position(self, alpha: float) -> Tuple[float, float, float]:
+        """
+        Position blended between the previous and the last simulation step.
+
+        Args:
+            alpha: 0 gives the position before the last step, 1 the current one
+
+        Returns:
+            (x, y, z) position tuple
+        """
+        if self._swarm is None:
+            return self._position
+        previous = self._swarm.previous_positions[self._row]
+        x, y, z = previous + (self._swarm.positions[self._row] - previous) * alpha
+        return (float(x), float(y), float(z))
+
+    @property
+    def facing(self) -> float:
+        """Yaw in degrees, 0 facing +z."""
+        if self._swarm is None:
+            return self._facing
+        return float(self._swarm.facing[self._row])
 
     @property
     def is_alive(self) -> bool:
         """Check if enemy is still alive."""
-        return self._health > 0
+        return self.health > 0
 
     def take_damage(self, amount: int) -> None:
         """
@@ -35,8 +136,14 @@ class Enemy:
         Args:
             amount: Damage to apply
         """
-        if self.is_alive:
-            self._health = max(0, self._health - amount)
+        if not self.is_alive:
+            return
+
+        new_health = max(0, self.health - amount)
+        if self._swarm is None:
+            self._health = new_health
+        else:
+            self._swarm.health[self._row] = new_health
 
     def can_attack(self, current_time: float, attack_cooldown: float) -> bool:
         """
@@ -58,6 +165,7 @@ class Enemy:
     @staticmethod
     def generate_spawn_position(
         arena_size: float,
+        rng: np.random.Generator,
         margin: float = 2.0,
         player_pos: Tuple[float, float, float] = (0, 0, 0),
         min_player_distance: float = 8.0,
@@ -67,6 +175,7 @@ class Enemy:
 
         Args:
             arena_size: Size of the arena (square)
+            rng: Random generator to draw from, e.g. the WaveManager's seeded rng
             margin: Distance to stay away from walls
             player_pos: Player position (x, y, z)
             min_player_distance: Minimum distance from player
@@ -79,8 +188,8 @@ class Enemy:
 
         for attempt in range(max_attempts):
             # Generate random position within arena bounds
-            x = random.uniform(-half_size, half_size)
-            z = random.uniform(-half_size, half_size)
+            x = float(rng.uniform(-half_size, half_size))
+            z = float(rng.uniform(-half_size, half_size))
             y = 0
 
             # Check distance from player
@@ -0,0 +1,528 @@
+"""Enemy swarm - struct-of-arrays storage and batched AI for all enemies."""
+
+import math
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+from domain.navigation import FlowField
+from domain.spatial import SpatialHashGrid, neighbor_pairs, neighbors_of
+from .enemy import Enemy
+from .ai_level_of_detail import AILevelOfDetail
+
+GOLDEN_ANGLE = np.pi * (3.0 - np.sqrt(5.0))  # spreads push directions of exactly stacked enemies
+
+# Array attribute on the swarm -> private attribute holding the value on a standalone Enemy
+COLUMNS = {
+    "positions": "_position",
+    "speeds": "_speed",
+    "health": "_health",
+    "max_health": "_max_health",
+    "last_attack_time": "_last_attack_time",
+    "last_hit_time": "_last_hit_time",
+    "facing": "_facing",
+    "velocities": "_velocity",
+    "previous_positions": "_previous_position",
+}
+
+
+class EnemySwarm:
+    """
+    Stores every live enemy as a row in NumPy arrays and advances them together.
+    Pure Python - no engine dependencies.
+
+    Rows are kept dense: removing an enemy moves the last row into the freed slot,
+    so the first `count` rows of every array are always the live enemies.
+    When a SpatialHashGrid is attached it indexes rows by position and is kept
+    in sync as enemies move, spawn and die.
+    """
+
+    def __init__(self, capacity: int = 64, grid: Optional[SpatialHashGrid] = None):
+        """
+        Initialize empty swarm.
+
+        Args:
+            capacity: Initial number of rows to allocate (grows on demand)
+            grid: Optional spatial index used for contact and proximity queries
+        """
+        self.count = 0
+        self.positions = np.zeros((capacity, 3), dtype=np.float64)
+        self.speeds = np.zeros(capacity, dtype=np.float64)
+        self.health = np.zeros(capacity, dtype=np.int32)
+        self.max_health = np.zeros(capacity, dtype=np.int32)
+        self.last_attack_time = np.zeros(capacity, dtype=np.float64)
+        self.last_hit_time = np.full(capacity, -np.inf, dtype=np.float64)
+        self.facing = np.zeros(capacity, dtype=np.float64)  # yaw in degrees, 0 = +z
+        self.velocities = np.zeros(
+            (capacity, 2), dtype=np.float64
+        )  # XZ chase velocity, refreshed when a row is re-aimed
+        self.previous_positions = np.zeros((capacity, 3), dtype=np.float64)  # positions before the last step
+        self.enemies: List[Enemy] = []
+        self.grid = grid
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def capacity(self) -> int:
+        """Number of allocated rows."""
+        return len(self.speeds)
+
+    def _grow(self, min_capacity: int) -> None:
+        """Reallocate arrays to hold at least min_capacity rows."""
+        new_capacity = max(min_capacity, self.capacity * 2)
+        for name in COLUMNS:
+            old = getattr(self, name)
+            new = np.zeros((new_capacity,) + old.shape[1:], dtype=old.dtype)
+            new[: self.count] = old[: self.count]
+            setattr(self, name, new)
+
+    def spawn(self, position: Tuple[float, float, float], speed: float, max_health: int) -> Enemy:
+        """
+        Create a new enemy stored in this swarm.
+
+        Args:
+            position: Spawn position (x, y, z)
+            speed: Movement speed
+            max_health: Enemy health
+
+        Returns:
+            Enemy bound to a row of this swarm
+        """
+        enemy = Enemy(position, speed, max_health)
+        self.add(enemy)
+        return enemy
+
+    def spawn_many(self, positions: np.ndarray, speed: float, max_health: int) -> List[Enemy]:
+        """
+        Create several enemies with the same stats in one batch.
+
+        Args:
+            positions: Spawn positions, shape (n, 3)
+            speed: Movement speed
+            max_health: Enemy health
+
+        Returns:
+            Enemies bound to consecutive new rows
+        """
+        n = len(positions)
+        if n == 0:
+            return []
+        if self.count + n > self.capacity:
+            self._grow(self.count + n)
+
+        # Every column starts from a fresh enemy's values, then positions are filled in
+        template = Enemy((0.0, 0.0, 0.0), speed, max_health)
+        start, end = self.count, self.count + n
+        for name, attribute in COLUMNS.items():
+            getattr(self, name)[start:end] = getattr(template, attribute)
+        self.positions[start:end] = positions
+        self.previous_positions[start:end] = positions
+
+        enemies = []
+        for row, position in enumerate(self.positions[start:end].tolist(), start):
+            enemy = Enemy(position, speed, max_health)
+            enemy._swarm = self
+            enemy._row = row
+            enemies.append(enemy)
+        self.enemies.extend(enemies)
+        self.count = end
+        if self.grid is not None:
+            self.grid.insert_many(np.arange(start, end), self.positions[start:end, 0], self.positions[start:end, 2])
+        return enemies
+
+    def add_rows(self, columns: Dict[str, np.ndarray]) -> List[Enemy]:
+        """
+        Append rows with every column given, e.g. enemies restored from a saved game.
+
+        Args:
+            columns: Array per COLUMNS name, all with the same number of rows
+
+        Returns:
+            Enemies bound to consecutive new rows
+        """
+        n = len(columns["positions"])
+        if n == 0:
+            return []
+        if self.count + n > self.capacity:
+            self._grow(self.count + n)
+
+        start, end = self.count, self.count + n
+        for name in COLUMNS:
+            getattr(self, name)[start:end] = columns[name]
+
+        enemies = []
+        rows = zip(
+            self.positions[start:end].tolist(), self.speeds[start:end].tolist(), self.max_health[start:end].tolist()
+        )
+        for row, (position, speed, max_health) in enumerate(rows, start):
+            enemy = Enemy(position, speed, max_health)
+            enemy._swarm = self
+            enemy._row = row
+            enemies.append(enemy)
+        self.enemies.extend(enemies)
+        self.count = end
+        if self.grid is not None:
+            self.grid.insert_many(np.arange(start, end), self.positions[start:end, 0], self.positions[start:end, 2])
+        return enemies
+
+    def add(self, enemy: Enemy) -> int:
+        """
+        Move a standalone enemy's state into a new row.
+
+        Args:
+            enemy: Enemy not yet bound to any swarm
+
+        Returns:
+            Row index assigned to the enemy
+        """
+        if enemy._swarm is not None:
+            raise ValueError("Enemy already belongs to a swarm")
+
+        if self.count >= self.capacity:
+            self._grow(self.count + 1)
+
+        row = self.count
+        for name, attribute in COLUMNS.items():
+            getattr(self, name)[row] = getattr(enemy, attribute)
+        self.enemies.append(enemy)
+        self.count += 1
+        if self.grid is not None:
+            self.grid.insert(row, self.positions[row, 0], self.positions[row, 2])
+
+        enemy._swarm = self
+        enemy._row = row
+        return row
+
+    def remove(self, enemy: Enemy) -> None:
+        """
+        Detach an enemy, copying its final state back onto the Enemy object.
+
+        Args:
+            enemy: Enemy bound to this swarm
+        """
+        if enemy._swarm is not self:
+            return
+
+        row = enemy._row
+        for name, attribute in COLUMNS.items():
+            value = getattr(self, name)[row]
+            setattr(enemy, attribute, tuple(value.tolist()) if value.ndim else value.item())
+        enemy._swarm = None
+        enemy._row = -1
+
+        # Swap-remove: move last row into the freed slot
+        last = self.count - 1
+        if self.grid is not None:
+            self.grid.remove(row)
+            self.grid.relabel(last, row)
+        if row != last:
+            for name in COLUMNS:
+                column = getattr(self, name)
+                column[row] = column[last]
+            moved = self.enemies[last]
+            moved._row = row
+            self.enemies[row] = moved
+        self.enemies.pop()
+        self.count = last
+
+    def clear(self) -> None:
+        """Detach all enemies, copying each one's final state back like remove() does, in one pass."""
+        for name, attribute in COLUMNS.items():
+            column = getattr(self, name)[: self.count]
+            values = map(tuple, column.tolist()) if column.ndim > 1 else column.tolist()
+            for enemy, value in zip(self.enemies, values):
+                setattr(enemy, attribute, value)
+        for enemy in self.enemies:
+            enemy._swarm = None
+            enemy._row = -1
+        self.enemies.clear()
+        self.count = 0
+        if self.grid is not None:
+            self.grid.clear()
+
+    def rows_within(self, position: Tuple[float, float, float], radius: float) -> np.ndarray:
+        """
+        Rows whose XZ distance to a position is at most radius.
+
+        Args:
+            position: Query position (x, y, z)
+            radius: Search radius
+
+        Returns:
+            Array of row indices
+        """
+        if self.count == 0:
+            return np.empty(0, dtype=np.int64)
+
+        if self.grid is not None:
+            rows = np.fromiter(self.grid.query_radius(position[0], position[2], radius), dtype=np.int64)
+        else:
+            rows = np.arange(self.count)
+
+        dx = self.positions[rows, 0] - position[0]
+        dz = self.positions[rows, 2] - position[2]
+        return rows[dx * dx + dz * dz <= radius * radius]
+
+    def resolve_horizontal(
+        self,
+        x: float,
+        z: float,
+        feet_y: float,
+        height: float,
+        radius: float,
+        body_radius: float = 0.5,
+        body_height: float = 2.5,
+    ) -> Tuple[float, float]:
+        """
+        Push a vertical capsule out of every live enemy body it overlaps.
+
+        Bodies are upright cylinders standing on each enemy's position. As
+        with ArenaGeometry.resolve_horizontal, only the penetrating component
+        is removed, so walking into an enemy slides around it. Bodies
+        entirely below the feet or above the head are ignored.
+
+        Args:
+            x: Desired capsule center X
+            z: Desired capsule center Z
+            feet_y: Bottom of the capsule
+            height: Capsule height
+            radius: Capsule radius
+            body_radius: Enemy body radius
+            body_height: Enemy body height
+
+        Returns:
+            Corrected (x, z)
+        """
+        reach = radius + body_radius
+        for row in self.rows_within((x, feet_y, z), reach):
+            body_x, body_y, body_z = self.positions[row]
+            if self.health[row] <= 0 or body_y >= feet_y + height or body_y + body_height <= feet_y:
+                continue
+
+            dx = x - body_x
+            dz = z - body_z
+            distance_sq = dx * dx + dz * dz
+            if distance_sq >= reach * reach:
+                continue
+            if distance_sq > 0:
+                distance = math.sqrt(distance_sq)
+                push = (reach - distance) / distance
+                x += dx * push
+                z += dz * push
+            else:
+                # Exactly on the enemy's center: step out along its facing
+                facing = math.radians(self.facing[row])
+                x = body_x + math.sin(facing) * reach
+                z = body_z + math.cos(facing) * reach
+        return x, z
+
+    def neighbors_within(self, position: Tuple[float, float, float], radius: float) -> List[Enemy]:
+        """
+        Enemies whose XZ distance to a position is at most radius.
+
+        Args:
+            position: Query position (x, y, z)
+            radius: Search radius
+
+        Returns:
+            List of enemies
+        """
+        return [self.enemies[row] for row in self.rows_within(position, radius)]
+
+    def step(
+        self,
+        player_position: Tuple[float, float, float],
+        delta_time: float,
+        current_time: float,
+        attack_cooldown: float,
+        contact_distance: float,
+        lod: Optional[AILevelOfDetail] = None,
+        flow_field: Optional[FlowField] = None,
+        separation_radius: float = 0.0,
+        separation_weight: float = 1.0,
+    ) -> List[Enemy]:
+        """
+        Advance chase, facing and attack cooldowns for every enemy at once.
+
+        Enemies face the player, move toward it on the XZ plane until within
+        contact distance, then attack whenever their cooldown has elapsed.
+        Each row keeps the chase velocity of its last re-aim and every row
+        advances along it each step. With a level-of-detail scheduler only
+        the rows it picks this step re-aim and may attack; without one every
+        row does. With a flow field, enemies that cannot see the player
+        follow it around obstacles instead of heading straight at the player.
+        With a separation radius, enemies closer than it push each other
+        apart, so crowds spread around the player instead of stacking up.
+        Positions from before the step are kept in previous_positions for
+        render interpolation.
+
+        Args:
+            player_position: Player position (x, y, z)
+            delta_time: Time since last step
+            current_time: Current game time
+            attack_cooldown: Seconds between attacks
+            contact_distance: XZ distance at which an enemy touches the player
+            lod: Optional scheduler choosing which rows re-aim this step
+            flow_field: Optional flow field toward the player, already updated for its position
+            separation_radius: Distance below which enemies push apart (0 = no separation)
+            separation_weight: Strength of the push relative to the chase, at full overlap
+
+        Returns:
+            Enemies that attacked the player this step
+        """
+        n = self.count
+        if n == 0:
+            return []
+
+        positions = self.positions[:n]
+        velocities = self.velocities[:n]
+        self.previous_positions[:n] = positions
+        dx = player_position[0] - positions[:, 0]
+        dz = player_position[2] - positions[:, 2]
+
+        alive = self.health[:n] > 0
+        in_contact = np.zeros(n, dtype=bool)
+        in_contact[self.rows_within(player_position, contact_distance)] = True
+        in_contact &= alive
+
+        # Rows re-aimed this step; a slice when every row is (without a scheduler, or when it picks them all)
+        due = slice(0, n)
+        due_rows = lod.schedule(dx * dx + dz * dz) if lod is not None else None
+        if due_rows is not None and len(due_rows) < n:
+            due = due_rows
+            dx, dz = dx[due], dz[due]
+            # Only rows re-aimed this step may attack
+            scheduled = np.zeros(n, dtype=bool)
+            scheduled[due] = True
+            in_contact &= scheduled
+
+        # Re-aim: face the player and head toward it, or stop when touching
+        if flow_field is not None:
+            dx, dz = flow_field.steer(positions[due, 0], positions[due, 2], dx, dz)
+        distance = np.hypot(dx, dz)
+        self.facing[:n][due] = np.degrees(np.arctan2(dx, dz))
+        moving = alive[due] & ~in_contact[due] & (distance > 0)
+        scale = np.zeros(len(distance), dtype=np.float64)
+        np.divide(self.speeds[:n][due], distance, out=scale, where=moving)
+        velocities[due, 0] = dx * scale
+        velocities[due, 1] = dz * scale
+
+        # Separation: blend in the push from close neighbors, never exceeding chase speed
+        if separation_radius > 0:
+            push_x, push_z = self._separation(separation_radius, None if isinstance(due, slice) else due)
+            speeds = self.speeds[:n][due] * alive[due]
+            velocity_x = velocities[due, 0] + push_x * separation_weight * speeds
+            velocity_z = velocities[due, 1] + push_z * separation_weight * speeds
+            length = np.hypot(velocity_x, velocity_z)
+            limit = np.ones(len(length), dtype=np.float64)
+            np.divide(speeds, length, out=limit, where=length > speeds)
+            velocities[due, 0] = velocity_x * limit
+            velocities[due, 1] = velocity_z * limit
+
+        # Every row advances along its current velocity, re-aimed or not
+        positions[:, 0] += velocities[:, 0] * delta_time
+        positions[:, 2] += velocities[:, 1] * delta_time
+        if self.grid is not None:
+            self.grid.update(np.arange(n), positions[:, 0], positions[:, 2])
+
+        # Attack: touching enemies whose cooldown has elapsed
+        ready = in_contact & ((current_time - self.last_attack_time[:n]) >= attack_cooldown)
+        attacker_rows = np.flatnonzero(ready)
+        if len(attacker_rows) == 0:
+            return []
+
+        self.last_attack_time[attacker_rows] = current_time
+        return [self.enemies[row] for row in attacker_rows]
+
+    def interpolated_positions(self, alpha: float) -> np.ndarray:
+        """
+        Live rows' positions blended between the previous and the last step.
+
+        Args:
+            alpha: 0 gives the positions before the last step, 1 the current ones
+
+        Returns:
+            Array of shape (count, 3)
+        """
+        previous = self.previous_positions[: self.count]
+        return previous + (self.positions[: self.count] - previous) * alpha
+
+    def _separation(self, radius: float, rows: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Summed push away from every neighbor closer than radius.
+
+        Each neighbor pushes along the line between the two enemies, from 1
+        when they coincide down to 0 at radius; both enemies of a pair get
+        opposite pushes. With rows, only those rows' neighbors are searched
+        (rows skipped by the level of detail keep the push in their velocity).
+
+        Args:
+            radius: Separation radius
+            rows: Rows to compute the push for (None = every row)
+
+        Returns:
+            (x, z) push per row, or per given row
+        """
+        n = self.count
+        xs = self.positions[:n, 0]
+        zs = self.positions[:n, 2]
+        if rows is not None:
+            if 2 * len(rows) < n:
+                return self._separation_of(xs, zs, radius, rows)
+            # Most rows are due: one pass over every pair is cheaper than per-row neighbor lists
+            push_x, push_z = self._separation(radius)
+            return push_x[rows], push_z[rows]
+
+        first, second = neighbor_pairs(xs, zs, radius)
+        if len(first) == 0:
+            return np.zeros(n), np.zeros(n)
+
+        dx = xs[first] - xs[second]
+        dz = zs[first] - zs[second]
+        distance = np.hypot(dx, dz)
+        strength = 1.0 - distance / radius
+
+        # Exactly stacked enemies have no line between them; give each pair its own direction
+        stacked = distance < 1e-9
+        if stacked.any():
+            angle = (first[stacked] + second[stacked]) * GOLDEN_ANGLE
+            dx[stacked] = np.cos(angle)
+            dz[stacked] = np.sin(angle)
+            distance[stacked] = 1.0
+
+        push_x = dx * strength / distance
+        push_z = dz * strength / distance
+        return (
+            np.bincount(first, weights=push_x, minlength=n) - np.bincount(second, weights=push_x, minlength=n),
+            np.bincount(first, weights=push_z, minlength=n) - np.bincount(second, weights=push_z, minlength=n),
+        )
+
+    @staticmethod
+    def _separation_of(
+        xs: np.ndarray, zs: np.ndarray, radius: float, rows: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Push of _separation for the given rows only, from each row's own neighbor list."""
+        first, second = neighbors_of(xs, zs, radius, rows)
+        if len(first) == 0:
+            return np.zeros(len(rows)), np.zeros(len(rows))
+
+        dx = xs[first] - xs[second]
+        dz = zs[first] - zs[second]
+        distance = np.hypot(dx, dz)
+        strength = 1.0 - distance / radius
+
+        # Same per-pair direction for stacked enemies as _separation, signed so the two push apart
+        stacked = distance < 1e-9
+        if stacked.any():
+            angle = (first[stacked] + second[stacked]) * GOLDEN_ANGLE
+            sign = np.where(first[stacked] < second[stacked], 1.0, -1.0)
+            dx[stacked] = np.cos(angle) * sign
+            dz[stacked] = np.sin(angle) * sign
+            distance[stacked] = 1.0
+
+        # Sum per neighbor list, in the order of rows
+        slots = np.searchsorted(rows, first)
+        return (
+            np.bincount(slots, weights=dx * strength / distance, minlength=len(rows)),
+            np.bincount(slots, weights=dz * strength / distance, minlength=len(rows)),
+        )
@@ -0,0 +1,127 @@
+"""Generational handle registry - dense storage addressed by stable integer handles."""
+
+from typing import Generic, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class HandleRegistry(Generic[T]):
+    """
+    Stores items densely and hands out generational integer handles for them.
+    Pure Python - no engine dependencies.
+
+    A handle packs a slot index (low INDEX_BITS bits) and that slot's
+    generation. Removing an item bumps its slot's generation, so an old
+    handle never resolves to a later item that reuses the slot. Add, remove
+    and lookup are O(1); removal swap-removes from the dense item list.
+    """
+
+    INDEX_BITS = 24
+    INDEX_MASK = (1 << INDEX_BITS) - 1
+    INVALID = -1
+
+    def __init__(self):
+        """Initialize empty registry."""
+        self.items: List[T] = []  # dense, in no particular order
+        self.handles: List[int] = []  # handle of items[i]
+        self._dense_index: List[int] = []  # slot -> index into items, or -1 when free
+        self._generations: List[int] = []  # slot -> current generation
+        self._free_slots: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.items)
+
+    def __contains__(self, handle: int) -> bool:
+        return self._dense_of(handle) >= 0
+
+    def _dense_of(self, handle: int) -> int:
+        """Dense index of a live handle, or -1."""
+        if handle is None or handle < 0:
+            return -1
+        slot = handle & self.INDEX_MASK
+        if slot >= len(self._generations) or self._generations[slot] != handle >> self.INDEX_BITS:
+            return -1
+        return self._dense_index[slot]
+
+    def add(self, item: T) -> int:
+        """
+        Store an item.
+
+        Args:
+            item: Item to store
+
+        Returns:
+            New handle for the item
+        """
+        if self._free_slots:
+            slot = self._free_slots.pop()
+        else:
+            slot = len(self._generations)
+            if slot > self.INDEX_MASK:
+                raise OverflowError("HandleRegistry is full")
+            self._generations.append(0)
+            self._dense_index.append(-1)
+
+        handle = (self._generations[slot] << self.INDEX_BITS) | slot
+        self._dense_index[slot] = len(self.items)
+        self.items.append(item)
+        self.handles.append(handle)
+        return handle
+
+    def get(self, handle: int) -> Optional[T]:
+        """
+        Look up an item.
+
+        Args:
+            handle: Handle returned by add()
+
+        Returns:
+            Item, or None if the handle was removed or never issued
+        """
+        index = self._dense_of(handle)
+        return self.items[index] if index >= 0 else None
+
+    def remove(self, handle: int) -> Optional[T]:
+        """
+        Remove an item and invalidate its handle.
+
+        Args:
+            handle: Handle returned by add()
+
+        Returns:
+            Removed item, or None if the handle was already stale
+        """
+        index = self._dense_of(handle)
+        if index < 0:
+            return None
+
+        slot = handle & self.INDEX_MASK
+        item = self.items[index]
+
+        # Swap-remove: move the last item into the freed dense position
+        last = len(self.items) - 1
+        if index != last:
+            moved_handle = self.handles[last]
+            self.items[index] = self.items[last]
+            self.handles[index] = moved_handle
+            self._dense_index[moved_handle & self.INDEX_MASK] = index
+        self.items.pop()
+        self.handles.pop()
+
+        self._dense_index[slot] = -1
+        self._generations[slot] += 1
+        self._free_slots.append(slot)
+        return item
+
+    def clear(self) -> None:
+        """Remove every item, invalidating all handles."""
+        for handle in self.handles:
+            slot = handle & self.INDEX_MASK
+            self._dense_index[slot] = -1
+            self._generations[slot] += 1
+            self._free_slots.append(slot)
+        self.items.clear()
+        self.handles.clear()
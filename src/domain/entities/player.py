@@ -52,3 +52,14 @@ class Player:
         """Reset player to initial state."""
         self._health = self.max_health
         self.kills = 0
+
+    def restore(self, health: int, kills: int) -> None:
+        """
+        Set health and kills, e.g. from a saved game.
+
+        Args:
+            health: Current health (clamped to max_health)
+            kills: Kill count
+        """
+        self._health = max(0, min(self.max_health, health))
+        self.kills = kills
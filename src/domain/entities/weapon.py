@@ -1,6 +1,7 @@
 """Weapon entity - pure Python domain logic."""
 
-import time
+from typing import Optional
+from domain.clock import GameClock
 
 
 class Weapon:
@@ -9,7 +10,7 @@ class Weapon:
     Pure Python - no engine dependencies.
     """
 
-    def __init__(self, fire_rate: float, damage: int, weapon_range: float):
+    def __init__(self, fire_rate: float, damage: int, weapon_range: float, clock: Optional[GameClock] = None):
         """
         Initialize weapon.
 
@@ -17,11 +18,22 @@ class Weapon:
             fire_rate: Minimum seconds between shots
             damage: Damage per shot
             weapon_range: Maximum shooting range
+            clock: Game clock used for fire rate timing
         """
         self.fire_rate = fire_rate
         self.damage = damage
         self.weapon_range = weapon_range
-        self._last_fire_time = 0.0
+        self.clock = clock or GameClock()
+        self._last_fire_time = float("-inf")
+
+    @property
+    def last_fire_time(self) -> float:
+        """Game time of the last shot (-inf before the first)."""
+        return self._last_fire_time
+
+    @last_fire_time.setter
+    def last_fire_time(self, value: float) -> None:
+        self._last_fire_time = value
 
     def can_fire(self) -> bool:
         """
@@ -30,9 +42,9 @@ class Weapon:
         Returns:
             True if enough time has passed since last shot
         """
-        current_time = time.time()
+        current_time = self.clock.now()
         return (current_time - self._last_fire_time) >= self.fire_rate
 
     def fire(self) -> None:
         """Record that weapon was fired."""
-        self._last_fire_time = time.time()
+        self._last_fire_time = self.clock.now()
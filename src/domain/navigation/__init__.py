@@ -0,0 +1,5 @@
+"""Enemy navigation."""
+
+from .flow_field import FlowField
+
+__all__ = ["FlowField"]
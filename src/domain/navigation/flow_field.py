@@ -0,0 +1,224 @@
+"""Flow field - shared pathfinding toward a single target over the static arena."""
+
+import math
+from collections import deque
+from typing import List, Tuple
+import numpy as np
+
+from domain.arena import ArenaGeometry
+
+# Neighbour offsets in cells (x, z); orthogonal first so ties prefer straight moves
+NEIGHBOUR_OFFSETS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+class FlowField:
+    """
+    Steering directions toward one target, shared by every enemy.
+    Pure Python - no engine dependencies.
+
+    The arena's static boxes are rasterized once into a grid of walkable
+    cells. Whenever the target enters a new cell, a breadth-first search
+    from it fills an integration field (steps to the target), every cell
+    gets a unit direction toward its closest neighbour, and every cell is
+    marked if it sees the target cell in a straight line. All three passes
+    cost O(cells). Enemies then look up their steering in O(1) each,
+    however large the wave.
+
+    Cells that see the target steer straight at it, so in open areas
+    enemies still walk directly at the player rather than along grid
+    directions.
+    """
+
+    def __init__(
+        self, geometry: ArenaGeometry, cell_size: float = 2.0, agent_radius: float = 0.5, agent_height: float = 2.0
+    ):
+        """
+        Initialize flow field and rasterize the arena.
+
+        Args:
+            geometry: Static arena geometry
+            cell_size: Edge length of one grid cell
+            agent_radius: Enemy radius; boxes are inflated by it when rasterized
+            agent_height: Enemy height; boxes entirely above it do not block
+        """
+        self.half_size = geometry.ground_half_size
+        self.cell_size = cell_size
+        self.cells_per_side = max(1, math.ceil(2 * self.half_size / cell_size))
+        side = self.cells_per_side
+
+        self.blocked = self._rasterize(geometry, agent_radius, agent_height)  # [x cell, z cell]
+        self.distance = np.full(side * side, np.inf)  # BFS steps to the target cell
+        self.directions = np.zeros((side * side, 2), dtype=np.float64)  # unit XZ direction per cell
+        self.direct = np.ones(side * side, dtype=bool)  # cell steers straight at the target
+        self.target_cell = -1
+        self.rebuild_count = 0
+
+        centers = -self.half_size + (np.arange(side) + 0.5) * cell_size
+        self._center_x = np.repeat(centers, side)
+        self._center_z = np.tile(centers, side)
+        self._cell_x = np.repeat(np.arange(side), side)
+        self._cell_z = np.tile(np.arange(side), side)
+        self._neighbours = self._build_neighbours()
+
+        # Summed-area table of blocked cells: blocked count of any cell rectangle in O(1)
+        self._blocked_sums = np.zeros((side + 1, side + 1), dtype=np.int64)
+        self._blocked_sums[1:, 1:] = self.blocked.cumsum(axis=0).cumsum(axis=1)
+
+    def _rasterize(self, geometry: ArenaGeometry, agent_radius: float, agent_height: float) -> np.ndarray:
+        """Mark every cell an enemy cannot stand in."""
+        side = self.cells_per_side
+        edges = -self.half_size + np.arange(side + 1) * self.cell_size
+        low, high = edges[:-1], edges[1:]
+
+        blocked = np.zeros((side, side), dtype=bool)
+        for box in geometry.boxes:
+            if box.max_y <= geometry.ground_y or box.min_y >= geometry.ground_y + agent_height:
+                continue
+            overlap_x = (high > box.min_x - agent_radius) & (low < box.max_x + agent_radius)
+            overlap_z = (high > box.min_z - agent_radius) & (low < box.max_z + agent_radius)
+            blocked |= np.outer(overlap_x, overlap_z)
+        return blocked
+
+    def _build_neighbours(self) -> List[List[int]]:
+        """Walkable 4-connected neighbours of every cell (blocked cells included as sources)."""
+        side = self.cells_per_side
+        walkable = (~self.blocked).ravel().tolist()
+        neighbours = []
+        for ix in range(side):
+            for iz in range(side):
+                cells = []
+                for nx, nz in ((ix + 1, iz), (ix - 1, iz), (ix, iz + 1), (ix, iz - 1)):
+                    if 0 <= nx < side and 0 <= nz < side and walkable[nx * side + nz]:
+                        cells.append(nx * side + nz)
+                neighbours.append(cells)
+        return neighbours
+
+    def cell_index(self, x: float, z: float) -> int:
+        """Flat cell index for a single position, clamped to the grid."""
+        last = self.cells_per_side - 1
+        ix = min(last, max(0, int((x + self.half_size) // self.cell_size)))
+        iz = min(last, max(0, int((z + self.half_size) // self.cell_size)))
+        return ix * self.cells_per_side + iz
+
+    def cell_indices(self, xs: np.ndarray, zs: np.ndarray) -> np.ndarray:
+        """Flat cell indices for arrays of positions, clamped to the grid."""
+        # Truncating instead of floor-dividing only differs below zero, which is clamped to 0 anyway
+        last = self.cells_per_side - 1
+        inverse = 1.0 / self.cell_size
+        ix = np.minimum(np.maximum(((xs + self.half_size) * inverse).astype(np.int64), 0), last)
+        iz = np.minimum(np.maximum(((zs + self.half_size) * inverse).astype(np.int64), 0), last)
+        return ix * self.cells_per_side + iz
+
+    def update(self, x: float, z: float) -> bool:
+        """
+        Retarget the field; rebuilds only when the target entered a new cell.
+
+        Args:
+            x: Target X coordinate
+            z: Target Z coordinate
+
+        Returns:
+            True if the field was rebuilt
+        """
+        cell = self.cell_index(x, z)
+        if cell == self.target_cell:
+            return False
+
+        self.target_cell = cell
+        self._integrate(cell)
+        self._build_directions()
+        self._build_line_of_sight(cell)
+        self.rebuild_count += 1
+        return True
+
+    def _integrate(self, target_cell: int) -> None:
+        """Breadth-first search from the target cell over walkable cells."""
+        steps = [-1] * len(self._neighbours)
+        steps[target_cell] = 0
+        neighbours = self._neighbours
+        queue = deque((target_cell,))
+        while queue:
+            cell = queue.popleft()
+            next_step = steps[cell] + 1
+            for neighbour in neighbours[cell]:
+                if steps[neighbour] < 0:
+                    steps[neighbour] = next_step
+                    queue.append(neighbour)
+
+        distance = np.array(steps, dtype=np.float64)
+        distance[distance < 0] = np.inf
+        self.distance = distance
+
+    def _build_directions(self) -> None:
+        """Point every cell at its neighbour closest to the target, without cutting blocked corners."""
+        side = self.cells_per_side
+        distance = self.distance.reshape(side, side)
+        padded = np.pad(distance, 1, constant_values=np.inf)
+        blocked = np.pad(self.blocked, 1, constant_values=True)
+
+        best = distance.copy()
+        direction_x = np.zeros((side, side))
+        direction_z = np.zeros((side, side))
+        for offset_x, offset_z in NEIGHBOUR_OFFSETS:
+            neighbour = padded[1 + offset_x : 1 + offset_x + side, 1 + offset_z : 1 + offset_z + side]
+            if offset_x and offset_z:
+                corner = (
+                    blocked[1 + offset_x : 1 + offset_x + side, 1 : 1 + side]
+                    | blocked[1 : 1 + side, 1 + offset_z : 1 + offset_z + side]
+                )
+                neighbour = np.where(corner, np.inf, neighbour)
+            closer = neighbour < best
+            best = np.where(closer, neighbour, best)
+            length = math.hypot(offset_x, offset_z)
+            direction_x = np.where(closer, offset_x / length, direction_x)
+            direction_z = np.where(closer, offset_z / length, direction_z)
+
+        self.directions[:, 0] = direction_x.ravel()
+        self.directions[:, 1] = direction_z.ravel()
+
+    def _build_line_of_sight(self, target_cell: int) -> None:
+        """Mark cells whose straight line to the target cell crosses no blocked cell."""
+        blocked = self.blocked.ravel()
+
+        # A line cannot cross a blocked cell if none lies in the rectangle spanned by its two cells
+        target_x, target_z = divmod(target_cell, self.cells_per_side)
+        x0 = np.minimum(self._cell_x, target_x)
+        x1 = np.maximum(self._cell_x, target_x) + 1
+        z0 = np.minimum(self._cell_z, target_z)
+        z1 = np.maximum(self._cell_z, target_z) + 1
+        sums = self._blocked_sums
+        in_rectangle = sums[x1, z1] - sums[x0, z1] - sums[x1, z0] + sums[x0, z0]
+
+        # Blocked or unreachable cells have no useful flow; they fall back to steering straight
+        direct = (in_rectangle == 0) | blocked | np.isinf(self.distance)
+
+        # Sample the remaining lines every half cell
+        rows = np.flatnonzero(~direct)
+        if len(rows):
+            samples = np.linspace(0.0, 1.0, 2 * self.cells_per_side + 1)
+            center_x = self._center_x[rows, None]
+            center_z = self._center_z[rows, None]
+            xs = center_x + (self._center_x[target_cell] - center_x) * samples
+            zs = center_z + (self._center_z[target_cell] - center_z) * samples
+            direct[rows] = ~blocked[self.cell_indices(xs, zs)].any(axis=1)
+        self.direct = direct
+
+    def steer(self, xs: np.ndarray, zs: np.ndarray, dx: np.ndarray, dz: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Steering vectors for a batch of positions.
+
+        Args:
+            xs: X coordinates
+            zs: Z coordinates
+            dx: X offsets to the target, used where it is in sight
+            dz: Z offsets to the target, used where it is in sight
+
+        Returns:
+            (x, z) steering vectors: the offsets where the target is in sight, unit flow directions elsewhere
+        """
+        cells = self.cell_indices(xs, zs)
+        follow = ~self.direct[cells]
+        if not follow.any():
+            return dx, dz
+        flow = self.directions[cells]
+        return np.where(follow, flow[:, 0], dx), np.where(follow, flow[:, 1], dz)
@@ -0,0 +1,6 @@
+"""Spatial indexing."""
+
+from .spatial_hash_grid import SpatialHashGrid
+from .neighbor_pairs import neighbor_pairs, neighbors_of
+
+__all__ = ["SpatialHashGrid", "neighbor_pairs", "neighbors_of"]
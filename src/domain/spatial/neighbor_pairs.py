@@ -0,0 +1,127 @@
+"""Batched fixed-radius neighbor search - pure NumPy domain logic."""
+
+from typing import Tuple
+import numpy as np
+
+# Half of the 3x3 block of cell offsets (x, z): every pair of adjacent cells is visited from one side only
+_HALF_BLOCK = np.array([(0, 0), (0, 1), (1, -1), (1, 0), (1, 1)], dtype=np.int64)
+# The whole 3x3 block, for queries that must find every neighbor of a row from its own side
+_FULL_BLOCK = np.array([(x, z) for x in (-1, 0, 1) for z in (-1, 0, 1)], dtype=np.int64)
+
+
+def _cell_table(
+    xs: np.ndarray, zs: np.ndarray, radius: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, int]:
+    """
+    Bucket rows into square cells of edge radius, sorted by cell.
+
+    Cell keys get a one-cell border on every side, so block keys never wrap
+    into another column.
+
+    Returns:
+        (cell key per row, cell-sorted row order, rows per cell, first sorted row per cell, key column width)
+    """
+    cell_x = np.floor(xs / radius).astype(np.int64)
+    cell_z = np.floor(zs / radius).astype(np.int64)
+    cell_x -= cell_x.min() - 1
+    cell_z -= cell_z.min() - 1
+    width = int(cell_z.max()) + 2
+    keys = cell_x * width + cell_z
+
+    order = np.argsort(keys, kind="stable")
+    cell_counts = np.bincount(keys, minlength=(int(cell_x.max()) + 2) * width)
+    cell_starts = np.cumsum(cell_counts) - cell_counts
+    return keys, order, cell_counts, cell_starts, width
+
+
+def _expand_runs(starts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Every index of the runs [start, start + count), in order."""
+    total = int(counts.sum())
+    run_offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    return np.repeat(starts, counts) + np.arange(total) - run_offsets
+
+
+def neighbor_pairs(xs: np.ndarray, zs: np.ndarray, radius: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Every unordered pair of rows closer than radius on the XZ plane.
+
+    Rows are bucketed into square cells of edge radius and sorted by cell,
+    so each cell's rows form one contiguous run, and a dense table over the
+    occupied cell range gives every run's start and length. Each row is
+    then expanded against the runs of half its 3x3 cell block (the other
+    half finds it from the opposite side) and the candidates are filtered
+    by exact distance. No Python loop runs per row or per pair; the work
+    grows with the number of candidate pairs, not rows squared.
+
+    Args:
+        xs: X coordinate of every row
+        zs: Z coordinate of every row
+        radius: Neighbor radius
+
+    Returns:
+        (first row, second row) index arrays, each close pair once
+    """
+    n = len(xs)
+    if n < 2:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+
+    keys, order, cell_counts, cell_starts, width = _cell_table(xs, zs, radius)
+
+    # Work in cell-sorted order from here on
+    keys = keys[order]
+    sorted_xs = xs[order]
+    sorted_zs = zs[order]
+
+    # Contiguous run of sorted rows for every cell of every row's half block
+    block_keys = (keys[:, None] + (_HALF_BLOCK[:, 0] * width + _HALF_BLOCK[:, 1])).ravel()
+    starts = cell_starts[block_keys]
+    counts = cell_counts[block_keys]
+
+    # Within its own cell a row only pairs with the rows after it
+    own_cell = slice(0, None, len(_HALF_BLOCK))
+    rows = np.arange(n)
+    counts[own_cell] -= rows - starts[own_cell] + 1
+    starts[own_cell] = rows + 1
+
+    # Expand runs into candidate pairs
+    firsts = np.repeat(np.repeat(rows, len(_HALF_BLOCK)), counts)
+    seconds = _expand_runs(starts, counts)
+
+    dx = sorted_xs[firsts] - sorted_xs[seconds]
+    dz = sorted_zs[firsts] - sorted_zs[seconds]
+    close = dx * dx + dz * dz < radius * radius
+    return order[firsts[close]], order[seconds[close]]
+
+
+def neighbors_of(xs: np.ndarray, zs: np.ndarray, radius: float, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Every row closer than radius to each of the given rows on the XZ plane.
+
+    Same cell table as neighbor_pairs, but only the given rows are expanded,
+    each against its whole 3x3 cell block, so the work grows with the
+    neighbors of those rows rather than with every pair in the set.
+
+    Args:
+        xs: X coordinate of every row
+        zs: Z coordinate of every row
+        radius: Neighbor radius
+        rows: Rows to find the neighbors of
+
+    Returns:
+        (row, neighbor row) index arrays, one entry per neighbor of each given row
+    """
+    if len(xs) < 2 or len(rows) == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+
+    keys, order, cell_counts, cell_starts, width = _cell_table(xs, zs, radius)
+    block_keys = (keys[rows][:, None] + (_FULL_BLOCK[:, 0] * width + _FULL_BLOCK[:, 1])).ravel()
+    counts = cell_counts[block_keys]
+    firsts = np.repeat(np.repeat(rows, len(_FULL_BLOCK)), counts)
+    seconds = order[_expand_runs(cell_starts[block_keys], counts)]
+
+    dx = xs[firsts] - xs[seconds]
+    dz = zs[firsts] - zs[seconds]
+    close = (dx * dx + dz * dz < radius * radius) & (firsts != seconds)
+    return firsts[close], seconds[close]
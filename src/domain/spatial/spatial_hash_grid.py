@@ -0,0 +1,165 @@
+"""Uniform-grid spatial index over the arena - pure Python domain logic."""
+
+import math
+from typing import List, Set
+import numpy as np
+
+
+class SpatialHashGrid:
+    """
+    Buckets integer item ids by the XZ grid cell they occupy.
+    Pure Python - no engine dependencies.
+
+    The grid covers the square arena centered on the origin; positions
+    outside it are clamped into the border cells. Queries return candidate
+    ids from every cell overlapping the search circle, so callers do the
+    exact distance test against their own position data.
+    """
+
+    def __init__(self, arena_size: float, cell_size: float = 2.0):
+        """
+        Initialize empty grid.
+
+        Args:
+            arena_size: Size of the arena (square)
+            cell_size: Edge length of one grid cell
+        """
+        self.half_size = arena_size / 2
+        self.cell_size = cell_size
+        self.cells_per_side = max(1, math.ceil(arena_size / cell_size))
+        self.cells: List[Set[int]] = [set() for _ in range(self.cells_per_side * self.cells_per_side)]
+        self.item_cells = np.full(64, -1, dtype=np.int64)  # cell index per item id, -1 if absent
+
+    def _axis_cell(self, value: float) -> int:
+        """Grid coordinate along one axis, clamped to the grid."""
+        cell = int((value + self.half_size) // self.cell_size)
+        return min(self.cells_per_side - 1, max(0, cell))
+
+    def cell_index(self, x: float, z: float) -> int:
+        """Flat cell index for a single position."""
+        return self._axis_cell(x) * self.cells_per_side + self._axis_cell(z)
+
+    def cell_indices(self, xs: np.ndarray, zs: np.ndarray) -> np.ndarray:
+        """Flat cell indices for arrays of positions."""
+        # np.minimum/np.maximum: np.clip carries a large fixed overhead for the small arrays used here.
+        # Truncating instead of floor-dividing only differs below zero, which is clamped to 0 anyway.
+        last = self.cells_per_side - 1
+        inverse = 1.0 / self.cell_size
+        ix = np.minimum(np.maximum(((xs + self.half_size) * inverse).astype(np.int64), 0), last)
+        iz = np.minimum(np.maximum(((zs + self.half_size) * inverse).astype(np.int64), 0), last)
+        return ix * self.cells_per_side + iz
+
+    def _ensure_item_capacity(self, item: int) -> None:
+        if item >= len(self.item_cells):
+            grown = np.full(max(item + 1, len(self.item_cells) * 2), -1, dtype=np.int64)
+            grown[: len(self.item_cells)] = self.item_cells
+            self.item_cells = grown
+
+    def insert(self, item: int, x: float, z: float) -> None:
+        """
+        Add an item at a position.
+
+        Args:
+            item: Non-negative integer id
+            x: X coordinate
+            z: Z coordinate
+        """
+        self._ensure_item_capacity(item)
+        self.remove(item)
+        cell = self.cell_index(x, z)
+        self.cells[cell].add(item)
+        self.item_cells[item] = cell
+
+    def insert_many(self, items: np.ndarray, xs: np.ndarray, zs: np.ndarray) -> None:
+        """
+        Add several items that are not in the grid yet.
+
+        Args:
+            items: Non-negative integer ids
+            xs: X coordinates
+            zs: Z coordinates
+        """
+        if len(items) == 0:
+            return
+        self._ensure_item_capacity(int(items.max()))
+        self.update(items, xs, zs)
+
+    def remove(self, item: int) -> None:
+        """Remove an item if present."""
+        if item >= len(self.item_cells):
+            return
+        cell = self.item_cells[item]
+        if cell >= 0:
+            self.cells[cell].discard(item)
+            self.item_cells[item] = -1
+
+    def relabel(self, old_item: int, new_item: int) -> None:
+        """
+        Move an item to a new id, keeping its cell.
+
+        Args:
+            old_item: Current id
+            new_item: Id to store it under (must not be present)
+        """
+        if old_item >= len(self.item_cells):
+            return
+        cell = self.item_cells[old_item]
+        if cell < 0:
+            return
+        self._ensure_item_capacity(new_item)
+        self.cells[cell].discard(old_item)
+        self.cells[cell].add(new_item)
+        self.item_cells[old_item] = -1
+        self.item_cells[new_item] = cell
+
+    def update(self, items: np.ndarray, xs: np.ndarray, zs: np.ndarray) -> int:
+        """
+        Re-bucket items after they moved; only items that changed cell are touched.
+
+        Args:
+            items: Item ids (all previously inserted)
+            xs: New X coordinates
+            zs: New Z coordinates
+
+        Returns:
+            Number of items that changed cell
+        """
+        new_cells = self.cell_indices(xs, zs)
+        old_cells = self.item_cells[items]
+        changed = np.flatnonzero(new_cells != old_cells)
+        for i in changed:
+            item = int(items[i])
+            old_cell = old_cells[i]
+            new_cell = int(new_cells[i])
+            if old_cell >= 0:
+                self.cells[old_cell].discard(item)
+            self.cells[new_cell].add(item)
+            self.item_cells[item] = new_cell
+        return len(changed)
+
+    def query_radius(self, x: float, z: float, radius: float) -> List[int]:
+        """
+        Candidate items in every cell overlapping a circle.
+
+        Args:
+            x: Circle center X
+            z: Circle center Z
+            radius: Circle radius
+
+        Returns:
+            Item ids that may lie within radius (superset of exact result)
+        """
+        min_ix, max_ix = self._axis_cell(x - radius), self._axis_cell(x + radius)
+        min_iz, max_iz = self._axis_cell(z - radius), self._axis_cell(z + radius)
+        result: List[int] = []
+        for ix in range(min_ix, max_ix + 1):
+            row_start = ix * self.cells_per_side
+            for iz in range(min_iz, max_iz + 1):
+                result.extend(self.cells[row_start + iz])
+        return result
+
+    def clear(self) -> None:
+        """Remove all items."""
+        for cell in self.cells:
+            cell.clear()
+        self.item_cells.fill(-1)
@@ -0,0 +1,104 @@
+"""Batched spawn placement - jittered-grid Poisson-disk sampling."""
+
+import math
+from typing import Optional, Tuple
+import numpy as np
+from domain.arena import ArenaGeometry
+
+# Candidate cells generated per requested position, so random selection leaves gaps between enemies
+CANDIDATES_PER_SPAWN = 2.0
+# Cell shrink factor when too few candidates survive the player-distance filter
+CELL_SHRINK = 0.7
+MAX_REFINEMENTS = 8
+
+
+def sample_spawn_positions(
+    rng: np.random.Generator,
+    count: int,
+    arena_size: float,
+    margin: float,
+    player_position: Tuple[float, float, float],
+    min_player_distance: float,
+    min_spacing: float,
+    occupied: Optional[np.ndarray] = None,
+    geometry: Optional[ArenaGeometry] = None,
+) -> np.ndarray:
+    """
+    Place a whole wave at once, spread out and away from the player.
+
+    The spawn area is tiled into square cells and one point is jittered
+    inside each cell, inset by half the spacing from every cell edge, so any
+    two points are at least min_spacing apart. Points closer than
+    min_player_distance to the player are dropped and count of the rest are
+    picked at random. Candidates within min_spacing of an occupied position
+    (enemies already alive) are dropped too, as are candidates within
+    min_spacing / 2 of a static box (cover). Cells are sized for about CANDIDATES_PER_SPAWN
+    candidates per enemy. When the area cannot hold count enemies at
+    min_spacing, the cells (and the spacing) shrink until it can. If it
+    still cannot, the player distance is relaxed (farthest points first),
+    then the spacing from occupied positions; cover is never entered.
+
+    Args:
+        rng: Random generator
+        count: Number of positions
+        arena_size: Size of the arena (square)
+        margin: Distance to stay away from walls
+        player_position: Player position (x, y, z)
+        min_player_distance: Minimum XZ distance from the player
+        min_spacing: Minimum XZ distance between any two positions
+        occupied: Positions (n, 3) that new positions keep min_spacing from
+        geometry: Static arena geometry whose boxes positions stay out of
+
+    Returns:
+        Array of shape (count, 3) with y = 0
+    """
+    positions = np.zeros((count, 3), dtype=np.float64)
+    if count == 0:
+        return positions
+
+    half_size = arena_size / 2 - margin
+    side = 2 * half_size
+    free_area = max(side * side - math.pi * min_player_distance**2, side * side * 0.1)
+    cell = max(min_spacing, math.sqrt(free_area / (count * CANDIDATES_PER_SPAWN)))
+
+    for _ in range(MAX_REFINEMENTS + 1):
+        cells_per_side = max(1, int(side // cell))
+        cell = side / cells_per_side
+        spacing = min(min_spacing, cell)
+
+        # One jittered point per cell, inset by spacing / 2 from the cell edges
+        corners = -half_size + np.arange(cells_per_side) * cell + spacing / 2
+        xs = np.repeat(corners, cells_per_side) + rng.random(cells_per_side**2) * (cell - spacing)
+        zs = np.tile(corners, cells_per_side) + rng.random(cells_per_side**2) * (cell - spacing)
+
+        dx = xs - player_position[0]
+        dz = zs - player_position[2]
+        distance_sq = dx * dx + dz * dz
+        unoccupied = np.ones(len(xs), dtype=bool)
+        if occupied is not None and len(occupied):
+            gap_x = xs[:, None] - occupied[None, :, 0]
+            gap_z = zs[:, None] - occupied[None, :, 2]
+            unoccupied = ((gap_x * gap_x + gap_z * gap_z) >= spacing * spacing).all(axis=1)
+        unblocked = np.ones(len(xs), dtype=bool)
+        if geometry is not None:
+            unblocked = ~geometry.blocked_xz(xs, zs, spacing / 2)
+        keep = (distance_sq >= min_player_distance * min_player_distance) & unoccupied & unblocked
+        candidates = np.flatnonzero(keep)
+        if len(candidates) >= count:
+            chosen = rng.choice(candidates, count, replace=False)
+            break
+        cell *= CELL_SHRINK
+    else:
+        # The player-distance ring cannot hold the wave: take every candidate, then the farthest
+        # points that are only too close to the player, then (last resort) those crowding live
+        # enemies; cover is never entered and no cell is used twice
+        tier = np.where(keep, 0, np.where(unoccupied & unblocked, 1, np.where(unblocked, 2, 3)))
+        order = np.lexsort((-distance_sq, tier))
+        chosen = order[: min(count, int(np.count_nonzero(unblocked)))]
+        if len(chosen) < count:
+            # Fewer open cells than enemies (a degenerate arena): reuse them rather than enter cover
+            chosen = np.resize(chosen if len(chosen) else order, count)
+
+    positions[:, 0] = xs[chosen]
+    positions[:, 2] = zs[chosen]
+    return positions
@@ -1,7 +1,12 @@
 """Wave management system - pure Python domain logic."""
 
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+import numpy as np
 from domain.entities.enemy import Enemy
+from domain.entities.enemy_swarm import EnemySwarm
+from domain.spatial import SpatialHashGrid
+from domain.arena import ArenaGeometry
+from .spawn_placement import sample_spawn_positions
 
 
 class WaveManager:
@@ -20,6 +25,11 @@ class WaveManager:
         arena_size: float,
         spawn_margin: float,
         min_player_distance: float,
+        spatial_cell_size: float = 2.0,
+        min_enemy_spacing: float = 1.5,
+        seed: Optional[int] = None,
+        max_alive: Optional[int] = None,
+        geometry: Optional[ArenaGeometry] = None,
     ):
         """
         Initialize wave manager.
@@ -33,6 +43,11 @@ class WaveManager:
             arena_size: Size of the arena (square)
             spawn_margin: Distance to stay away from arena walls
             min_player_distance: Minimum distance from player when spawning
+            spatial_cell_size: Cell size of the grid indexing enemy positions
+            min_enemy_spacing: Minimum distance between enemies spawned together
+            seed: Seed for spawn placement (None for a random seed)
+            max_alive: Most enemies alive at once; the rest of a wave waits as reinforcements (None = no cap)
+            geometry: Static arena geometry; enemies never spawn inside its boxes
         """
         self.base_enemy_count = base_enemy_count
         self.enemy_count_increment = enemy_count_increment
@@ -42,9 +57,19 @@ class WaveManager:
         self.arena_size = arena_size
         self.spawn_margin = spawn_margin
         self.min_player_distance = min_player_distance
+        self.min_enemy_spacing = min_enemy_spacing
+        self.rng = np.random.default_rng(seed)
+
+        self.max_alive = max_alive
+        self.geometry = geometry
 
         self.current_wave = 0
-        self.enemies_spawned_this_wave = 0
+        self.enemies_spawned_this_wave = 0  # total enemies in the current wave
+        self.reinforcements_remaining = 0  # enemies of the current wave not spawned yet
+        self.wave_enemy_speed = base_enemy_speed
+
+        # Struct-of-arrays store holding every live enemy, indexed by a spatial grid
+        self.swarm = EnemySwarm(grid=SpatialHashGrid(arena_size, spatial_cell_size))
 
     def calculate_enemy_count_for_wave(self, wave_number: int) -> int:
         """
@@ -70,30 +95,91 @@ class WaveManager:
         """
         return self.base_enemy_speed + (wave_number - 1) * self.enemy_speed_increment
 
-    def spawn_wave(self, wave_number: int, player_position: Tuple[float, float, float] = (0, 0, 0)) -> List[Enemy]:
+    def generate_spawn_positions(
+        self, count: int, player_position: Tuple[float, float, float] = (0, 0, 0)
+    ) -> np.ndarray:
+        """
+        Place count enemies at once, spaced apart, away from the player and from live enemies.
+
+        Args:
+            count: Number of positions
+            player_position: Current player position
+
+        Returns:
+            Array of shape (count, 3)
+        """
+        return sample_spawn_positions(
+            self.rng,
+            count,
+            self.arena_size,
+            self.spawn_margin,
+            player_position,
+            self.min_player_distance,
+            self.min_enemy_spacing,
+            self.swarm.positions[: self.swarm.count],
+            self.geometry,
+        )
+
+    def start_wave(self, wave_number: int) -> int:
         """
-        Generate enemies for a wave.
+        Queue every enemy of a wave as reinforcements, replacing any still queued.
 
         Args:
             wave_number: The wave number (1-based)
-            player_position: Current player position for spawn distance checking
 
         Returns:
-            List of Enemy instances
+            Number of enemies in the wave
         """
         enemy_count = self.calculate_enemy_count_for_wave(wave_number)
-        enemy_speed = self.calculate_enemy_speed_for_wave(wave_number)
+        self.wave_enemy_speed = self.calculate_enemy_speed_for_wave(wave_number)
+        self.enemies_spawned_this_wave = enemy_count
+        self.reinforcements_remaining = enemy_count
+        return enemy_count
 
-        enemies = []
-        for _ in range(enemy_count):
-            position = Enemy.generate_spawn_position(
-                self.arena_size, self.spawn_margin, player_position, self.min_player_distance
-            )
-            enemy = Enemy(position, enemy_speed, self.enemy_max_health)
-            enemies.append(enemy)
+    def spawn_reinforcements(
+        self, player_position: Tuple[float, float, float] = (0, 0, 0), budget: Optional[int] = None
+    ) -> List[Enemy]:
+        """
+        Spawn queued enemies of the current wave, up to the alive cap and the budget.
 
-        self.enemies_spawned_this_wave = enemy_count
-        return enemies
+        Args:
+            player_position: Current player position for spawn distance checking
+            budget: Most enemies to spawn in this call (None = no limit)
+
+        Returns:
+            Newly spawned enemies, each bound to a row of the swarm
+        """
+        count = self.reinforcements_remaining
+        if self.max_alive is not None:
+            count = min(count, self.max_alive - self.swarm.count)
+        if budget is not None:
+            count = min(count, budget)
+        if count <= 0:
+            return []
+
+        positions = self.generate_spawn_positions(count, player_position)
+        self.reinforcements_remaining -= count
+        return self.swarm.spawn_many(positions, self.wave_enemy_speed, self.enemy_max_health)
+
+    def spawn_wave(self, wave_number: int, player_position: Tuple[float, float, float] = (0, 0, 0)) -> List[Enemy]:
+        """
+        Start a wave and spawn as much of it as the alive cap allows.
+
+        Args:
+            wave_number: The wave number (1-based)
+            player_position: Current player position for spawn distance checking
+
+        Returns:
+            List of Enemy instances, each bound to a row of the swarm
+        """
+        self.start_wave(wave_number)
+        return self.spawn_reinforcements(player_position)
+
+    def reset(self) -> None:
+        """Return to before the first wave with no enemies queued."""
+        self.current_wave = 0
+        self.enemies_spawned_this_wave = 0
+        self.reinforcements_remaining = 0
 
     def advance_to_next_wave(self) -> int:
         """
@@ -0,0 +1,86 @@
+"""Offline rendering of ursfx-style retro sound effects."""
+
+import wave
+from typing import List, Tuple
+import numpy as np
+
+SEMITONE = 1.05946309436
+
+
+def read_wave(path: str) -> np.ndarray:
+    """
+    Read a mono 16-bit WAV file.
+
+    Args:
+        path: File path
+
+    Returns:
+        Samples as float32 in [-1, 1]
+    """
+    with wave.open(path, "rb") as source:
+        if source.getsampwidth() != 2 or source.getnchannels() != 1:
+            raise ValueError(f"Expected mono 16-bit WAV: {path}")
+        frames = source.readframes(source.getnframes())
+    return np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768.0
+
+
+def write_wave(path: str, samples: np.ndarray, sample_rate: int) -> None:
+    """
+    Write float samples in [-1, 1] as a mono 16-bit WAV file.
+
+    Args:
+        path: File path
+        samples: Audio samples
+        sample_rate: Samples per second
+    """
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype("<i2")
+    with wave.open(path, "wb") as target:
+        target.setnchannels(1)
+        target.setsampwidth(2)
+        target.setframerate(sample_rate)
+        target.writeframes(pcm.tobytes())
+
+
+def render_sfx(
+    source: np.ndarray,
+    volume_curve: List[Tuple[float, float]],
+    volume: float = 0.75,
+    pitch: float = 0,
+    pitch_change: float = 0,
+    speed: float = 1,
+    sample_rate: int = 44100,
+) -> np.ndarray:
+    """
+    Render what ursfx() would play, as a finished clip.
+
+    The looping source wave is resampled at a play rate that slides from
+    `pitch` to `pitch + pitch_change` semitones and is shaped by the
+    piecewise-linear volume curve, with the same timings as ursfx().
+
+    Args:
+        source: Looping source waveform (e.g. Ursina's noise/square clip)
+        volume_curve: (time, volume) points, times before speed scaling
+        volume: Volume multiplier
+        pitch: Start pitch in semitones
+        pitch_change: Pitch slide in semitones
+        speed: Playback speed multiplier for the curve
+        sample_rate: Output sample rate (the source is assumed to match)
+
+    Returns:
+        Samples as float32
+    """
+    duration = volume_curve[-1][0] / speed
+    t = np.arange(int(duration * sample_rate), dtype=np.float64) / sample_rate
+
+    curve_times = [point[0] / speed for point in volume_curve]
+    curve_volumes = [point[1] * volume for point in volume_curve]
+    envelope = np.interp(t, curve_times, curve_volumes)
+
+    # ursfx slides pitch linearly over the third-from-last curve point's time
+    slide_time = volume_curve[len(volume_curve) - 3][0] / speed
+    slide = np.clip(t / slide_time, 0.0, 1.0) if slide_time > 0 else np.ones_like(t)
+    play_rate = SEMITONE ** (pitch + slide * pitch_change)
+
+    phase = np.cumsum(play_rate) - play_rate[0]
+    samples = source[phase.astype(np.int64) % len(source)]
+    return (samples * envelope).astype(np.float32)
@@ -1,46 +1,112 @@
 """Sound effects manager for Ursina."""
 
 from ursina import *
-import random
+from ursina.audio import Audio as UrsinaAudio
+from panda3d.core import Filename
+from typing import Optional
+import hashlib
+import os
+import tempfile
+import numpy as np
+from config.game_config import GameConfig
+from .sfx_synth import read_wave, render_sfx, write_wave
+from .voice_pool import VoicePool
+
+SAMPLE_RATE = 44100
+
+# ursfx() parameters for each effect; pitch is a (low, high) range split into variants
+GUN_SHOT = {
+    "wave": "noise",
+    "volume_curve": [(0.0, 0.0), (0.1, 0.9), (0.15, 0.75), (0.3, 0.14), (0.6, 0.0)],
+    "volume": 0.5,
+    "pitch": (-13, -12),
+    "pitch_change": -12,
+    "speed": 3.0,
+}
+COUNTDOWN_BEEP = {
+    "wave": "square",
+    "volume_curve": [(0.0, 0.5), (0.1, 0.8), (0.2, 0.0)],
+    "volume": 0.3,
+    "pitch": (8, 9),
+    "pitch_change": 0,
+    "speed": 2.0,
+}
 
 
 class SoundManager:
     """
     Wraps Ursina sound effects for cleaner code.
     Infrastructure layer - Ursina specific.
+
+    Effects are rendered once by load() into a cache of WAV clips, a few pitch
+    variants each, and played through fixed voice pools. Playing a sound only
+    restarts an already loaded voice. If loading fails the error is reported
+    once and the game runs silently.
     """
 
-    @staticmethod
-    def play_gun_shot():
-        """Play procedural gun shot sound."""
+    gun_shot: Optional[VoicePool] = None
+    countdown_beep: Optional[VoicePool] = None
+
+    @classmethod
+    def load(cls) -> bool:
+        """
+        Render, cache and load every sound effect.
+
+        Returns:
+            True if sound effects are available
+        """
         try:
-            from ursina.prefabs.ursfx import ursfx
-
-            ursfx(
-                [(0.0, 0.0), (0.1, 0.9), (0.15, 0.75), (0.3, 0.14), (0.6, 0.0)],
-                volume=0.5,
-                wave="noise",
-                pitch=random.uniform(-13, -12),
-                pitch_change=-12,
-                speed=3.0,
-            )
+            cls.gun_shot = cls._load_effect("gun_shot", GUN_SHOT)
+            cls.countdown_beep = cls._load_effect("countdown_beep", COUNTDOWN_BEEP)
         except Exception as e:
-            # Silent fail if ursfx not available
-            pass
+            cls.gun_shot = cls.countdown_beep = None
+            print_warning(f"Sound effects disabled: {e}")
+            return False
+        return True
 
     @staticmethod
-    def play_countdown_beep():
-        """Play procedural countdown beep sound."""
-        try:
-            from ursina.prefabs.ursfx import ursfx
-
-            ursfx(
-                [(0.0, 0.5), (0.1, 0.8), (0.2, 0.0)],
-                volume=0.3,
-                wave="square",
-                pitch=random.uniform(8, 9),
-                speed=2.0,
-            )
-        except Exception as e:
-            # Silent fail if ursfx not available
-            pass
+    def _load_effect(name: str, effect: dict) -> VoicePool:
+        """Render an effect's pitch variants (reusing cached files) and load them into a voice pool."""
+        cache_folder = os.path.join(tempfile.gettempdir(), f"{GameConfig.NAME.lower()}_sfx")
+        os.makedirs(cache_folder, exist_ok=True)
+
+        source = None
+        paths = []
+        for pitch in np.linspace(*effect["pitch"], GameConfig.SFX_PITCH_VARIANTS):
+            params = {**effect, "pitch": float(pitch), "sample_rate": SAMPLE_RATE}
+            digest = hashlib.sha1(repr(sorted(params.items())).encode()).hexdigest()[:12]
+            path = os.path.join(cache_folder, f"{name}_{digest}.wav")
+            if not os.path.exists(path):
+                if source is None:
+                    source = read_wave(str(application.internal_audio_folder / f"{effect['wave']}.wav"))
+                samples = render_sfx(
+                    source,
+                    effect["volume_curve"],
+                    effect["volume"],
+                    float(pitch),
+                    effect["pitch_change"],
+                    effect["speed"],
+                    SAMPLE_RATE,
+                )
+                write_wave(path, samples, SAMPLE_RATE)
+            paths.append(path)
+
+        voices = []
+        for _ in range(GameConfig.SFX_VOICES):
+            sounds = [application.base.loader.loadSfx(Filename.from_os_specific(path)) for path in paths]
+            if any(sound is None for sound in sounds):
+                raise RuntimeError(f"could not load {name} clips from {cache_folder}")
+            voices.append(sounds)
+        return VoicePool(voices, UrsinaAudio.volume_multiplier)
+
+    @classmethod
+    def play_gun_shot(cls):
+        """Play gun shot sound."""
+        if cls.gun_shot:
+            cls.gun_shot.play()
+
+    @classmethod
+    def play_countdown_beep(cls):
+        """Play countdown beep sound."""
+        if cls.countdown_beep:
+            cls.countdown_beep.play()
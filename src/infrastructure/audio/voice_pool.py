@@ -0,0 +1,40 @@
+"""Fixed-size pool of preloaded sound voices."""
+
+import random
+from typing import List
+from panda3d.core import AudioSound
+
+
+class VoicePool:
+    """
+    Plays one of several pre-rendered clip variants on a fixed set of voices.
+    Infrastructure layer - Panda3D specific.
+
+    Every voice holds its own loaded copy of each variant. Voices are used
+    round-robin, so when all are busy the oldest playing one is stolen.
+    """
+
+    def __init__(self, voices: List[List[AudioSound]], volume: float = 1.0):
+        """
+        Initialize pool.
+
+        Args:
+            voices: For each voice, one loaded sound per clip variant
+            volume: Playback volume
+        """
+        self.voices = voices
+        self.volume = volume
+        self._next_voice = 0
+
+    def play(self) -> None:
+        """Play a random variant on the next voice, stopping whatever it was playing."""
+        voice = self.voices[self._next_voice]
+        self._next_voice = (self._next_voice + 1) % len(self.voices)
+
+        for sound in voice:
+            if sound.status() == AudioSound.PLAYING:
+                sound.stop()
+
+        sound = random.choice(voice)
+        sound.setVolume(self.volume)
+        sound.play()
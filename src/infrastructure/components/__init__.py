@@ -1,4 +1,4 @@
-"""Reusable game components."""
+"""Reusable Ursina components."""
 
 from .first_person_controller import FirstPersonController
 
@@ -0,0 +1,247 @@
+from ursina import *
+from application.profiling import FrameProfiler
+
+
+class FirstPersonController(Entity):
+    def __init__(self, height=2, **kwargs):
+        self.cursor = Entity(parent=camera.ui, model="quad", color=color.pink, scale=0.008, rotation_z=45)
+        super().__init__()
+        self.speed = 5
+        self.height = height
+        self.camera_pivot = Entity(parent=self, y=self.height)
+
+        camera.parent = self.camera_pivot
+        camera.position = Vec3(0, 0, -0.2)
+        camera.rotation = Vec3.zero
+        camera.fov = 90
+        mouse.locked = True
+        self.mouse_sensitivity = Vec2(40, 40)
+
+        self.gravity = 1
+        self.grounded = False
+        self.jump_height = 8.0
+        self.gravity_strength = 20.0
+        self.y_velocity = 0
+
+        self.traverse_target = scene
+        self.ignore_list = [self]
+        self.on_destroy = self.on_disable
+
+        # Analytic collision: resolve against known static geometry instead of raycasting the scene
+        self.arena_geometry = None
+        self.collision_radius = 0.7
+        self.dynamic_obstacles = None  # analytic mode: (x, z, feet_y, height, radius) -> (x, z) out of moving obstacles
+        self.profiler = FrameProfiler()  # times ground and wall queries when enabled
+
+        # Fixed-step mode: the owner calls simulate() at a fixed rate and interpolate() once per frame
+        self.fixed_step = False
+        self._previous_position = None
+        self._sim_position = None
+        self._display_position = None
+        self.held_keys = held_keys  # key state simulate() reads; a fixed-step owner can hand in per-tick input
+
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+        if self.gravity:
+            ground_y = self._ground_height(self.y + self.height, distance=9999)
+            if ground_y is not None:
+                self.y = ground_y
+
+    def on_window_ready(self):
+        camera.rotation = Vec3.zero
+
+    def _deflect_along_wall(self, move_amount, wall_normal):
+        """Deflect movement vector along wall to enable wall sliding."""
+        dot_product = move_amount.x * wall_normal.x + move_amount.z * wall_normal.z
+        if dot_product < 0:
+            move_amount.x -= wall_normal.x * dot_product
+            move_amount.z -= wall_normal.z * dot_product
+
+    def update(self):
+        self.rotation_y += mouse.velocity[0] * self.mouse_sensitivity[1]
+        self.camera_pivot.rotation_x -= mouse.velocity[1] * self.mouse_sensitivity[0]
+        self.camera_pivot.rotation_x = clamp(self.camera_pivot.rotation_x, -90, 90)
+
+        if not self.fixed_step:
+            self.simulate(time.dt)
+
+    def simulate(self, dt):
+        """Advance gravity, jumping and walking by dt seconds."""
+        self._previous_position = Vec3(self.position)
+
+        if self.gravity:
+            # Ground detection from feet level for better obstacle detection
+            ground_y = self._ground_height(self.y + 0.3, distance=5.0)
+
+            if ground_y is not None:
+                # Calculate actual height above ground
+                height_above_ground = self.y - ground_y
+
+                # Only consider grounded if very close to ground AND falling
+                if height_above_ground <= 0.1 and self.y_velocity <= 0:
+                    if not self.grounded:
+                        self.land()
+                    self.grounded = True
+
+                    # Snap to exact ground height
+                    self.y = ground_y
+                    self.y_velocity = 0
+                else:
+                    # Too high above ground or jumping up - still in air
+                    self.grounded = False
+            else:
+                # No ground detected below (falling into void)
+                self.grounded = False
+
+            # Apply gravity whenever not grounded (in air)
+            if not self.grounded:
+                self.y_velocity -= self.gravity_strength * dt * self.gravity
+
+            # Apply vertical velocity (happens whether grounded or not for upward jumps)
+            if self.y_velocity != 0:
+                self.y += self.y_velocity * dt
+
+            # Check for ceiling collision when jumping upward
+            if self.y_velocity > 0:
+                ceiling_y = self._ceiling_height()
+                if ceiling_y is not None and ceiling_y - self.y < self.height:
+                    self.y_velocity = 0
+                    self.y = ceiling_y - self.height
+
+        keys = self.held_keys
+        if keys["space"] and self.grounded:
+            self.jump()
+
+        self.direction = Vec3(
+            self.forward * (keys["w"] - keys["s"]) + self.right * (keys["d"] - keys["a"])
+        ).normalized()
+
+        # Calculate desired movement
+        move_amount = self.direction * dt * self.speed
+
+        with self.profiler.scope("player.walls"):
+            if self.arena_geometry is None:
+                self._deflect_by_raycasts(move_amount, self.traverse_target)
+                self.position += move_amount
+                if self.dynamic_obstacles is not None:
+                    self.x, self.z = self.dynamic_obstacles(self.x, self.z, self.y, self.height, self.collision_radius)
+                return
+
+            # Analytic mode: push out of moving obstacles, then resolve static geometry (walls win)
+            x, z = self.x + move_amount.x, self.z + move_amount.z
+            if self.dynamic_obstacles is not None:
+                x, z = self.dynamic_obstacles(x, z, self.y, self.height, self.collision_radius)
+            self.x, self.z = self.arena_geometry.resolve_horizontal(x, z, self.y, self.height, self.collision_radius)
+
+    def begin_steps(self):
+        """Move back from the interpolated display position to the last simulated one before stepping."""
+        if self._display_position is not None and self.position == self._display_position:
+            self.position = self._sim_position
+        else:
+            # First frame, or moved from outside (respawn): nothing to interpolate from
+            self._previous_position = Vec3(self.position)
+
+    def interpolate(self, alpha):
+        """Show the body between the last two simulated positions (alpha 0 = previous, 1 = latest)."""
+        self._sim_position = Vec3(self.position)
+        self.position = lerp(self._previous_position, self._sim_position, alpha)
+        self._display_position = Vec3(self.position)
+
+    def _ground_height(self, from_y, distance):
+        """Height of the highest surface below from_y within distance, or None."""
+        with self.profiler.scope("player.ground"):
+            if self.arena_geometry is not None:
+                return self.arena_geometry.ground_height(self.x, self.z, from_y, distance)
+
+            ray = raycast(
+                Vec3(self.x, from_y, self.z),
+                self.down,
+                distance=distance,
+                traverse_target=self.traverse_target,
+                ignore=self.ignore_list,
+            )
+            return ray.world_point[1] if ray.hit else None
+
+    def _ceiling_height(self):
+        """Height of the lowest surface above the feet within player height, or None."""
+        with self.profiler.scope("player.ground"):
+            if self.arena_geometry is not None:
+                return self.arena_geometry.ceiling_height(self.x, self.z, self.y, self.height + 0.1)
+
+            ray = raycast(
+                self.world_position,
+                Vec3(0, 1, 0),
+                distance=self.height + 0.1,
+                traverse_target=self.traverse_target,
+                ignore=self.ignore_list,
+            )
+            return ray.world_point[1] if ray.hit else None
+
+    def _deflect_by_raycasts(self, move_amount, traverse_target):
+        """Deflect movement along anything hit by 8-direction probes around the player."""
+        check_distance = 1.0  # Lookahead distance
+        safe_distance = 0.7  # Collision threshold
+
+        # Define 8 directions: 4 cardinal + 4 diagonal for complete coverage
+        check_directions = [
+            # Cardinal
+            self.forward,
+            self.back,
+            self.left,
+            self.right,
+            # Forward diagonals
+            self.forward + self.left,
+            self.forward + self.right,
+            # Back diagonals
+            self.back + self.left,
+            self.back + self.right,
+        ]
+
+        # Check all directions and deflect movement along walls
+        for direction in check_directions:
+            ray = raycast(
+                self.position + Vec3(0, 1, 0),
+                direction.normalized(),
+                distance=check_distance,
+                traverse_target=traverse_target,
+                ignore=self.ignore_list,
+            )
+
+            if ray.hit and ray.distance < safe_distance:
+                self._deflect_along_wall(move_amount, ray.normal)
+
+    def _deflect_along_wall(self, move_amount, wall_normal):
+        """Deflect movement vector along wall to enable wall sliding."""
+        dot_product = move_amount.x * wall_normal.x + move_amount.z * wall_normal.z
+        if dot_product < 0:
+            move_amount.x -= wall_normal.x * dot_product
+            move_amount.z -= wall_normal.z * dot_product
+
+    def jump(self):
+        """Apply upward velocity for physics-based jump."""
+        if not self.grounded:
+            return
+
+        # Apply instant upward velocity
+        self.y_velocity = self.jump_height
+        self.grounded = False
+
+    def land(self):
+        """Called when player lands on ground."""
+        self.y_velocity = 0
+        self.grounded = True
+
+    def on_enable(self):
+        mouse.locked = True
+        self.cursor.enabled = True
+
+        if hasattr(self, "camera_pivot") and hasattr(self, "_original_camera_transform"):
+            camera.parent = self.camera_pivot
+            camera.transform = self._original_camera_transform
+
+    def on_disable(self):
+        mouse.locked = False
+        self.cursor.enabled = False
+        self._original_camera_transform = camera.transform
+        camera.world_parent = scene
@@ -1,14 +1,31 @@
 """Keyboard input mapping for Ursina."""
 
 from ursina import *
+from typing import Dict
+from application.replay import Button
+from config.game_config import GameConfig
 
 
 class KeyboardMapper:
     """
     Maps keyboard input to application layer commands.
     Infrastructure layer - Ursina specific.
+
+    Held keys are not acted on directly: they are sampled once per
+    simulation tick as Button flags, which is also what gets recorded and
+    replayed.
     """
 
+    # Held key -> Button flag sampled each tick
+    HELD_BUTTONS = {
+        "w": Button.FORWARD,
+        "s": Button.BACK,
+        "a": Button.LEFT,
+        "d": Button.RIGHT,
+        "space": Button.JUMP,
+        "left mouse": Button.FIRE,
+    }
+
     def __init__(self, input_handler, shooting_handler):
         """
         Initialize keyboard mapper.
@@ -29,11 +46,43 @@ class KeyboardMapper:
         """
         if key == "r":
             self.input_handler.handle_restart()
+        elif key == "t":
+            self.input_handler.handle_retry_wave()
         elif key == "escape":
             self.input_handler.handle_quit()
+        elif key == "p":
+            self.input_handler.handle_toggle_pause()
+        elif GameConfig.DEVELOPMENT:
+            # Development-only time controls
+            if key == "]":
+                self.input_handler.handle_time_scale(GameConfig.TIME_SCALE_STEP)
+            elif key == "[":
+                self.input_handler.handle_time_scale(1 / GameConfig.TIME_SCALE_STEP)
+            elif key == ".":
+                self.input_handler.handle_step()
+
+    def held_buttons(self) -> int:
+        """Button flags of the keys held right now."""
+        buttons = 0
+        for key, button in self.HELD_BUTTONS.items():
+            if held_keys[key]:
+                buttons |= button
+        return buttons
+
+    @classmethod
+    def movement_keys(cls, buttons: int) -> Dict[str, int]:
+        """
+        Key state for the player controller from a tick's Button flags.
+
+        Args:
+            buttons: Button flags of the tick
+
+        Returns:
+            Movement and jump key names mapped to 1 (held) or 0
+        """
+        return {key: int(bool(buttons & button)) for key, button in cls.HELD_BUTTONS.items() if button != Button.FIRE}
 
-    def update(self):
-        """Update held keys (shooting)."""
-        if held_keys["left mouse"] and not self.input_handler.game_over:
-            if self.input_handler.handle_shoot():
-                self.shooting_handler.handle_shoot()
+    def shoot(self):
+        """Fire if the game allows it (called on every tick the fire button is held)."""
+        if not self.input_handler.game_over and self.input_handler.handle_shoot():
+            self.shooting_handler.handle_shoot()
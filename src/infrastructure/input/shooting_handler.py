@@ -1,64 +1,61 @@
 """Shooting handler for player input."""
 
 from ursina import *
-from typing import Optional
+from typing import Callable, Optional
+from domain.combat import HitscanResolver
 from domain.entities import Enemy
-from infrastructure.audio import SoundManager
 
 
 class ShootingHandler:
     """
-    Handles shooting input, raycasting, and visual feedback.
+    Handles shooting input, hitscan and visual feedback.
     Infrastructure layer - Ursina specific.
     """
 
-    def __init__(self, gun: Entity, shootables_parent: Entity, weapon_range: float, weapon_damage: int):
+    def __init__(self, gun: Entity, hitscan: Optional[HitscanResolver], game_service, weapon_range: float):
         """
         Initialize shooting handler.
 
         Args:
             gun: Gun entity with muzzle flash
-            shootables_parent: Parent entity for raycast targeting
+            hitscan: Resolver testing shots against domain enemy and wall boxes (None: forward shots to the worker)
+            game_service: GameService applying hits (RemoteGameService when hitscan is None)
             weapon_range: Maximum shooting distance
-            weapon_damage: Damage per shot
         """
         self.gun = gun
-        self.shootables_parent = shootables_parent
+        self.hitscan = hitscan
+        self.game_service = game_service
         self.weapon_range = weapon_range
-        self.weapon_damage = weapon_damage
 
-    def handle_shoot(self) -> Optional[Entity]:
+        # Callbacks
+        self.on_shot: Optional[Callable[[], None]] = None
+
+    def handle_shoot(self) -> Optional[Enemy]:
         """
-        Perform shooting action: visual effects + raycast.
+        Perform shooting action: visual effects + hitscan.
 
         Returns:
-            Hit entity if something was hit, None otherwise
+            Hit enemy if an enemy was hit, None otherwise
         """
         # Muzzle flash
         self.gun.muzzle_flash.enabled = True
         invoke(self.gun.muzzle_flash.disable, delay=0.05)
 
         # Sound
-        SoundManager.play_gun_shot()
+        if self.on_shot:
+            self.on_shot()
+
+        # Simulation runs in a worker process: it resolves the shot against its own enemies
+        if self.hitscan is None:
+            self.game_service.forward_shot(tuple(camera.world_position), tuple(camera.forward), self.weapon_range)
+            return None
 
-        # Raycast
-        hit_info = raycast(
-            origin=camera.world_position,
-            direction=camera.forward,
-            distance=self.weapon_range,
-            traverse_target=self.shootables_parent,
-        )
+        # Hitscan (walls block shots)
+        result = self.hitscan.cast(tuple(camera.world_position), tuple(camera.forward), self.weapon_range)
 
-        if hit_info.hit and hasattr(hit_info.entity, "hp"):
-            # Apply damage
-            hit_info.entity.hp -= self.weapon_damage
-            # Only blink if entity still exists (not destroyed)
-            try:
-                if hit_info.entity and hasattr(hit_info.entity, "blink"):
-                    hit_info.entity.blink(color.red)
-            except:
-                # Entity was destroyed, that's okay
-                pass
-            return hit_info.entity
+        if result.enemy is not None:
+            # Damage and visual feedback go through the game service callbacks
+            self.game_service.handle_enemy_hit(result.enemy)
+            return result.enemy
 
         return None
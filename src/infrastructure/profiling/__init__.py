@@ -0,0 +1,6 @@
+"""Profiling integrations for Ursina/Panda3D."""
+
+from .pstats_bridge import PStatsBridge
+from .profiler_overlay import ProfilerOverlay
+
+__all__ = ["PStatsBridge", "ProfilerOverlay"]
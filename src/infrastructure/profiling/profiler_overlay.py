@@ -0,0 +1,75 @@
+"""In-game frame profiler overlay."""
+
+from ursina import *
+from application.profiling import FrameProfiler
+
+
+class ProfilerOverlay(Entity):
+    """
+    Shows rolling frame and scope timings in the top-left corner.
+    Infrastructure layer - Ursina specific.
+
+    Keys: toggle_key hides/shows the overlay, export_key writes the
+    recorded events as a Chrome trace.
+    """
+
+    REFRESH_INTERVAL = 0.5  # seconds between text rebuilds
+    MAX_ROWS = 12
+
+    def __init__(
+        self,
+        profiler: FrameProfiler,
+        trace_path: str,
+        toggle_key: str = "f3",
+        export_key: str = "f4",
+    ):
+        """
+        Initialize overlay.
+
+        Args:
+            profiler: Profiler to display
+            trace_path: File written by the export key
+            toggle_key: Key toggling the overlay
+            export_key: Key exporting the Chrome trace
+        """
+        super().__init__(parent=camera.ui)
+        self.profiler = profiler
+        self.trace_path = trace_path
+        self.toggle_key = toggle_key
+        self.export_key = export_key
+        self.text = Text(
+            parent=self,
+            text="",
+            position=window.top_left + Vec2(0.01, -0.01),
+            origin=(-0.5, 0.5),
+            scale=0.7,
+            font="VeraMono.ttf",
+            color=color.light_gray,
+        )
+        self._next_refresh = 0.0
+
+    def update(self):
+        """Rebuild the text a few times per second."""
+        if time.time() < self._next_refresh:
+            return
+        self._next_refresh = time.time() + self.REFRESH_INTERVAL
+
+        frame_ms = self.profiler.frame_time_ms()
+        fps = 1000 / frame_ms if frame_ms else 0
+        lines = [f"frame {frame_ms:6.2f} ms  {fps:5.0f} fps", f"{'scope':<26}{'avg':>7}{'max':>7}{'calls':>7}"]
+        for entry in self.profiler.stats()[: self.MAX_ROWS]:
+            lines.append(f"{entry.name:<26}{entry.average_ms:7.2f}{entry.max_ms:7.2f}{entry.calls_per_frame:7.0f}")
+        lines.append(f"{'unscoped (render, engine)':<26}{self.profiler.unscoped_time_ms():7.2f}")
+        if self.profiler.counters:
+            lines.append(f"{'counter':<26}{'value':>7}")
+        for name, value in sorted(self.profiler.counters.items()):
+            lines.append(f"{name:<26}{value:7.0f}")
+        self.text.text = "\n".join(lines)
+
+    def input(self, key):
+        """Handle toggle and export keys."""
+        if key == self.toggle_key:
+            self.text.enabled = not self.text.enabled
+        elif key == self.export_key:
+            count = self.profiler.export_chrome_trace(self.trace_path)
+            print_info(f"Wrote {count} trace events to {self.trace_path}")
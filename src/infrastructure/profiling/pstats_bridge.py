@@ -0,0 +1,41 @@
+"""Mirrors FrameProfiler scopes into Panda3D PStats."""
+
+from panda3d.core import PStatClient, PStatCollector
+from application.profiling import FrameProfiler
+
+
+class PStatsBridge:
+    """
+    Registers every profiler scope as a PStats collector.
+    Infrastructure layer - Panda3D specific.
+
+    Scope "enemies.step" shows up as "OpenBNW:enemies:step" in the PStats
+    timeline next to Panda3D's own cull and draw collectors.
+    """
+
+    ROOT_COLLECTOR = "OpenBNW"
+
+    def __init__(self, profiler: FrameProfiler, connect: bool = True):
+        """
+        Initialize bridge.
+
+        Args:
+            profiler: Profiler whose scopes are mirrored
+            connect: Connect to a running PStats server (pstats) right away
+        """
+        self.profiler = profiler
+        profiler.add_collector_factory(self.collector_for)
+        if connect and not PStatClient.is_connected():
+            PStatClient.connect()
+
+    def collector_for(self, name: str) -> PStatCollector:
+        """
+        Create the PStats collector for a scope name.
+
+        Args:
+            name: Dotted scope name
+
+        Returns:
+            PStatCollector
+        """
+        return PStatCollector(f"{self.ROOT_COLLECTOR}:{name.replace('.', ':')}")
@@ -1,8 +1,21 @@
 """Rendering components."""
 
 from .enemy_renderer import EnemyRenderer
+from .instanced_enemy_renderer import InstancedEnemyRenderer
 from .hud_renderer import HUDRenderer
 from .arena_renderer import ArenaRenderer
 from .player_renderer import PlayerRenderer
+from .assets import resolve_color, resolve_texture
+from .graphics_quality import GraphicsQuality, make_unlit
 
-__all__ = ["EnemyRenderer", "HUDRenderer", "ArenaRenderer", "PlayerRenderer"]
+__all__ = [
+    "EnemyRenderer",
+    "InstancedEnemyRenderer",
+    "HUDRenderer",
+    "ArenaRenderer",
+    "PlayerRenderer",
+    "resolve_color",
+    "resolve_texture",
+    "GraphicsQuality",
+    "make_unlit",
+]
@@ -0,0 +1,180 @@
+"""Merged static arena mesh and collision."""
+
+from ursina import *
+from ursina.collider import Collider
+from panda3d.core import (
+    ColorScaleAttrib,
+    CollisionBox,
+    Geom,
+    GeomEnums,
+    GeomNode,
+    GeomTriangles,
+    GeomVertexData,
+    GeomVertexFormat,
+    NodePath,
+    Point3,
+    RenderState,
+    TextureAttrib,
+)
+from typing import Dict
+import numpy as np
+from domain.arena import ArenaGeometry
+from config.game_config import GameConfig
+from .assets import resolve_color, resolve_texture
+
+WALL_TILE = (2.0, 3.0)  # world units per wall texture repeat (horizontal, vertical)
+WALL_TINT = "gray"
+
+# Geoms of the arena GeomNode, one per texture
+GROUND_GEOM = 0
+BOX_GEOM = 1
+
+# Box faces that can be seen (bottoms rest on the ground): outward normal and the (u, v) axes of world-space UVs
+_BOX_FACES = [
+    ((1, 0, 0), (2, 1)),
+    ((-1, 0, 0), (2, 1)),
+    ((0, 0, 1), (0, 1)),
+    ((0, 0, -1), (0, 1)),
+    ((0, 1, 0), (0, 2)),
+]
+
+
+def _face_corners(normal: tuple, u_axis: int, v_axis: int) -> np.ndarray:
+    """Unit-cube corners (4, 3) of a face, wound so the face is front-facing from outside."""
+    axis = int(np.flatnonzero(normal)[0])
+    corners = np.zeros((4, 3))
+    corners[:, axis] = 1.0 if normal[axis] > 0 else 0.0
+    corners[:, u_axis] = (0, 1, 1, 0)
+    corners[:, v_axis] = (0, 0, 1, 1)
+    # Ursina is left-handed y-up: front faces have cross(e1, e2) pointing inward
+    if np.dot(np.cross(corners[1] - corners[0], corners[2] - corners[0]), normal) > 0:
+        corners = corners[::-1].copy()
+    return corners
+
+
+_FACE_TEMPLATES = [
+    (np.array(normal, dtype=np.float64), _face_corners(normal, *axes), axes) for normal, axes in _BOX_FACES
+]
+
+
+def _make_geom(vertices: np.ndarray, normals: np.ndarray, uvs: np.ndarray) -> Geom:
+    """Indexed triangle geom from quads (every 4 consecutive vertices form one quad)."""
+    rows = len(vertices)
+    data = np.empty((rows, 8), dtype=np.float32)
+    data[:, 0:3] = vertices
+    data[:, 3:6] = normals
+    data[:, 6:8] = uvs
+
+    vertex_data = GeomVertexData("arena", GeomVertexFormat.get_v3n3t2(), Geom.UH_static)
+    vertex_data.unclean_set_num_rows(rows)
+    memoryview(vertex_data.modify_array(0)).cast("B").cast("f")[:] = data.ravel()
+
+    quads = np.arange(0, rows, 4, dtype=np.uint32)[:, None]
+    indices = (quads + np.array([0, 1, 2, 0, 2, 3], dtype=np.uint32)).ravel()
+    triangles = GeomTriangles(Geom.UH_static)
+    triangles.set_index_type(GeomEnums.NT_uint32)
+    index_array = triangles.modify_vertices()
+    index_array.unclean_set_num_rows(len(indices))
+    memoryview(index_array).cast("B").cast("I")[:] = indices
+
+    geom = Geom(vertex_data)
+    geom.add_primitive(triangles)
+    return geom
+
+
+def _ground_geom(geometry: ArenaGeometry) -> Geom:
+    """Ground plane as a single quad, texture repeated sqrt(size) times per side."""
+    half = geometry.ground_half_size
+    corners = np.array([[-half, 0, -half], [half, 0, -half], [half, 0, half], [-half, 0, half]], dtype=np.float64)
+    corners[:, 1] = geometry.ground_y
+    repeats = np.sqrt(2 * half)
+    uvs = (corners[:, [0, 2]] + half) / (2 * half) * repeats
+    normals = np.tile([0.0, 1.0, 0.0], (4, 1))
+    return _make_geom(corners, normals, uvs)
+
+
+def _box_geom(geometry: ArenaGeometry) -> Geom:
+    """Every static box in one geom, with world-space UVs so walls and cover share texel density."""
+    mins = np.array([(box.min_x, box.min_y, box.min_z) for box in geometry.boxes], dtype=np.float64)
+    sizes = np.array([box.size for box in geometry.boxes], dtype=np.float64)
+    tile = np.array([WALL_TILE[0], WALL_TILE[1], WALL_TILE[0]])
+
+    vertices, normals, uvs = [], [], []
+    for normal, corners, (u_axis, v_axis) in _FACE_TEMPLATES:
+        face = mins[:, None, :] + corners[None, :, :] * sizes[:, None, :]  # (boxes, 4, 3)
+        vertices.append(face)
+        normals.append(np.broadcast_to(normal, face.shape))
+        uvs.append(np.stack([face[..., u_axis] / tile[u_axis], face[..., v_axis] / tile[v_axis]], axis=-1))
+
+    # Order quads box by box so each box's faces are contiguous
+    vertices = np.stack(vertices, axis=1).reshape(-1, 3)
+    normals = np.stack(normals, axis=1).reshape(-1, 3)
+    uvs = np.stack(uvs, axis=1).reshape(-1, 2)
+    return _make_geom(vertices, normals, uvs)
+
+
+def _build_node(geometry: ArenaGeometry) -> GeomNode:
+    """Untextured arena GeomNode: ground geom, then one geom holding every box."""
+    node = GeomNode("arena")
+    node.add_geom(_ground_geom(geometry))
+    node.add_geom(_box_geom(geometry))
+    return node
+
+
+# Built arena nodes by box layout; geoms are shared by every copy handed out
+_built: Dict[tuple, GeomNode] = {}
+
+
+def load_arena_model(geometry: ArenaGeometry) -> NodePath:
+    """
+    Arena ground and boxes as one static node with one geom per texture.
+
+    Draw calls stay at two however many boxes the arena has. Built geoms
+    are cached by layout, so setting up the same arena again only copies
+    the node and reapplies textures.
+
+    Args:
+        geometry: Static arena geometry
+
+    Returns:
+        NodePath holding a single GeomNode
+    """
+    boxes = tuple((box.min_x, box.min_y, box.min_z, box.max_x, box.max_y, box.max_z) for box in geometry.boxes)
+    key = (geometry.ground_half_size, geometry.ground_y, boxes)
+    if key not in _built:
+        _built[key] = _build_node(geometry)
+    model = NodePath(_built[key].make_copy())
+
+    node = model.node()
+    node.set_geom_state(
+        GROUND_GEOM, RenderState.make(TextureAttrib.make(resolve_texture(GameConfig.GROUND_TEXTURE)._texture))
+    )
+    node.set_geom_state(
+        BOX_GEOM,
+        RenderState.make(
+            TextureAttrib.make(resolve_texture(GameConfig.WALL_TEXTURE)._texture),
+            ColorScaleAttrib.make(resolve_color(WALL_TINT)),
+        ),
+    )
+    return model
+
+
+def arena_collider(entity: Entity, geometry: ArenaGeometry) -> Collider:
+    """
+    One collision node holding the ground and every static box.
+
+    Args:
+        entity: Entity the collider belongs to
+        geometry: Static arena geometry
+
+    Returns:
+        Collider to assign to entity.collider
+    """
+    half = geometry.ground_half_size
+    ground_y = geometry.ground_y
+    solids = [CollisionBox(Point3(-half, ground_y - 0.001, -half), Point3(half, ground_y, half))]
+    solids += [
+        CollisionBox(Point3(box.min_x, box.min_y, box.min_z), Point3(box.max_x, box.max_y, box.max_z))
+        for box in geometry.boxes
+    ]
+    return Collider(entity, solids)
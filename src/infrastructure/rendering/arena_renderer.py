@@ -1,82 +1,44 @@
 """Arena renderer for environment."""
 
 from ursina import *
+from typing import Optional
 from config.game_config import GameConfig
+from domain.arena import ArenaGeometry
+from .arena_model import arena_collider, load_arena_model
 
 
 class ArenaRenderer:
     """
     Manages arena environment (ground, sky, lighting, walls).
     Infrastructure layer - Ursina specific.
+
+    Ground, walls and cover are drawn by one static entity whose model is a
+    single flattened node (one geom per texture) with one collision node
+    holding a box per solid, so neither draw calls nor collider count grow
+    with the number of cover boxes.
     """
 
-    def __init__(self, arena_size: int):
+    def __init__(self, arena_size: int, geometry: Optional[ArenaGeometry] = None, shadow_map_size: int = 1024):
         """
         Create arena environment.
 
         Args:
             arena_size: Size of the ground plane
+            geometry: Static collision geometry to draw (defaults to the square perimeter walls)
+            shadow_map_size: Initial sun shadow map resolution (0 = no shadows)
         """
-        # Ground
-        self.ground = Entity(
-            model="plane",
-            collider="box",
-            scale=arena_size,
-            texture=GameConfig.GROUND_TEXTURE,
-            texture_scale=(sqrt(GameConfig.ARENA_SIZE), sqrt(GameConfig.ARENA_SIZE)),
-        )
-
-        # Walls - create perimeter
-        wall_height = GameConfig.ARENA_WALL_HEIGHT
-        wall_thickness = 1
-        half_size = arena_size / 2
-
-        # North wall
-        self.north_wall = Entity(
-            model="cube",
-            scale=(arena_size, wall_height, wall_thickness),
-            position=(0, wall_height / 2, half_size),
-            collider="box",
-            texture=GameConfig.WALL_TEXTURE,
-            texture_scale=(GameConfig.ARENA_SIZE / 2, 1),
-            color=color.gray,
-        )
-
-        # South wall
-        self.south_wall = Entity(
-            model="cube",
-            scale=(arena_size, wall_height, wall_thickness),
-            position=(0, wall_height / 2, -half_size),
-            collider="box",
-            texture=GameConfig.WALL_TEXTURE,
-            texture_scale=(GameConfig.ARENA_SIZE / 2, 1),
-            color=color.gray,
-        )
-
-        # East wall
-        self.east_wall = Entity(
-            model="cube",
-            scale=(wall_thickness, wall_height, arena_size),
-            position=(half_size, wall_height / 2, 0),
-            collider="box",
-            texture=GameConfig.WALL_TEXTURE,
-            texture_scale=(GameConfig.ARENA_SIZE / 2, 1),
-            color=color.gray,
-        )
-
-        # West wall
-        self.west_wall = Entity(
-            model="cube",
-            scale=(wall_thickness, wall_height, arena_size),
-            position=(-half_size, wall_height / 2, 0),
-            collider="box",
-            texture=GameConfig.WALL_TEXTURE,
-            texture_scale=(GameConfig.ARENA_SIZE / 2, 1),
-            color=color.gray,
+        # Ground, walls and cover - one model and one collider built from the static collision geometry
+        self.geometry = geometry or ArenaGeometry.build_square(
+            arena_size, GameConfig.ARENA_WALL_HEIGHT, wall_thickness=1
         )
+        self.static = Entity(model=load_arena_model(self.geometry))
+        self.static.collider = arena_collider(self.static, self.geometry)
 
         # Lighting
-        self.sun = DirectionalLight()
+        # DirectionalLight applies its shadow setting a frame late, so it must start with the initial preset's
+        self.sun = DirectionalLight(shadows=shadow_map_size > 0)
+        if shadow_map_size > 0:
+            self.sun.shadow_map_resolution = Vec2(shadow_map_size, shadow_map_size)
         self.sun.look_at(Vec3(1, -1, -1))
 
         # Sky
@@ -0,0 +1,38 @@
+"""Resolves GameConfig asset names to Ursina objects."""
+
+from functools import lru_cache
+from ursina import Color, Texture, color, load_texture
+
+
+@lru_cache(maxsize=None)
+def resolve_color(name: str) -> Color:
+    """
+    Look up an Ursina color by name.
+
+    Args:
+        name: Name of a color in ursina.color (e.g. "light_gray")
+
+    Returns:
+        Color
+    """
+    value = getattr(color, name, None)
+    if not isinstance(value, Color):
+        raise ValueError(f"Unknown color name: {name!r}")
+    return value
+
+
+@lru_cache(maxsize=None)
+def resolve_texture(name: str) -> Texture:
+    """
+    Load a texture by name, once.
+
+    Args:
+        name: Texture name as accepted by load_texture (e.g. "grass")
+
+    Returns:
+        Texture
+    """
+    texture = load_texture(name)
+    if texture is None:
+        raise ValueError(f"Texture not found: {name!r}")
+    return texture
@@ -1,78 +1,90 @@
 """Enemy entity renderer."""
 
 from ursina import *
-import time as time_module
+from typing import Optional
+from application.profiling import FrameProfiler
+from domain.clock import FixedTimestep
 from domain.entities import Enemy
 from config.game_config import GameConfig
+from .assets import resolve_color
+from .graphics_quality import make_unlit
 
 
 class EnemyRenderer(Entity):
     """
-    Ursina enemy entity with visual feedback and AI.
+    Ursina enemy entity with visual feedback.
     Bridges domain Enemy with Ursina rendering.
     Infrastructure layer - Ursina specific.
-    """
 
-    def __init__(self, enemy_domain: Enemy, player_entity: Entity, game_service, shootables_parent: Entity, **kwargs):
-        x, y, z = enemy_domain.position
+    AI runs in the domain EnemySwarm; this entity only mirrors its transform.
+    Shots are resolved by the domain HitscanResolver, so there is no collider.
+    Instances are pooled: bind() attaches one to an enemy, park() hides it.
+    """
 
+    def __init__(
+        self,
+        enemy_domain: Optional[Enemy],
+        enemies_parent: Entity,
+        profiler: Optional[FrameProfiler] = None,
+        timestep: Optional[FixedTimestep] = None,
+        **kwargs,
+    ):
         super().__init__(
-            parent=shootables_parent,
+            parent=enemies_parent,
             model="cube",
-            scale_y=2.5,
+            scale=(GameConfig.ENEMY_WIDTH, GameConfig.ENEMY_HEIGHT, GameConfig.ENEMY_WIDTH),
             origin_y=-0.5,
-            color=GameConfig.ENEMY_COLOR,
-            collider="box",
-            position=(x, y, z),
-            **kwargs
+            color=resolve_color(GameConfig.ENEMY_COLOR),
+            **kwargs,
         )
 
-        self.enemy_domain = enemy_domain
-        self.player_entity = player_entity
-        self.game_service = game_service
+        self.enemy_domain: Optional[Enemy] = None
+        self.profiler = profiler or FrameProfiler()
+        self.timestep = timestep
 
         # Health bar
         self.health_bar = Entity(parent=self, y=1.2, model="cube", color=color.red, world_scale=(1.5, 0.1, 0.1))
+        make_unlit(self.health_bar)
+
+        if enemy_domain is None:
+            self.park()
+        else:
+            self.bind(enemy_domain)
 
-        self.last_attack_time = 0
+    def bind(self, enemy_domain: Enemy):
+        """
+        Attach to a domain enemy and reset visual state for reuse.
 
-    @property
-    def hp(self):
-        """Property for shooting compatibility."""
-        return self.enemy_domain.health
+        Args:
+            enemy_domain: Domain Enemy to mirror
+        """
+        self.enemy_domain = enemy_domain
+        self.position = enemy_domain.position
+        self.rotation_y = enemy_domain.facing
+        self.color = resolve_color(GameConfig.ENEMY_COLOR)
+        self.health_bar.world_scale_x = 1.5
+        self.health_bar.alpha = 1
+        self.enabled = True
 
-    @hp.setter
-    def hp(self, value):
-        """Setter for shooting compatibility."""
-        damage = self.enemy_domain.health - value
-        if damage > 0:
-            self.game_service.handle_enemy_hit(self.enemy_domain)
+    def park(self):
+        """Detach from the domain enemy and hide until rebound."""
+        self.enemy_domain = None
+        self.enabled = False
 
     def update(self):
-        """AI behavior: chase player, attack on contact."""
-        if not self.enemy_domain.is_alive:
+        """Write back transform from the domain swarm, interpolated between simulation steps."""
+        if self.enemy_domain is None or not self.enemy_domain.is_alive:
             return
 
-        # Distance check
-        dist = distance_xz(self.player_entity.position, self.position)
-
-        # Fade health bar
-        self.health_bar.alpha = max(0, self.health_bar.alpha - time.dt)
+        with self.profiler.scope("enemy_renderer.update"):
+            if self.timestep is None:
+                self.position = self.enemy_domain.position
+            else:
+                self.position = self.enemy_domain.interpolated_position(self.timestep.alpha)
+            self.rotation_y = self.enemy_domain.facing
 
-        # Always look at player
-        self.look_at_2d(self.player_entity.position, "y")
-
-        # Check if touching player (collision)
-        if not self.intersects(self.player_entity).hit:
-            # Not touching - keep chasing
-            self.position += self.forward * time.dt * self.enemy_domain.speed
-        else:
-            # Touching - stop moving and attack
-            current_time = time_module.time()
-            if self.enemy_domain.can_attack(current_time, GameConfig.ENEMY_ATTACK_COOLDOWN):
-                self.enemy_domain.perform_attack(current_time)
-                self.game_service.handle_player_hit(GameConfig.ENEMY_DAMAGE)
-                self.player_entity.blink(color.red)
+            # Fade health bar
+            self.health_bar.alpha = max(0, self.health_bar.alpha - time.dt)
 
     def take_damage(self):
         """Visual feedback when hit."""
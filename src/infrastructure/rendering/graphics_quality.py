@@ -0,0 +1,122 @@
+"""Graphics quality presets."""
+
+from ursina import *
+from ursina.shaders import basic_lighting_shader, lit_with_shadows_shader, unlit_shader
+from panda3d.core import BitMask32
+from typing import Dict, List
+
+# Ursina's DirectionalLight renders its shadow map with a camera using this mask
+SHADOW_CAMERA_MASK = BitMask32.bit(0)
+
+# Override priorities: group shaders beat the shader each entity was created with,
+# and entities that are always unlit beat the group shader
+GROUP_SHADER_PRIORITY = 1
+UNLIT_SHADER_PRIORITY = 2
+
+LIGHTING_SHADERS = {
+    "shadowed": lit_with_shadows_shader,  # lit, receives shadows
+    "lit": basic_lighting_shader,  # lit, no shadow lookups
+    "unlit": unlit_shader,
+}
+
+
+def _apply_shader(entity: Entity, shader: Shader, priority: int):
+    """Force a shader onto an entity and everything below it."""
+    if not shader.compiled:
+        shader.compile()
+    entity.setShader(shader._shader, priority)
+    # Shader defaults the entity does not already provide (e.g. shadow_color); texture_scale etc. stay
+    for name, value in shader.default_input.items():
+        if entity.get_shader_input(name) is None:
+            entity.set_shader_input(name, value() if callable(value) else value)
+
+
+def make_unlit(entity: Entity):
+    """
+    Draw an entity unlit and keep it out of shadow maps at every quality level.
+
+    Args:
+        entity: Overlay-like entity (health bar, muzzle flash)
+    """
+    _apply_shader(entity, unlit_shader, UNLIT_SHADER_PRIORITY)
+    entity.hide(SHADOW_CAMERA_MASK)
+
+
+class GraphicsQuality:
+    """
+    Applies quality presets to named groups of entities.
+    Infrastructure layer - Ursina specific.
+
+    A preset is a dict from GameConfig.QUALITY_PRESETS:
+        shadow_map_size: sun shadow map resolution (0 turns shadows off)
+        lighting: group name -> "shadowed", "lit" or "unlit"
+        shadow_casters: group names drawn into the shadow map
+
+    Each group is a set of root entities. Shaders are applied to a root with
+    an override priority, so entities created under it later (pooled
+    enemies) pick up the current preset without being registered.
+    """
+
+    def __init__(self, presets: Dict[str, dict], sun: DirectionalLight):
+        """
+        Initialize quality control.
+
+        Args:
+            presets: Preset name -> preset, ordered from cheapest to best
+            sun: Shadow-casting light
+        """
+        self.presets = presets
+        self.levels = list(presets)
+        self.sun = sun
+        self.groups: Dict[str, List[Entity]] = {}
+        self.shaded: Dict[str, bool] = {}
+        self.preset_name = None
+
+        # The main camera must not see the shadow bit, or hiding a caster from the sun would hide it entirely
+        if application.base.cam is not None:  # no camera without a window
+            camera_node = application.base.cam.node()
+            camera_node.setCameraMask(camera_node.getCameraMask() & ~SHADOW_CAMERA_MASK)
+
+    def add_group(self, name: str, *roots: Entity, shaded: bool = True):
+        """
+        Register root entities of a group.
+
+        Args:
+            name: Group name used by the presets
+            roots: Entities whose subtrees belong to the group
+            shaded: False for entities with their own shader (only shadow casting is controlled)
+        """
+        self.groups.setdefault(name, []).extend(roots)
+        self.shaded[name] = self.shaded.get(name, True) and shaded
+        if self.preset_name is not None:
+            self.apply(self.preset_name)
+
+    def level_of(self, preset_name: str) -> int:
+        """Index of a preset, 0 being the cheapest."""
+        return self.levels.index(preset_name)
+
+    def apply(self, preset_name: str):
+        """
+        Switch every group and the sun to a preset.
+
+        Args:
+            preset_name: Key of GameConfig.QUALITY_PRESETS
+        """
+        preset = self.presets[preset_name]
+        self.preset_name = preset_name
+
+        size = preset["shadow_map_size"]
+        if size > 0:
+            self.sun.shadow_map_resolution = Vec2(size, size)
+        self.sun.shadows = size > 0
+
+        for name, roots in self.groups.items():
+            lighting = preset["lighting"].get(name)
+            casts_shadows = size > 0 and name in preset["shadow_casters"]
+            for root in roots:
+                if self.shaded[name] and lighting is not None:
+                    _apply_shader(root, LIGHTING_SHADERS[lighting], GROUP_SHADER_PRIORITY)
+                if casts_shadows:
+                    root.show(SHADOW_CAMERA_MASK)
+                else:
+                    root.hide(SHADOW_CAMERA_MASK)
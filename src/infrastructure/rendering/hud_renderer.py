@@ -7,8 +7,13 @@ class HUDRenderer:
     """
     Manages HUD text elements with auto-update from game state.
     Infrastructure layer - Ursina specific.
+
+    All stats share one Text node, which is only rebuilt on frames where a
+    value changed (assigning Text.text regenerates its geometry).
     """
 
+    STATS_FORMAT = "Wave: {}\nEnemies: {}\nHealth: {}\nKills: {}"
+
     def __init__(self, game_service):
         """
         Create HUD elements.
@@ -18,24 +23,31 @@ class HUDRenderer:
         """
         self.game_service = game_service
 
-        self.wave_text = Text(text="Wave: 0", position=(0, 0.45), origin=(0, 0), scale=1)
-        self.enemy_text = Text(text="Enemies: 0", position=(0, 0.425), origin=(0, 0), scale=1)
-        self.health_text = Text(text="Health: 100", position=(0, 0.4), origin=(0, 0), scale=1)
-        self.kills_text = Text(text="Kills: 0", position=(0, 0.375), origin=(0, 0), scale=1)
+        # One line per stat, centered where the four separate lines used to be (y 0.45 to 0.375)
+        self.stats_text = Text(text="", position=(0, 0.4125), origin=(0, 0), scale=1)
+        self._shown_stats = None
         self.game_over_text = Text(text="", position=(0, 0), origin=(0, 0), scale=3, color=color.red, enabled=False)
 
     def update(self):
-        """Auto-update HUD from game service state."""
-        # Update stats
-        self.wave_text.text = f"Wave: {self.game_service.wave_manager.current_wave}"
-        alive_enemies = len(self.game_service.enemies)
-        self.enemy_text.text = f"Enemies: {alive_enemies}"
-        self.health_text.text = f"Health: {self.game_service.player.health}"
-        self.kills_text.text = f"Kills: {self.game_service.player.kills}"
+        """Auto-update HUD from game service state, rebuilding text only on change."""
+        stats = (
+            self.game_service.wave_manager.current_wave,
+            self.game_service.enemies_remaining,
+            self.game_service.player.health,
+            self.game_service.player.kills,
+        )
+        if stats == self._shown_stats:
+            return
+
+        self._shown_stats = stats
+        self.stats_text.text = self.STATS_FORMAT.format(*stats)
 
     def show_game_over(self, wave: int, kills: int):
         """Show game over screen."""
-        self.game_over_text.text = f"GAME OVER\nWave: {wave}\nKills: {kills}\n\nPress R to restart or ESC to quit"
+        retry = ", T to retry the wave" if self.game_service.on_retry_wave_requested else ""
+        self.game_over_text.text = (
+            f"GAME OVER\nWave: {wave}\nKills: {kills}\n\nPress R to restart{retry} or ESC to quit"
+        )
         self.game_over_text.enabled = True
 
     def hide_game_over(self):
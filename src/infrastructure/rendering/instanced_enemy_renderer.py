@@ -0,0 +1,233 @@
+"""Hardware-instanced enemy renderer."""
+
+from ursina import *
+from panda3d.core import GeomEnums, OmniBoundingVolume, Texture, TransparencyAttrib
+import numpy as np
+from typing import Optional
+from application.profiling import FrameProfiler
+from domain.clock import FixedTimestep
+from domain.entities import Enemy, EnemySwarm
+from config.game_config import GameConfig
+from .assets import resolve_color
+from .graphics_quality import SHADOW_CAMERA_MASK
+
+# Per-instance data: 3 RGBA32F texels per enemy in a buffer texture
+#   0: position xyz, facing (degrees)
+#   1: body color rgba (includes hit blink)
+#   2: health fraction, health bar alpha, unused, unused
+TEXELS_PER_INSTANCE = 3
+
+_instance_vertex_header = """#version 140
+uniform mat4 p3d_ModelViewProjectionMatrix;
+uniform samplerBuffer instance_data;
+in vec4 p3d_Vertex;
+in vec3 p3d_Normal;
+
+vec3 rotate_y(vec3 v, float degrees_yaw) {
+    float s = sin(radians(degrees_yaw));
+    float c = cos(radians(degrees_yaw));
+    return vec3(v.x * c + v.z * s, v.y, -v.x * s + v.z * c);
+}
+"""
+
+enemy_body_shader = Shader(
+    name="enemy_body_shader",
+    language=Shader.GLSL,
+    vertex=_instance_vertex_header + """
+uniform vec3 body_scale;
+uniform vec3 light_direction;
+out vec4 vertex_color;
+
+void main() {
+    vec4 transform = texelFetch(instance_data, gl_InstanceID * 3);
+    vec4 body_color = texelFetch(instance_data, gl_InstanceID * 3 + 1);
+
+    // Cube model is centered; shift so the enemy stands on its position (origin_y = -0.5)
+    vec3 local = (p3d_Vertex.xyz + vec3(0.0, 0.5, 0.0)) * body_scale;
+    vec3 world = rotate_y(local, transform.w) + transform.xyz;
+    vec3 normal = rotate_y(p3d_Normal, transform.w);
+
+    float diffuse = max(dot(normalize(normal), -light_direction), 0.0);
+    vertex_color = vec4(body_color.rgb * (0.45 + 0.55 * diffuse), body_color.a);
+    gl_Position = p3d_ModelViewProjectionMatrix * vec4(world, 1.0);
+}
+""",
+    fragment="""#version 140
+in vec4 vertex_color;
+out vec4 fragColor;
+
+void main() {
+    fragColor = vertex_color;
+}
+""",
+    default_input={"body_scale": Vec3(1, 1, 1), "light_direction": Vec3(0, -1, 0)},
+)
+
+health_bar_shader = Shader(
+    name="health_bar_shader",
+    language=Shader.GLSL,
+    vertex=_instance_vertex_header + """
+uniform vec3 bar_scale;
+uniform float bar_height;
+out float bar_alpha;
+
+void main() {
+    vec4 transform = texelFetch(instance_data, gl_InstanceID * 3);
+    vec4 health = texelFetch(instance_data, gl_InstanceID * 3 + 2);
+
+    vec3 local = p3d_Vertex.xyz * bar_scale * vec3(health.x, 1.0, 1.0);
+    vec3 world = rotate_y(local, transform.w) + transform.xyz + vec3(0.0, bar_height, 0.0);
+    bar_alpha = health.y;
+    gl_Position = p3d_ModelViewProjectionMatrix * vec4(world, 1.0);
+}
+""",
+    fragment="""#version 140
+uniform vec4 bar_color;
+in float bar_alpha;
+out vec4 fragColor;
+
+void main() {
+    if (bar_alpha <= 0.0) {
+        discard;
+    }
+    fragColor = vec4(bar_color.rgb, bar_color.a * bar_alpha);
+}
+""",
+    default_input={"bar_scale": Vec3(1.5, 0.1, 0.1), "bar_height": 3.0, "bar_color": color.red},
+)
+
+
+class InstancedEnemyRenderer(Entity):
+    """
+    Draws every enemy body in one instanced draw and every health bar in another.
+    Infrastructure layer - Ursina specific.
+
+    Each frame the per-instance buffer is filled straight from the domain
+    EnemySwarm arrays: transforms from positions/facing (positions blended
+    between the last two simulation steps), hit blink and health bar fade
+    from each enemy's last_hit_time. No per-enemy entities exist.
+
+    Like EnemyRenderer.bind, a newly allocated instance slot starts with its
+    health bar fully visible and fades it out from there.
+    """
+
+    BLINK_DURATION = 0.1  # seconds, matches Entity.blink
+    HEALTH_BAR_FADE = 1.0  # seconds for the health bar to fade after a hit
+
+    def __init__(
+        self,
+        swarm: EnemySwarm,
+        clock,
+        capacity: int = 256,
+        profiler: Optional[FrameProfiler] = None,
+        timestep: Optional[FixedTimestep] = None,
+        **kwargs,
+    ):
+        """
+        Initialize instanced renderer.
+
+        Args:
+            swarm: Domain enemy swarm to draw
+            clock: Game clock used to age hit feedback
+            capacity: Initial number of instances the buffer holds (grows on demand)
+            profiler: Profiler timing the instance buffer upload
+            timestep: Simulation stepper whose alpha interpolates positions between steps (None draws the last step)
+        """
+        super().__init__(**kwargs)
+        self.swarm = swarm
+        self.clock = clock
+        self.profiler = profiler or FrameProfiler()
+        self.timestep = timestep
+
+        self.base_color = np.array(resolve_color(GameConfig.ENEMY_COLOR), dtype=np.float32)
+        self.blink_color = np.array(color.red, dtype=np.float32)
+
+        self.instance_texture = Texture("enemy_instances")
+        self.capacity = 0
+        self.bar_shown_time = np.empty(0)  # clock time each slot's health bar was last made fully visible
+        self.drawn_count = 0  # slots filled last frame; rows past it are new this frame
+        self._allocate(capacity)
+
+        self.bodies = Entity(parent=self, model="cube", shader=enemy_body_shader)
+        self.bodies.set_shader_input(
+            "body_scale", Vec3(GameConfig.ENEMY_WIDTH, GameConfig.ENEMY_HEIGHT, GameConfig.ENEMY_WIDTH)
+        )
+        self.bodies.set_shader_input("light_direction", Vec3(1, -1, -1).normalized())
+
+        # Health bar sits where EnemyRenderer's child at y=1.2 of a body scaled to ENEMY_HEIGHT would
+        self.health_bars = Entity(parent=self, model="cube", shader=health_bar_shader)
+        self.health_bars.set_shader_input("bar_height", 1.2 * GameConfig.ENEMY_HEIGHT)
+        self.health_bars.setTransparency(TransparencyAttrib.M_alpha)
+        self.health_bars.setDepthWrite(False)
+        self.health_bars.hide(SHADOW_CAMERA_MASK)  # overlays never cast shadows
+
+        for batch in (self.bodies, self.health_bars):
+            batch.set_shader_input("instance_data", self.instance_texture)
+            # Instances are placed in the shader, so the model's own bounds are meaningless
+            batch.node().setBounds(OmniBoundingVolume())
+            batch.node().setFinal(True)
+            batch.setInstanceCount(0)
+
+    def _allocate(self, capacity: int):
+        """(Re)create the instance buffer texture for at least capacity instances."""
+        self.capacity = max(capacity, self.capacity * 2)
+        self.bar_shown_time = np.resize(self.bar_shown_time, self.capacity)
+        self.instance_texture.setup_buffer_texture(
+            self.capacity * TEXELS_PER_INSTANCE, Texture.T_float, Texture.F_rgba32, GeomEnums.UH_dynamic
+        )
+
+    def update(self):
+        """Write this frame's instance data and set instance counts."""
+        with self.profiler.scope("enemy_renderer.instances"):
+            self._write_instances()
+
+    def _write_instances(self):
+        """Fill the instance buffer from the swarm arrays."""
+        swarm = self.swarm
+        n = swarm.count
+        if n > self.capacity:
+            self._allocate(n)
+
+        self.bodies.setInstanceCount(n)
+        self.health_bars.setInstanceCount(n)
+        now = self.clock.now()
+        # Slots allocated since last frame show their bar, as EnemyRenderer.bind does.
+        # A removal moves the last row into the freed slot, which keeps that slot's fade.
+        self.bar_shown_time[self.drawn_count : n] = now
+        self.drawn_count = n
+        if n == 0:
+            return
+
+        since_hit = now - swarm.last_hit_time[:n]
+        since_bar_shown = now - np.maximum(self.bar_shown_time[:n], swarm.last_hit_time[:n])
+
+        ram = np.frombuffer(memoryview(self.instance_texture.modify_ram_image()), dtype=np.float32)
+        instances = ram.reshape(-1, TEXELS_PER_INSTANCE, 4)[:n]
+
+        if self.timestep is None:
+            instances[:, 0, :3] = swarm.positions[:n]
+        else:
+            instances[:, 0, :3] = swarm.interpolated_positions(self.timestep.alpha)
+        instances[:, 0, 3] = swarm.facing[:n]
+
+        # Triangle blink toward red over BLINK_DURATION after a hit
+        blink = np.clip(1.0 - np.abs(2.0 * since_hit / self.BLINK_DURATION - 1.0), 0.0, 1.0)
+        instances[:, 1, :] = self.base_color + blink[:, None] * (self.blink_color - self.base_color)
+
+        instances[:, 2, 0] = swarm.health[:n] / swarm.max_health[:n]
+        instances[:, 2, 1] = np.clip(1.0 - since_bar_shown / self.HEALTH_BAR_FADE, 0.0, 1.0)
+
+    # Enemy lifecycle callbacks: instances are drawn straight from the swarm, so there is nothing to create
+
+    def spawn_enemy(self, enemy: Enemy):
+        """Nothing to do - new swarm rows are drawn on the next update."""
+
+    def despawn_enemy(self, enemy: Enemy):
+        """Nothing to do - removed swarm rows are no longer drawn."""
+
+    def despawn_all(self):
+        """Treat every slot as new, so enemies of the next wave or game start with their bar shown."""
+        self.drawn_count = 0
+
+    def handle_enemy_damage(self, enemy: Enemy):
+        """Nothing to do - blink and health bar come from the enemy's last_hit_time."""
@@ -1,9 +1,14 @@
 """Player entity renderer."""
 
 from ursina import *
-from domain.components.first_person_controller import FirstPersonController
+from typing import Optional
+from application.profiling import FrameProfiler
+from domain.arena import ArenaGeometry
+from infrastructure.components import FirstPersonController
 from domain.entities import Player
 from config.game_config import GameConfig
+from .assets import resolve_color
+from .graphics_quality import make_unlit
 
 
 class PlayerRenderer(FirstPersonController):
@@ -13,12 +18,21 @@ class PlayerRenderer(FirstPersonController):
     Infrastructure layer - Ursina specific.
     """
 
-    def __init__(self, player_domain: Player):
+    def __init__(
+        self,
+        player_domain: Player,
+        arena_geometry: Optional[ArenaGeometry] = None,
+        profiler: Optional[FrameProfiler] = None,
+        fixed_step: bool = False,
+    ):
         """
         Initialize player renderer.
 
         Args:
             player_domain: Domain Player instance
+            arena_geometry: Static arena geometry for analytic collision (raycast collision if None)
+            profiler: Profiler timing ground and wall queries
+            fixed_step: Movement is advanced by simulate() at a fixed rate instead of every frame
         """
         super().__init__(
             origin_y=-0.5,
@@ -27,6 +41,10 @@ class PlayerRenderer(FirstPersonController):
             jump_height=GameConfig.PLAYER_JUMP_HEIGHT,
             collider="sphere",
             mouse_sensitivity=GameConfig.PLAYER_MOUSE_SENSITIVITY,
+            arena_geometry=arena_geometry,
+            collision_radius=GameConfig.PLAYER_COLLISION_RADIUS,
+            profiler=profiler or FrameProfiler(),
+            fixed_step=fixed_step,
         )
 
         self.player_domain = player_domain
@@ -38,11 +56,17 @@ class PlayerRenderer(FirstPersonController):
             position=(0.5, -0.25, 0.25),
             scale=(0.3, 0.2, 1),
             origin_z=-0.5,
-            color=GameConfig.GUN_COLOR,
+            color=resolve_color(GameConfig.GUN_COLOR),
         )
         self.gun.muzzle_flash = Entity(
-            parent=self.gun, z=1, world_scale=0.5, model="quad", color=GameConfig.MUZZLE_FLASH_COLOR, enabled=False
+            parent=self.gun,
+            z=1,
+            world_scale=0.5,
+            model="quad",
+            color=resolve_color(GameConfig.MUZZLE_FLASH_COLOR),
+            enabled=False,
         )
+        make_unlit(self.gun.muzzle_flash)
 
     def take_damage(self, amount: int):
         """
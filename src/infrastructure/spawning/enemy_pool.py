@@ -0,0 +1,103 @@
+"""Pool of reusable enemy entities."""
+
+from ursina import *
+from typing import List, Optional
+from application.profiling import FrameProfiler
+from domain.clock import FixedTimestep
+from domain.entities import Enemy
+from infrastructure.rendering import EnemyRenderer
+
+
+class EnemyRendererPool:
+    """
+    Keeps parked EnemyRenderer entities for reuse across waves and restarts.
+    Infrastructure layer - Ursina specific.
+
+    The pool grows on demand, so after a wave it holds as many entities as
+    the largest wave so far (its high-water mark) unless trimmed.
+    """
+
+    def __init__(
+        self,
+        enemies_parent: Entity,
+        preallocate: int = 0,
+        profiler: Optional[FrameProfiler] = None,
+        timestep: Optional[FixedTimestep] = None,
+    ):
+        """
+        Initialize pool.
+
+        Args:
+            enemies_parent: Parent entity grouping enemy entities
+            preallocate: Number of parked entities to create up front
+            profiler: Profiler timing entity updates
+            timestep: Simulation stepper entities interpolate with
+        """
+        self.enemies_parent = enemies_parent
+        self.profiler = profiler
+        self.timestep = timestep
+        self.idle: List[EnemyRenderer] = []
+        self.active_count = 0
+        self.high_water_mark = 0
+        self.reserve(preallocate)
+
+    @property
+    def size(self) -> int:
+        """Total entities owned by the pool (active + idle)."""
+        return self.active_count + len(self.idle)
+
+    def reserve(self, count: int):
+        """
+        Create parked entities until the pool holds at least count in total.
+
+        Args:
+            count: Desired pool size
+        """
+        for _ in range(count - self.size):
+            self.idle.append(EnemyRenderer(None, self.enemies_parent, self.profiler, self.timestep))
+
+    def acquire(self, enemy: Enemy) -> EnemyRenderer:
+        """
+        Get an entity bound to a domain enemy, creating one if none is idle.
+
+        Args:
+            enemy: Domain Enemy instance
+
+        Returns:
+            Bound EnemyRenderer
+        """
+        if self.idle:
+            enemy_entity = self.idle.pop()
+            enemy_entity.bind(enemy)
+        else:
+            enemy_entity = EnemyRenderer(enemy, self.enemies_parent, self.profiler, self.timestep)
+
+        self.active_count += 1
+        self.high_water_mark = max(self.high_water_mark, self.active_count)
+        return enemy_entity
+
+    def release(self, enemy_entity: EnemyRenderer):
+        """
+        Park an entity for later reuse.
+
+        Args:
+            enemy_entity: Entity previously returned by acquire()
+        """
+        enemy_entity.park()
+        self.idle.append(enemy_entity)
+        self.active_count -= 1
+
+    def trim(self, max_idle: int) -> int:
+        """
+        Destroy idle entities beyond max_idle.
+
+        Args:
+            max_idle: Number of idle entities to keep
+
+        Returns:
+            Number of entities destroyed
+        """
+        excess = len(self.idle) - max(0, max_idle)
+        for _ in range(excess):
+            self.idle.pop().destroy()
+        return max(0, excess)
@@ -1,9 +1,12 @@
 """Enemy spawning management."""
 
 from ursina import *
-from typing import Dict
+from typing import Dict, Optional
+from application.profiling import FrameProfiler
+from domain.clock import FixedTimestep
 from domain.entities import Enemy
 from infrastructure.rendering import EnemyRenderer
+from .enemy_pool import EnemyRendererPool
 
 
 class EnemySpawner:
@@ -12,50 +15,57 @@ class EnemySpawner:
     Infrastructure layer - Ursina specific.
     """
 
-    def __init__(self, shootables_parent: Entity, player: Entity, game_service):
+    def __init__(
+        self,
+        enemies_parent: Entity,
+        preallocate: int = 0,
+        max_idle: Optional[int] = None,
+        profiler: Optional[FrameProfiler] = None,
+        timestep: Optional[FixedTimestep] = None,
+    ):
         """
         Initialize enemy spawner.
 
         Args:
-            shootables_parent: Parent entity for raycast targeting
-            player: Player entity
-            game_service: GameService instance
+            enemies_parent: Parent entity grouping enemy entities
+            preallocate: Number of enemy entities to create up front
+            max_idle: Parked entities kept after despawn_all (None keeps all)
+            profiler: Profiler timing entity updates
+            timestep: Simulation stepper entities interpolate with
         """
-        self.shootables_parent = shootables_parent
-        self.player = player
-        self.game_service = game_service
-        self.enemy_entities: Dict[int, EnemyRenderer] = {}
+        self.pool = EnemyRendererPool(enemies_parent, preallocate, profiler, timestep)
+        self.max_idle = max_idle
+        self.enemy_entities: Dict[int, EnemyRenderer] = {}  # keyed by generational enemy handle
 
     def spawn_enemy(self, enemy: Enemy):
         """
-        Create visual entity for domain enemy.
+        Bind a pooled visual entity to domain enemy.
 
         Args:
             enemy: Domain Enemy instance
         """
-        enemy_entity = EnemyRenderer(enemy, self.player, self.game_service, self.shootables_parent)
-        self.enemy_entities[id(enemy)] = enemy_entity
+        self.enemy_entities[enemy.handle] = self.pool.acquire(enemy)
 
     def despawn_enemy(self, enemy: Enemy):
         """
-        Destroy visual entity for domain enemy.
+        Return visual entity for domain enemy to the pool.
 
         Args:
             enemy: Domain Enemy instance
         """
-        enemy_id = id(enemy)
-        if enemy_id in self.enemy_entities:
-            # Call custom destroy() method to properly clean up children
-            self.enemy_entities[enemy_id].destroy()
-            del self.enemy_entities[enemy_id]
+        enemy_entity = self.enemy_entities.pop(enemy.handle, None)
+        if enemy_entity is not None:
+            self.pool.release(enemy_entity)
 
     def despawn_all(self):
-        """Destroy all enemy entities."""
-        for enemy_entity in list(self.enemy_entities.values()):
-            # Call custom destroy() method to properly clean up children
-            enemy_entity.destroy()
+        """Return all enemy entities to the pool, then trim it to max_idle."""
+        for enemy_entity in self.enemy_entities.values():
+            self.pool.release(enemy_entity)
         self.enemy_entities.clear()
 
+        if self.max_idle is not None:
+            self.pool.trim(self.max_idle)
+
     def handle_enemy_damage(self, enemy: Enemy):
         """
         Handle visual feedback when enemy takes damage.
@@ -63,6 +73,6 @@ class EnemySpawner:
         Args:
             enemy: Domain Enemy instance
         """
-        enemy_id = id(enemy)
-        if enemy_id in self.enemy_entities:
-            self.enemy_entities[enemy_id].take_damage()
+        enemy_entity = self.enemy_entities.get(enemy.handle)
+        if enemy_entity is not None:
+            enemy_entity.take_damage()
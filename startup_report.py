@@ -0,0 +1,144 @@
+"""OpenBNW startup report - import times and time to first frame, checked against a budget."""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BUDGET = os.path.join(ROOT, "config", "startup_budget.json")
+FIRST_FRAME_ENV = "OPENBNW_EXIT_AFTER_FIRST_FRAME"
+FIRST_FRAME_MARKER = "OPENBNW_FIRST_FRAME"
+
+
+def parse_importtime(stderr: str) -> dict:
+    """
+    Parse `python -X importtime` output.
+
+    Args:
+        stderr: Interpreter stderr
+
+    Returns:
+        Dict of module name -> (self microseconds, cumulative microseconds)
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            continue  # header line
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def measure_import(module: str, repeat: int) -> dict:
+    """
+    Import a module in fresh interpreters and keep the fastest run.
+
+    Args:
+        module: Dotted module name, importable with the repo root and src/ on the path
+        repeat: Number of fresh interpreters to try
+
+    Returns:
+        Dict of module name -> (self microseconds, cumulative microseconds) for the fastest run
+    """
+    code = f"import sys; sys.path[:0] = [{ROOT!r}, {os.path.join(ROOT, 'src')!r}]; import {module}"
+    best = None
+    for _ in range(repeat):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code], cwd=ROOT, capture_output=True, text=True
+        )
+        if process.returncode != 0:
+            raise RuntimeError(f"import {module} failed:\n{process.stderr.strip().splitlines()[-1]}")
+        modules = parse_importtime(process.stderr)
+        if best is None or modules[module][1] < best[module][1]:
+            best = modules
+    return best
+
+
+def measure_first_frame(timeout: float) -> float:
+    """
+    Launch main.py and time it until its first frame has been drawn.
+
+    Args:
+        timeout: Seconds to wait before giving up
+
+    Returns:
+        Milliseconds from launch to first frame
+    """
+    env = dict(os.environ, **{FIRST_FRAME_ENV: "1"})
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, "main.py")],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    try:
+        for line in process.stdout:
+            if line.strip() == FIRST_FRAME_MARKER:
+                return (time.perf_counter() - start) * 1000
+            if time.perf_counter() - start > timeout:
+                break
+    finally:
+        process.kill()
+        process.wait()
+    raise RuntimeError(f"main.py exited without drawing a frame (exit code {process.returncode})")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Report startup import times against the tracked budget.")
+    parser.add_argument("--budget", default=DEFAULT_BUDGET, help="budget JSON file")
+    parser.add_argument("--repeat", type=int, default=3, help="fresh interpreters per import (fastest wins)")
+    parser.add_argument("--top", type=int, default=5, help="slowest modules listed per import")
+    parser.add_argument("--no-first-frame", action="store_true", help="skip launching main.py")
+    parser.add_argument("--timeout", type=float, default=60, help="seconds to wait for the first frame")
+    args = parser.parse_args(argv)
+
+    with open(args.budget) as file:
+        budget = json.load(file)
+    engine_modules = tuple(budget["engine_modules"])
+
+    failures = []
+    for module, limits in budget["imports"].items():
+        modules = measure_import(module, args.repeat)
+        total_ms = modules[module][1] / 1000
+        engine = sorted(name for name in modules if name.split(".")[0] in engine_modules)
+
+        status = "ok"
+        if total_ms > limits["max_ms"]:
+            status = "OVER BUDGET"
+            failures.append(f"{module}: {total_ms:.1f} ms > {limits['max_ms']} ms")
+        if limits["engine_free"] and engine:
+            status = "IMPORTS ENGINE"
+            failures.append(f"{module}: imports {', '.join(engine[:3])}")
+
+        print(f"{module:<28} {total_ms:8.1f} ms / {limits['max_ms']:>5} ms  {status}")
+        slowest = sorted(modules.items(), key=lambda item: item[1][0], reverse=True)[: args.top]
+        for name, (self_us, _) in slowest:
+            print(f"    {self_us / 1000:8.1f} ms  {name}")
+
+    if not args.no_first_frame:
+        try:
+            first_frame_ms = measure_first_frame(args.timeout)
+        except RuntimeError as e:
+            print(f"{'first frame':<28} skipped: {e}")
+        else:
+            status = "ok"
+            if first_frame_ms > budget["first_frame_ms"]:
+                status = "OVER BUDGET"
+                failures.append(f"first frame: {first_frame_ms:.0f} ms > {budget['first_frame_ms']} ms")
+            print(f"{'first frame':<28} {first_frame_ms:8.1f} ms / {budget['first_frame_ms']:>5} ms  {status}")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
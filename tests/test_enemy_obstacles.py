@@ -0,0 +1,58 @@
+"""The player body is stopped by enemy bodies in analytic collision mode."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+from domain.entities.enemy_swarm import EnemySwarm
+from domain.spatial import SpatialHashGrid
+
+PLAYER_RADIUS = 0.4
+PLAYER_HEIGHT = 2.0
+BODY_RADIUS = 0.5
+BODY_HEIGHT = 2.5
+
+
+def walk(swarm, x, z, step_x, steps=60):
+    """Step the player capsule along +X, resolving against the swarm each step."""
+    for _ in range(steps):
+        x, z = swarm.resolve_horizontal(x + step_x, z, 0.0, PLAYER_HEIGHT, PLAYER_RADIUS, BODY_RADIUS, BODY_HEIGHT)
+    return x, z
+
+
+@pytest.fixture
+def swarm():
+    swarm = EnemySwarm(grid=SpatialHashGrid(100))
+    swarm.spawn((5.0, 0.0, 0.0), speed=0.0, max_health=100)
+    return swarm
+
+
+def test_player_is_stopped_by_enemy(swarm):
+    x, z = walk(swarm, 0.0, 0.0, 0.1)
+
+    assert x == pytest.approx(5.0 - (PLAYER_RADIUS + BODY_RADIUS))
+    assert z == pytest.approx(0.0)
+
+
+def test_player_slides_around_enemy_off_centre(swarm):
+    x, z = walk(swarm, 0.0, 0.5, 0.1, steps=100)
+
+    assert x > 5.0
+    assert (x - 5.0) ** 2 + z**2 >= (PLAYER_RADIUS + BODY_RADIUS) ** 2 - 1e-9
+
+
+def test_dead_enemy_does_not_block(swarm):
+    swarm.health[0] = 0
+
+    x, _ = walk(swarm, 0.0, 0.0, 0.1)
+
+    assert x == pytest.approx(6.0)
+
+
+def test_enemy_below_feet_does_not_block(swarm):
+    x, _ = swarm.resolve_horizontal(4.8, 0.0, BODY_HEIGHT + 0.5, PLAYER_HEIGHT, PLAYER_RADIUS, BODY_RADIUS, BODY_HEIGHT)
+
+    assert x == pytest.approx(4.8)